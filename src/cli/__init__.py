@@ -0,0 +1,6 @@
+"""
+Command-line interface for Open ThermoKinetics.
+
+Runs the core analysis modules headless, for batch processing of many samples
+from a job file without the GUI.
+"""
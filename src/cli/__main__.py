@@ -0,0 +1,61 @@
+"""
+Command-line entry point for headless batch processing.
+
+Runs the deconvolution and kinetic analyses described by a job file for every
+sample without starting the GUI, see src.core.batch_runner.load_job for the layout.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from src.core.batch_runner import load_job, run_batch
+from src.core.logger_config import LoggerManager
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="ssk-batch", description="Run kinetic analyses for many samples headless.")
+    parser.add_argument("job", help="job file (.json, or .yaml/.yml with PyYAML installed)")
+    parser.add_argument("-o", "--output-dir", help="output directory, overrides the job setting")
+    parser.add_argument("-j", "--workers", type=int, help="parallel processes, overrides the job setting")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="WARNING", help="console log level")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run a batch job and return 1 if any sample failed, 2 if the job file is invalid."""
+    args = parse_args(argv)
+    console_level = getattr(logging, args.log_level)
+    LoggerManager.set_console_level(console_level)
+
+    try:
+        job = load_job(args.job)
+    except (OSError, ValueError) as e:
+        print(f"ssk-batch: {e}", file=sys.stderr)
+        return 2
+    if args.output_dir:
+        job["output_dir"] = os.path.abspath(args.output_dir)
+    if args.workers is not None and args.workers < 1:
+        print("ssk-batch: --workers must be at least 1", file=sys.stderr)
+        return 2
+
+    def report(summary: dict, done: int, total: int):
+        line = f"[{done}/{total}] {summary['sample']}: {summary['status']} ({summary.get('elapsed_s', 0.0):.1f} s)"
+        if summary.get("error"):
+            line += f" - {summary['error']}"
+        print(line, flush=True)
+
+    summaries = run_batch(job, workers=args.workers, console_level=console_level, on_sample_done=report)
+    failed = [summary["sample"] for summary in summaries if summary["status"] != "ok"]
+    print(f"Results written to {job['output_dir']}")
+    if failed:
+        print(f"Failed samples: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
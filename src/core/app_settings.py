@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +38,18 @@ class ModelFreeParameterBounds:
     alpha_max: float = 0.995
 
 
+@dataclass(frozen=True)
+class ModelFreeBootstrapConfig:
+    """Bootstrap settings for confidence bands of isoconversional Ea(α)."""
+
+    n_resamples: int = 200
+    confidence_level: float = 0.95
+    noise_scale: float = 1.0
+    smoothing_window: int = 5
+    workers: int = -1
+    seed: object = None
+
+
 @dataclass(frozen=True)
 class DeconvolutionParameterBounds:
     """Parameter bounds for deconvolution analysis."""
@@ -82,6 +95,69 @@ class ParameterBoundsConfig:
 
 PARAMETER_BOUNDS = ParameterBoundsConfig()
 
+MODEL_FREE_BOOTSTRAP_CONFIG = ModelFreeBootstrapConfig()
+
+
+@dataclass(frozen=True)
+class FileCacheConfig:
+    """Binary cache of parsed experiment files, reused while the source file is unchanged."""
+
+    enabled: bool = True
+    cache_dir: str = os.path.join(os.path.expanduser("~"), ".cache", "open_thermokinetics", "files")
+    # Least recently used entries are deleted once the directory grows past this size
+    max_bytes: int = 1024 * 1024 * 1024
+
+
+FILE_CACHE_CONFIG = FileCacheConfig()
+
+
+@dataclass(frozen=True)
+class FileStreamingConfig:
+    """Chunked loading of large instrument logs with on-the-fly block averaging."""
+
+    enabled: bool = True
+    threshold_bytes: int = 64 * 1024 * 1024
+    chunk_rows: int = 250_000
+    max_rows: int = 200_000
+
+
+FILE_STREAMING_CONFIG = FileStreamingConfig()
+
+
+@dataclass(frozen=True)
+class OptimizationProgressConfig:
+    """Live optimizer progress: workers publish best results, the GUI thread polls at a fixed rate."""
+
+    poll_interval_ms: int = 200
+    history_capacity: int = 2000
+
+
+OPTIMIZATION_PROGRESS_CONFIG = OptimizationProgressConfig()
+
+
+@dataclass(frozen=True)
+class SimulationCacheConfig:
+    """In-memory LRU cache of model-based simulation results, bounded by the size of the stored curves."""
+
+    enabled: bool = True
+    max_bytes: int = 64 * 1024 * 1024
+
+
+SIMULATION_CACHE_CONFIG = SimulationCacheConfig()
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    """Headless batch runs: samples are spread over processes, so every optimizer runs in a single process."""
+
+    max_workers: int | None = None  # None: one process per CPU
+    optimizer_workers: int = 1
+    summary_file: str = "summary.json"
+    summary_table: str = "summary.csv"
+
+
+BATCH_CONFIG = BatchConfig()
+
 
 class OperationType(Enum):
     ADD_REACTION = "add_reaction"
@@ -110,8 +186,11 @@ class OperationType(Enum):
     UPDATE_REACTIONS_PARAMS = "update_reactions_params"
     GET_VALUE = "get_value"
     SET_VALUE = "set_value"
+    GET_VALUES = "get_values"
+    SET_VALUES = "set_values"
     REMOVE_VALUE = "remove_value"
     GET_FULL_DATA = "get_full_data"
+    GET_SNAPSHOT = "get_snapshot"
     CHECK_OPERATION = "check_differential"
     GET_DF_DATA = "get_df_data"
     GET_ALL_DATA = "get_all_data"
@@ -127,6 +206,8 @@ class OperationType(Enum):
     PLOT_MODEL_FIT_RESULT = "plot_model_fit_result"
     PLOT_MODEL_FREE_RESULT = "plot_model_free_result"
     UPDATE_MODEL_BASED_BEST_VALUES = "update_model_based_best_values"
+    EXPORT_STATE = "export_state"
+    IMPORT_STATE = "import_state"
 
 
 @dataclass(frozen=True)
@@ -186,6 +267,12 @@ class ModelBasedDifferentialEvolutionConfig(DifferentialEvolutionConfig):
     disp: bool = True
     polish: bool = False
     updating: str = "immediate"
+    # "constraint": chain sums enforced by a NonlinearConstraint;
+    # "simplex": contributions normalized per chain inside the objective, DE runs unconstrained
+    contribution_parameterization: str = "constraint"
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), "contribution_parameterization": self.contribution_parameterization}
 
 
 @dataclass(frozen=True)
@@ -223,6 +310,7 @@ MODEL_FREE_METHODS = [
     "Vyazovkin",
     "master plots",
 ]
+MODEL_FREE_BOOTSTRAP_METHODS = ["linear approximation", "Friedman", "Vyazovkin"]
 
 MODEL_FIT_ANNOTATION_CONFIG = {
     "block_top": 0.98,
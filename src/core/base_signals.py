@@ -1,10 +1,90 @@
 import uuid
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
-from PyQt6.QtCore import QEventLoop, QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QEventLoop, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 
+from src.core.calculation_thread import CalculationThread
 from src.core.logger_config import logger
 
+REQUEST_LOG_KEYS = ("actor", "target", "operation", "request_id")
+
+
+def describe_request(params: dict) -> str:
+    """Short request summary for logging: routing fields plus the names of payload keys."""
+    routing = ", ".join(f"{key}={params.get(key)}" for key in REQUEST_LOG_KEYS if key in params)
+    payload = sorted(key for key in params if key not in REQUEST_LOG_KEYS)
+    return f"{routing}, payload={payload}"
+
+
+class RequestFuture:
+    """Handle for a non-blocking request issued with ``BaseSlots.request_async``.
+
+    Completed from the dispatcher thread when the response arrives. Done and
+    progress callbacks run in that thread; callbacks added after completion
+    run immediately. Cancelling marks the request so the handler can stop
+    early and makes any late response be ignored.
+    """
+
+    PENDING, DONE, CANCELLED = "pending", "done", "cancelled"
+
+    def __init__(self, request_id: str, target: str, operation: Any, signals: "BaseSignals"):
+        self.request_id = request_id
+        self.target = target
+        self.operation = operation
+        self.state = self.PENDING
+        self.progress: Any = None
+        self._result: Any = None
+        self._signals = signals
+        self._done_callbacks: List[Callable[["RequestFuture"], None]] = []
+        self._progress_callbacks: List[Callable[[Any], None]] = []
+
+    def done(self) -> bool:
+        return self.state != self.PENDING
+
+    def cancelled(self) -> bool:
+        return self.state == self.CANCELLED
+
+    def result(self) -> Any:
+        """Return response data; raises RuntimeError while pending or after cancel."""
+        if self.state != self.DONE:
+            raise RuntimeError(f"Request '{self.operation}' is {self.state}")
+        return self._result
+
+    def add_done_callback(self, callback: Callable[["RequestFuture"], None]) -> None:
+        if self.done():
+            callback(self)
+        else:
+            self._done_callbacks.append(callback)
+
+    def add_progress_callback(self, callback: Callable[[Any], None]) -> None:
+        self._progress_callbacks.append(callback)
+
+    def cancel(self) -> bool:
+        """Cancel the request if it is still pending."""
+        if self.done():
+            return False
+        self._signals.cancel_request(self.request_id)
+        self._finish(self.CANCELLED, None)
+        return True
+
+    def set_progress(self, progress: Any) -> None:
+        if self.done():
+            return
+        self.progress = progress
+        for callback in self._progress_callbacks:
+            callback(progress)
+
+    def set_result(self, result: Any) -> None:
+        if not self.done():
+            self._finish(self.DONE, result)
+
+    def _finish(self, state: str, result: Any) -> None:
+        self.state = state
+        self._result = result
+        callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            callback(self)
+
 
 class BaseSignals(QObject):
     """Central dispatcher for component communication via Qt signals.
@@ -12,6 +92,11 @@ class BaseSignals(QObject):
     Routes requests and responses between registered components using a
     publisher-subscriber pattern. Each component registers request/response
     handlers for loose coupling and centralized message routing.
+
+    When ``direct_dispatch`` is enabled and the caller, the target component and
+    the dispatcher share a thread, ``dispatch_direct`` invokes the target handler
+    in place and captures its response, skipping the signal round-trip and the
+    nested event loop. Cross-thread calls always go through the signals.
     """
 
     request_signal = pyqtSignal(dict)
@@ -20,6 +105,9 @@ class BaseSignals(QObject):
     def __init__(self):
         super().__init__()
         self.components: Dict[str, (Callable[[dict], None], Callable[[dict], None])] = {}
+        self.direct_dispatch = True
+        self._direct_responses: Dict[str, Optional[dict]] = {}
+        self.cancelled_requests: Set[str] = set()
         self.request_signal.connect(self.dispatch_request)
         self.response_signal.connect(self.dispatch_response)
 
@@ -39,6 +127,39 @@ class BaseSignals(QObject):
         self.components[component_name] = (process_request_method, process_response_method)
         logger.debug(f"Component '{component_name}' registered with dispatcher.")
 
+    def cancel_request(self, request_id: str) -> None:
+        """Mark request as cancelled; handlers poll ``is_cancelled`` from any thread."""
+        self.cancelled_requests.add(request_id)
+
+    def is_cancelled(self, request_id: str) -> bool:
+        return request_id in self.cancelled_requests
+
+    def can_dispatch_directly(self, target: str) -> bool:
+        """Check that target handler can run synchronously in the calling thread."""
+        if not self.direct_dispatch or target not in self.components:
+            return False
+        current_thread = QThread.currentThread()
+        if self.thread() is not current_thread:
+            return False
+        owner = getattr(self.components[target][0], "__self__", None)
+        # QObject.thread is called unbound: actors such as Calculations shadow it with a `thread` attribute
+        return not isinstance(owner, QObject) or QObject.thread(owner) is current_thread
+
+    def dispatch_direct(self, params: dict) -> Optional[dict]:
+        """Invoke target request handler in place and return its response.
+
+        Returns None when the handler did not answer synchronously; the late
+        response is then routed through ``response_signal`` as usual.
+        """
+        request_id = params["request_id"]
+        process_request_method, _ = self.components[params["target"]]
+        self._direct_responses[request_id] = None
+        try:
+            process_request_method(params)
+            return self._direct_responses[request_id]
+        finally:
+            del self._direct_responses[request_id]
+
     @pyqtSlot(dict)
     def dispatch_request(self, params: dict) -> None:
         """Route request to target component."""
@@ -52,6 +173,10 @@ class BaseSignals(QObject):
     @pyqtSlot(dict)
     def dispatch_response(self, params: dict) -> None:
         """Route response to target component."""
+        request_id = params.get("request_id")
+        if request_id in self._direct_responses:
+            self._direct_responses[request_id] = params
+            return
         target = params.get("target")
         if target in self.components:
             _, process_response_method = self.components[target]
@@ -66,6 +191,11 @@ class BaseSlots(QObject):
     Provides synchronous request/response operations over Qt's asynchronous
     signal system using QEventLoop blocking. Components inherit this class
     to participate in centralized message routing.
+
+    ``request_async`` is the non-blocking counterpart: it returns a
+    ``RequestFuture`` and never spins a nested event loop. Handlers that see
+    ``deferred_response`` in a request may finish the work on a worker thread
+    with ``respond_later`` and report intermediate state with ``report_progress``.
     """
 
     def __init__(self, actor_name: str, signals: BaseSignals):
@@ -76,6 +206,8 @@ class BaseSlots(QObject):
         self.signals = signals
         self.pending_requests: Dict[str, Dict[str, Any]] = {}
         self.event_loops: Dict[str, QEventLoop] = {}
+        self.pending_futures: Dict[str, RequestFuture] = {}
+        self._workers: List[CalculationThread] = []
         self.signals.register_component(self.actor_name, self.process_request, self.process_response)
 
     def connect_to_dispatcher(self) -> None:
@@ -89,7 +221,8 @@ class BaseSlots(QObject):
 
         Creates request, emits signal, blocks on QEventLoop until response
         received or timeout occurs. Used throughout codebase for component
-        communication.
+        communication. Same-thread targets are called directly through
+        ``BaseSignals.dispatch_direct`` without spinning an event loop.
 
         Args:
             target: Target component name
@@ -99,14 +232,97 @@ class BaseSlots(QObject):
         Returns:
             Response data or None if timeout/error
         """
-        request_id = self.create_and_emit_request(target, operation, **kwargs)
-        response_data = self.handle_response_data(request_id, operation)
+        if self.signals.direct_dispatch and self.signals.can_dispatch_directly(target):
+            request_id = str(uuid.uuid4())
+            response = self.signals.dispatch_direct(
+                {"actor": self.actor_name, "target": target, "operation": operation, "request_id": request_id, **kwargs}
+            )
+            if response is not None:
+                response_data = response.get("data")
+            else:
+                response_data = self.handle_response_data(request_id, operation)
+        else:
+            request_id = self.create_and_emit_request(target, operation, **kwargs)
+            response_data = self.handle_response_data(request_id, operation)
         if response_data is not None:
             return response_data
         else:
             logger.error(f"{self.actor_name}_handle_request_cycle: {operation} completed with None")
             return None
 
+    def request_async(
+        self,
+        target: str,
+        operation: str,
+        on_done: Optional[Callable[[RequestFuture], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ) -> RequestFuture:
+        """Send request without blocking and return a future for its response.
+
+        Args:
+            target: Target component name
+            operation: Operation type from OperationType enum
+            on_done: Called with the future once it is completed or cancelled
+            on_progress: Called with each progress value reported by the handler
+            **kwargs: Additional request parameters
+
+        Returns:
+            RequestFuture completed when the target responds
+        """
+        request_id = str(uuid.uuid4())
+        future = RequestFuture(request_id, target, operation, self.signals)
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        if on_progress is not None:
+            future.add_progress_callback(on_progress)
+        future.add_done_callback(lambda f: self.pending_futures.pop(f.request_id, None))
+        self.pending_futures[request_id] = future
+
+        request = {
+            "actor": self.actor_name,
+            "target": target,
+            "operation": operation,
+            "request_id": request_id,
+            "deferred_response": True,
+            **kwargs,
+        }
+        logger.debug(f"{self.actor_name} is emitting async request: {describe_request(request)}")
+        self.signals.request_signal.emit(request)
+        return future
+
+    def report_progress(self, request: dict, progress: Any) -> None:
+        """Send intermediate progress for a request; safe to call from worker threads."""
+        self.signals.response_signal.emit(
+            {
+                "actor": self.actor_name,
+                "target": request.get("actor"),
+                "operation": request.get("operation"),
+                "request_id": request.get("request_id"),
+                "partial": True,
+                "progress": progress,
+            }
+        )
+
+    def respond_later(self, response: dict, func: Callable, *args, **kwargs) -> None:
+        """Run func on a worker thread, then emit response (which func may fill in).
+
+        The response is delivered through ``response_signal``, which Qt queues to
+        the dispatcher thread. If func raises, the response data becomes
+        ``{"error": <message>}``.
+        """
+        self._workers = [worker for worker in self._workers if not worker.isFinished()]
+
+        def complete(result):
+            if isinstance(result, Exception):
+                response["data"] = {"error": str(result)}
+            self.signals.response_signal.emit(response)
+
+        worker = CalculationThread(func, *args, **kwargs)
+        worker.result_ready.connect(complete)
+        self._workers.append(worker)
+        worker.start()
+
     def create_and_emit_request(self, target: str, operation: str, **kwargs) -> str:
         """Create request with unique ID and emit signal."""
         request_id = str(uuid.uuid4())
@@ -118,7 +334,7 @@ class BaseSlots(QObject):
             "request_id": request_id,
             **kwargs,
         }
-        logger.debug(f"{self.actor_name} is emitting request: {request}")
+        logger.debug(f"{self.actor_name} is emitting request: {describe_request(request)}")
         self.signals.request_signal.emit(request)
         return request_id
 
@@ -135,14 +351,24 @@ class BaseSlots(QObject):
         """
         if params.get("target") != self.actor_name:
             return
-        logger.debug(f"{self.actor_name} will process response:\n{params=}")
+        logger.debug(f"{self.actor_name} will process response: {describe_request(params)}")
         request_id = params.get("request_id")
         operation = params.get("operation")
-        if request_id in self.pending_requests:
+        if request_id in self.pending_futures:
+            future = self.pending_futures[request_id]
+            if params.get("partial"):
+                future.set_progress(params.get("progress"))
+            else:
+                future.set_result(params.get("data"))
+        elif request_id in self.pending_requests:
             self.pending_requests[request_id]["data"] = params
             self.pending_requests[request_id]["received"] = True
             if request_id in self.event_loops:
                 self.event_loops[request_id].quit()
+        elif request_id in self.signals.cancelled_requests:
+            if not params.get("partial"):
+                self.signals.cancelled_requests.discard(request_id)
+            logger.debug(f"{self.actor_name} dropped response for cancelled request {request_id}")
         else:
             logger.error(f"{self.actor_name}_response_slot: unknown operation='{operation}' UUID: {request_id}")
 
@@ -0,0 +1,618 @@
+"""
+Headless batch runner for kinetic analyses.
+
+Every sample of a job runs on its own private BaseSignals bus with the same core actors
+as the GUI (FileData, SeriesData, CalculationsData, Calculations, ...). HeadlessSession
+takes the place of the main window and answers the requests the actors send to it, so
+no widgets and no display are needed. Samples are independent and run in separate processes.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer, pyqtSlot
+
+from src.core.app_settings import (
+    BATCH_CONFIG,
+    DECONVOLUTION_DIFFERENTIAL_EVOLUTION_DEFAULT_KWARGS,
+    MODEL_FIT_METHODS,
+    MODEL_FREE_METHODS,
+    OperationType,
+)
+from src.core.base_signals import BaseSignals, BaseSlots
+from src.core.calculation import Calculations
+from src.core.calculation_data import CalculationsData
+from src.core.calculation_data_operations import CalculationsDataOperations
+from src.core.file_data import FileData
+from src.core.file_operations import ActiveFileOperations
+from src.core.logger_config import LoggerManager, logger
+from src.core.model_fit_calculation import ModelFitCalculation
+from src.core.model_free_calculation import ModelFreeCalculation
+from src.core.project_file import PROJECT_FILE_EXTENSION, save_project
+from src.core.series_data import SeriesData, build_reaction_dataframe, build_series_dataframe, deconvolution_reactions
+
+try:
+    import yaml
+except ImportError:  # YAML job files are optional, JSON always works
+    yaml = None
+
+PROJECT_ACTORS = ("file_data", "series_data", "calculations_data", "calculations")
+
+_application: Optional[QCoreApplication] = None
+
+
+def load_job(path: str) -> dict:
+    """
+    Read a job description from a JSON or YAML (``.yaml``/``.yml``, needs the ``batch`` extra) file.
+
+    Relative file paths are resolved against the directory of the job file. Layout::
+
+        output_dir: results              # optional, default "<job name>_results" next to the job
+        workers: 8                       # optional, parallel processes
+        defaults: {...}                  # optional, deep-merged into every sample
+        samples:
+          - name: sample_01
+            files:
+              - {path: rate_3.csv, heating_rate: 3, mass: 1.0, delimiter: ",", skip_rows: 0, columns: null,
+                 reactions: rate_3_reactions.json}   # initial reactions exported from the GUI, or inline
+            deconvolution: {functions: {reaction_0: [gauss, ads]}, method_parameters: {maxiter: 200}}
+            model_free: [{fit_method: Friedman, alpha_min: 0.05}]
+            model_fit: [{fit_method: Coats-Redfern}]
+            model_based: {reaction_scheme: {components: [...], reactions: [...]}, method_parameters: {...}}
+            calculation_timeout_s: 3600  # optional limit per optimization
+
+    Raises:
+        ValueError: The file cannot be parsed or does not describe a valid job.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+        if yaml is None:
+            raise ValueError(
+                "Reading YAML job files requires PyYAML; install the 'batch' extra "
+                "(pip install 'solid-state-kinetics[batch]') or use a JSON job file."
+            )
+        try:
+            job = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in job file '{path}': {e}") from e
+    else:
+        try:
+            job = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in job file '{path}': {e}") from e
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    job = normalize_job(job, base_dir)
+    if not job.get("output_dir"):
+        job["output_dir"] = os.path.join(base_dir, f"{os.path.splitext(os.path.basename(path))[0]}_results")
+    return job
+
+
+def normalize_job(job: Any, base_dir: str = ".") -> dict:
+    """Validate a parsed job, merge defaults into samples and make file paths absolute."""
+    if not isinstance(job, dict) or not isinstance(job.get("samples"), list) or not job["samples"]:
+        raise ValueError("A job must be a mapping with a non-empty 'samples' list.")
+
+    defaults = job.get("defaults") or {}
+    samples, names = [], set()
+    for index, raw_sample in enumerate(job["samples"]):
+        if not isinstance(raw_sample, dict):
+            raise ValueError(f"Sample #{index} must be a mapping.")
+        sample = _merge(defaults, raw_sample)
+        name = str(sample.get("name") or f"sample_{index + 1}")
+        if name in names:
+            raise ValueError(f"Duplicate sample name '{name}'.")
+        names.add(name)
+        sample["name"] = name
+        sample["files"] = [_normalize_file(name, spec, base_dir) for spec in sample.get("files") or []]
+        if not sample["files"]:
+            raise ValueError(f"Sample '{name}' has no files.")
+        if len({os.path.basename(spec["path"]) for spec in sample["files"]}) != len(sample["files"]):
+            raise ValueError(f"Sample '{name}' lists files with the same name.")
+        if len({spec["heating_rate"] for spec in sample["files"]}) != len(sample["files"]):
+            raise ValueError(f"Sample '{name}' lists the same heating rate twice.")
+        _check_methods(name, "model_free", sample, MODEL_FREE_METHODS)
+        _check_methods(name, "model_fit", sample, MODEL_FIT_METHODS)
+        model_based = sample.get("model_based")
+        if model_based is not None and not (model_based.get("reaction_scheme") or {}).get("reactions"):
+            raise ValueError(f"Sample '{name}': model_based needs a reaction_scheme with reactions.")
+        samples.append(sample)
+
+    output_dir = job.get("output_dir")
+    return {
+        "output_dir": os.path.join(base_dir, output_dir) if output_dir else None,
+        "workers": job.get("workers", BATCH_CONFIG.max_workers),
+        "samples": samples,
+    }
+
+
+def _merge(defaults: dict, overrides: dict) -> dict:
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _normalize_file(sample_name: str, spec: Any, base_dir: str) -> dict:
+    if not isinstance(spec, dict) or "path" not in spec or "heating_rate" not in spec:
+        raise ValueError(f"Sample '{sample_name}': every file needs 'path' and 'heating_rate'.")
+    spec = {"mass": 1.0, "delimiter": ",", "skip_rows": 0, "columns": None, **spec}
+    spec["path"] = os.path.join(base_dir, spec["path"])
+    if isinstance(spec.get("reactions"), str):
+        spec["reactions"] = os.path.join(base_dir, spec["reactions"])
+    return spec
+
+
+def _check_methods(sample_name: str, key: str, sample: dict, known_methods: list) -> None:
+    specs = sample.get(key) or []
+    if isinstance(specs, dict):
+        specs = [specs]
+    for spec in specs:
+        if spec.get("fit_method") not in known_methods:
+            raise ValueError(f"Sample '{sample_name}': unknown {key} fit_method {spec.get('fit_method')!r}.")
+    sample[key] = specs
+
+
+def _ensure_application() -> QCoreApplication:
+    """Event loop for optimizer threads; QCoreApplication needs no display."""
+    global _application
+    _application = QCoreApplication.instance() or QCoreApplication([])
+    return _application
+
+
+class HeadlessSession(BaseSlots):
+    """
+    Stand-in for MainWindow that drives the core actors of one sample without widgets.
+
+    Registered as ``main_window`` on a private signal bus, it answers the file-name,
+    plotting and completion requests of the actors. Optimizations run on the
+    Calculations thread exactly as in the GUI; ``run_calculation`` spins a local
+    event loop until Calculations reports CALCULATION_FINISHED.
+    """
+
+    def __init__(self):
+        _ensure_application()
+        signals = BaseSignals()
+        super().__init__(actor_name="main_window", signals=signals)
+        self.file_data = FileData(signals=signals)
+        self.series_data = SeriesData(signals=signals)
+        self.calculations_data = CalculationsData(signals=signals)
+        self.calculations = Calculations(signals=signals)
+        self.calculations_data_operations = CalculationsDataOperations(signals=signals)
+        self.file_operations = ActiveFileOperations(signals=signals)
+        self.model_fit_calculation = ModelFitCalculation(signals=signals)
+        self.model_free_calculation = ModelFreeCalculation(signals=signals)
+        self.calculations_data_operations.deconvolution_signal.connect(self.calculations.run_calculation_scenario)
+
+        self.active_file: Optional[str] = None
+        self.model_based_best: Optional[dict] = None
+        self._calculation_loop: Optional[QEventLoop] = None
+
+    @pyqtSlot(dict)
+    def process_request(self, params: dict):
+        """Answer the requests core actors address to the main window."""
+        operation = params.get("operation")
+        response = params.copy()
+        if operation == OperationType.GET_FILE_NAME:
+            response["data"] = self.active_file
+        elif operation == OperationType.UPDATE_MODEL_BASED_BEST_VALUES:
+            self.model_based_best = {"mse": params.get("mse"), "best_values": params.get("best_values", [])}
+            response["data"] = True
+        elif operation == OperationType.CALCULATION_FINISHED:
+            if self._calculation_loop is not None:
+                self._calculation_loop.quit()
+            response["data"] = True
+        elif operation in (OperationType.PLOT_DF, OperationType.PLOT_MSE_LINE):
+            response["data"] = True
+        else:
+            logger.warning(f"{self.actor_name} received unknown operation '{operation}'")
+            response["data"] = {"success": False, "error": f"Unknown operation: {operation}"}
+
+        response["target"], response["actor"] = response["actor"], response["target"]
+        self.signals.response_signal.emit(response)
+
+    def run_calculation(self, start: Callable[[], None], timeout_s: Optional[float] = None) -> tuple[bool, bool]:
+        """
+        Start an optimization on the Calculations thread and wait for it to finish.
+
+        Returns:
+            tuple[bool, bool]: (started, timed_out). An optimization that exceeds
+                ``timeout_s`` is stopped and keeps its best result so far.
+        """
+        self._calculation_loop = QEventLoop()
+        start()
+        if not self.calculations.calculation_active:
+            self._calculation_loop = None
+            return False, False
+
+        timed_out = False
+        timer = QTimer()
+        timer.setSingleShot(True)
+        if timeout_s:
+
+            def stop():
+                nonlocal timed_out
+                timed_out = True
+                self.calculations.stop_calculation()
+
+            timer.timeout.connect(stop)
+            timer.start(int(timeout_s * 1000))
+        self._calculation_loop.exec()
+        timer.stop()
+        self._calculation_loop = None
+        if self.calculations.thread is not None:
+            self.calculations.thread.wait()
+        return True, timed_out
+
+    def last_best_mse(self) -> Optional[float]:
+        """Best MSE of the latest optimization, kept in the Calculations history until the next start."""
+        history = list(self.calculations.mse_history)
+        return float(history[-1][1]) if history else None
+
+    def load_file(self, spec: dict) -> str:
+        """Load one experiment file and return its name in FileData."""
+        file_name = os.path.basename(spec["path"])
+        self.file_data.load_file((spec["path"], spec["delimiter"], spec["skip_rows"], spec["columns"]))
+        if file_name not in self.file_data.original_data:
+            raise ValueError(f"Could not load file '{spec['path']}'.")
+        return file_name
+
+    def add_series(self, name: str, file_names: list[str], file_specs: list[dict]) -> None:
+        """Combine the loaded files into a series with one column per heating rate."""
+        df_copies = self.handle_request_cycle("file_data", OperationType.GET_ALL_DATA, file_name="all_files")
+        curves_by_rate = {str(spec["heating_rate"]): df_copies[file] for file, spec in zip(file_names, file_specs)}
+        is_ok = self.handle_request_cycle(
+            "series_data",
+            OperationType.ADD_NEW_SERIES,
+            experimental_masses=[spec["mass"] for spec in file_specs],
+            data=build_series_dataframe(curves_by_rate),
+            name=name,
+        )
+        if not is_ok:
+            raise ValueError(f"Could not create series '{name}'.")
+
+    def to_dtg(self, file_name: str) -> None:
+        """Apply the α(t) and DTG transformations the deconvolution works on."""
+        for operation in (OperationType.TO_A_T, OperationType.TO_DTG):
+            function = self.handle_request_cycle("active_file_operations", operation)
+            if not self.handle_request_cycle("file_data", operation, file_name=file_name, function=function):
+                raise ValueError(f"Could not apply {operation.name} to '{file_name}'.")
+
+    def set_reactions(self, file_name: str, reactions: Any) -> dict:
+        """Store initial reactions from an exported reactions file or an inline mapping."""
+        if isinstance(reactions, str):
+            data = self.handle_request_cycle(
+                "calculations_data", OperationType.IMPORT_REACTIONS, import_file_name=reactions, file_name=file_name
+            )
+            if not data:
+                raise ValueError(f"Could not read reactions file '{reactions}'.")
+            return data
+
+        df = self.handle_request_cycle("file_data", OperationType.GET_DF_DATA, file_name=file_name)
+        data = {}
+        for reaction_name, reaction in reactions.items():
+            coeffs = dict(reaction.get("coeffs", {}))
+            data[reaction_name] = {
+                "function": reaction.get("function", "gauss"),
+                "x": df["temperature"].to_numpy(),
+                "coeffs": coeffs,
+                "upper_bound_coeffs": {**coeffs, **reaction.get("upper_bound_coeffs", {})},
+                "lower_bound_coeffs": {**coeffs, **reaction.get("lower_bound_coeffs", {})},
+            }
+        self.handle_request_cycle("calculations_data", OperationType.SET_VALUE, path_keys=[file_name], value=data)
+        return data
+
+    def deconvolve(self, file_name: str, settings: dict, timeout_s: Optional[float]) -> dict:
+        """Run the deconvolution of one file and return its optimized reactions with the final MSE."""
+        reactions = self.handle_request_cycle("calculations_data", OperationType.GET_VALUE, path_keys=[file_name])
+        functions = settings.get("functions") or {}
+        chosen_functions = {name: functions.get(name, [reaction["function"]]) for name, reaction in reactions.items()}
+        deconvolution_settings = {
+            "method": "differential_evolution",
+            "method_parameters": {
+                **DECONVOLUTION_DIFFERENTIAL_EVOLUTION_DEFAULT_KWARGS,
+                **settings.get("method_parameters", {}),
+            },
+        }
+
+        self.active_file = file_name
+        started, timed_out = self.run_calculation(
+            lambda: self.handle_request_cycle(
+                "calculations_data_operations",
+                OperationType.DECONVOLUTION,
+                path_keys=[file_name],
+                chosen_functions=chosen_functions,
+                deconvolution_settings=deconvolution_settings,
+            ),
+            timeout_s,
+        )
+        if not started:
+            raise RuntimeError(f"Deconvolution of '{file_name}' could not be started.")
+        return {
+            "reactions": self.handle_request_cycle("calculations_data", OperationType.GET_VALUE, path_keys=[file_name]),
+            "mse": self.last_best_mse(),
+            "timed_out": timed_out,
+        }
+
+    def reaction_data(self, series_name: str) -> dict:
+        """Per-reaction curves of all heating rates, as used by model-free and model-fit analysis."""
+        series_entry = self.handle_request_cycle(
+            "series_data", OperationType.GET_SERIES, series_name=series_name, info_type="all"
+        )
+        experimental_df = series_entry.get("experimental_data")
+        deconvolution_results = series_entry.get("deconvolution_results", {})
+        if not deconvolution_results:
+            raise ValueError(f"Series '{series_name}' has no deconvolution results.")
+        reactions, _ = deconvolution_reactions(experimental_df, deconvolution_results)
+        return {
+            reaction: build_reaction_dataframe(experimental_df, deconvolution_results, reaction)
+            for reaction in reactions
+        }
+
+    def run_analysis(self, series_name: str, kind: str, spec: dict) -> dict:
+        """Run one model-free or model-fit method and store its results in the series."""
+        operation, target = {
+            "model_free": (OperationType.MODEL_FREE_CALCULATION, "model_free_calculation"),
+            "model_fit": (OperationType.MODEL_FIT_CALCULATION, "model_fit_calculation"),
+        }[kind]
+        params = {**spec, "reaction_data": self.reaction_data(series_name)}
+        if kind == "model_free" and spec.get("bootstrap") is not None:
+            # Samples already run in parallel processes; resampling must not fan out again
+            params["bootstrap"] = {**spec["bootstrap"], "workers": BATCH_CONFIG.optimizer_workers}
+        results = self.handle_request_cycle(target, operation, calculation_params=params)
+        if not results:
+            raise ValueError(f"{kind} '{spec['fit_method']}' produced no results for series '{series_name}'.")
+        self.handle_request_cycle(
+            "series_data",
+            OperationType.UPDATE_SERIES,
+            series_name=series_name,
+            update_data={f"{kind}_results": {spec["fit_method"]: results}},
+        )
+        return results
+
+    def run_model_based(self, series_name: str, spec: dict, timeout_s: Optional[float]) -> dict:
+        """Fit the reaction scheme to the series and write the best parameters back into it."""
+        series_entry = self.handle_request_cycle(
+            "series_data", OperationType.GET_SERIES, series_name=series_name, info_type="all"
+        )
+        method_parameters = {
+            **series_entry["calculation_settings"]["method_parameters"],
+            "workers": BATCH_CONFIG.optimizer_workers,
+            "disp": False,
+            **spec.get("method_parameters", {}),
+        }
+        self.handle_request_cycle(
+            "series_data",
+            OperationType.SCHEME_CHANGE,
+            series_name=series_name,
+            reaction_scheme=spec["reaction_scheme"],
+            calculation_settings={"method": "differential_evolution", "method_parameters": method_parameters},
+        )
+        series_entry = self.handle_request_cycle(
+            "series_data", OperationType.GET_SERIES, series_name=series_name, info_type="all"
+        )
+        params = {
+            "calculation_scenario": "model_based_calculation",
+            "reaction_scheme": series_entry.get("reaction_scheme"),
+            "experimental_data": series_entry.get("experimental_data"),
+            "experimental_arrays": series_entry.get("experimental_arrays"),
+            "calculation_settings": series_entry.get("calculation_settings"),
+        }
+
+        self.model_based_best = None
+        started, timed_out = self.run_calculation(lambda: self.calculations.run_calculation_scenario(params), timeout_s)
+        if not started:
+            raise RuntimeError(f"Model-based calculation of '{series_name}' could not be started.")
+        if self.model_based_best is None:
+            raise RuntimeError(
+                f"Model-based calculation of '{series_name}' found no valid parameters; "
+                "every candidate violated the contribution constraint or failed to integrate."
+            )
+
+        reactions = [dict(reaction) for reaction in params["reaction_scheme"]["reactions"]]
+        for entry in self.model_based_best["best_values"]:
+            reaction = reactions[entry["reaction_index"]]
+            reaction.update(Ea=entry["Ea"], log_A=entry["logA"], contribution=entry["contribution"])
+            if entry.get("model"):
+                reaction["reaction_type"] = entry["model"]
+        result = {**self.model_based_best, "timed_out": timed_out}
+        self.handle_request_cycle(
+            "series_data",
+            OperationType.UPDATE_SERIES,
+            series_name=series_name,
+            update_data={"reaction_scheme": {"reactions": reactions}, "model_based_results": result},
+        )
+        return result
+
+    def save_project(self, path: str) -> None:
+        state = {actor: self.handle_request_cycle(actor, OperationType.EXPORT_STATE) for actor in PROJECT_ACTORS}
+        save_project(path, state)
+
+    def close(self) -> None:
+        """Stop a running optimization and release the optimizer's manager process."""
+        self.calculations.stop_calculation()
+        if self.calculations.thread is not None:
+            self.calculations.thread.wait()
+        self.calculations.manager.shutdown()
+
+
+def run_sample(sample: dict, output_dir: str) -> dict:
+    """
+    Process one normalized sample and write its project file and result tables.
+
+    Never raises: a failing step ends the sample with status "failed", and
+    whatever was computed up to that point is still saved.
+
+    Returns:
+        dict: JSON-serializable summary, also written to ``summary.json`` of the sample.
+    """
+    name = sample["name"]
+    sample_dir = os.path.join(output_dir, _safe_file_name(name))
+    os.makedirs(sample_dir, exist_ok=True)
+    summary = {"sample": name, "status": "ok", "error": None, "output_dir": sample_dir}
+    started_at = time.perf_counter()
+    timeout_s = sample.get("calculation_timeout_s")
+    session = HeadlessSession()
+    try:
+        file_names = [session.load_file(spec) for spec in sample["files"]]
+        session.add_series(name, file_names, sample["files"])
+
+        deconvolution_results = {}
+        for file_name, spec in zip(file_names, sample["files"]):
+            if not spec.get("reactions"):
+                continue
+            session.to_dtg(file_name)
+            reactions = session.set_reactions(file_name, spec["reactions"])
+            if sample.get("deconvolution") is not None:
+                result = session.deconvolve(file_name, sample["deconvolution"], timeout_s)
+                reactions = result["reactions"]
+                summary.setdefault("deconvolution", {})[str(spec["heating_rate"])] = {
+                    "mse": result["mse"],
+                    "timed_out": result["timed_out"],
+                }
+            deconvolution_results[str(spec["heating_rate"])] = reactions
+        if deconvolution_results:
+            session.handle_request_cycle(
+                "series_data",
+                OperationType.UPDATE_SERIES,
+                series_name=name,
+                update_data={"deconvolution_results": deconvolution_results},
+            )
+
+        for kind in ("model_free", "model_fit"):
+            for spec in sample.get(kind, []):
+                results = session.run_analysis(name, kind, spec)
+                write_result_tables(results, os.path.join(sample_dir, kind, _safe_file_name(spec["fit_method"])))
+                summary.setdefault(kind, []).append(spec["fit_method"])
+
+        if sample.get("model_based") is not None:
+            summary["model_based"] = session.run_model_based(name, sample["model_based"], timeout_s)
+    except Exception as e:
+        logger.error(f"Batch sample '{name}' failed: {e}")
+        summary.update(status="failed", error=f"{type(e).__name__}: {e}")
+    finally:
+        try:
+            session.save_project(os.path.join(sample_dir, _safe_file_name(name) + PROJECT_FILE_EXTENSION))
+        except Exception as e:
+            logger.error(f"Could not save project of batch sample '{name}': {e}")
+        session.close()
+
+    summary["elapsed_s"] = round(time.perf_counter() - started_at, 3)
+    summary = _to_json(summary)
+    with open(os.path.join(sample_dir, BATCH_CONFIG.summary_file), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def write_result_tables(results: Any, directory: str) -> None:
+    """Write every DataFrame of a nested result mapping to ``directory/<key>_<key>....csv``."""
+
+    def walk(value, keys):
+        if isinstance(value, pd.DataFrame):
+            os.makedirs(directory, exist_ok=True)
+            value.to_csv(os.path.join(directory, _safe_file_name("_".join(keys) or "result") + ".csv"), index=False)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                walk(item, [*keys, str(key)])
+
+    walk(results, [])
+
+
+def _safe_file_name(name: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in str(name))
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _init_worker(console_level: int) -> None:
+    LoggerManager.set_console_level(console_level)
+
+
+def run_batch(
+    job: dict,
+    workers: Optional[int] = None,
+    console_level: int = logging.WARNING,
+    on_sample_done: Optional[Callable[[dict, int, int], None]] = None,
+) -> list[dict]:
+    """
+    Run all samples of a normalized job and write the per-sample summaries to one table.
+
+    With more than one worker, samples run in separate spawned processes; every
+    process runs its optimizers single-process (``BATCH_CONFIG.optimizer_workers``).
+
+    Args:
+        job: Job from ``load_job`` or ``normalize_job`` with ``output_dir`` set.
+        workers: Parallel processes; defaults to the job setting, then to the CPU count.
+        console_level: Console log level inside worker processes.
+        on_sample_done: Called with (summary, finished count, total) as samples finish.
+
+    Returns:
+        list[dict]: Sample summaries in job order.
+    """
+    output_dir = job["output_dir"]
+    os.makedirs(output_dir, exist_ok=True)
+    samples = job["samples"]
+    workers = min(workers or job.get("workers") or os.cpu_count() or 1, len(samples))
+
+    summaries: dict[str, dict] = {}
+
+    def finish(summary: dict):
+        summaries[summary["sample"]] = summary
+        if on_sample_done is not None:
+            on_sample_done(summary, len(summaries), len(samples))
+
+    if workers == 1:
+        for sample in samples:
+            finish(run_sample(sample, output_dir))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn"), initializer=_init_worker, initargs=(console_level,)
+        ) as executor:
+            futures = {executor.submit(run_sample, sample, output_dir): sample["name"] for sample in samples}
+            for future in as_completed(futures):
+                try:
+                    finish(future.result())
+                except Exception as e:
+                    # Only a crashed worker process gets here; run_sample itself does not raise
+                    finish({"sample": futures[future], "status": "failed", "error": f"{type(e).__name__}: {e}"})
+
+    ordered = [summaries[sample["name"]] for sample in samples]
+    write_summary_table(ordered, os.path.join(output_dir, BATCH_CONFIG.summary_table))
+    return ordered
+
+
+def write_summary_table(summaries: list[dict], path: str) -> None:
+    """One row per sample with status, run time, final MSEs and the error message."""
+    rows = []
+    for summary in summaries:
+        row = {
+            "sample": summary["sample"],
+            "status": summary["status"],
+            "elapsed_s": summary.get("elapsed_s"),
+            "model_based_mse": (summary.get("model_based") or {}).get("mse"),
+        }
+        for rate, result in (summary.get("deconvolution") or {}).items():
+            row[f"deconvolution_mse_{rate}"] = result.get("mse")
+        row["error"] = summary.get("error")
+        rows.append(row)
+    pd.DataFrame(rows).to_csv(path, index=False)
@@ -3,20 +3,21 @@ from typing import Callable, Optional
 
 import numpy as np
 import optuna
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QTimer, pyqtSlot
 from scipy.optimize import OptimizeResult, differential_evolution
 
-from src.core.app_settings import OperationType
+from src.core.app_settings import OPTIMIZATION_PROGRESS_CONFIG, OperationType
 from src.core.base_signals import BaseSlots
 from src.core.calculation_results_strategies import (
     BestResultStrategy,
     DeconvolutionStrategy,
     ModelBasedCalculationStrategy,
 )
-from src.core.calculation_scenarios import SCENARIO_REGISTRY, make_de_callback
+from src.core.calculation_scenarios import SCENARIO_REGISTRY, BaseCalculationScenario, make_de_callback
 from src.core.calculation_thread import CalculationThread
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
+from src.core.optimization_progress import BestResultSlot, MseHistory
 
 
 class Calculations(BaseSlots):
@@ -26,9 +27,14 @@ class Calculations(BaseSlots):
     Provides threaded optimization calculations for deconvolution and model-based
     analysis using scipy's differential evolution algorithm. Implements strategy
     pattern for result processing and maintains MSE history for optimization tracking.
-    """
 
-    new_best_result = pyqtSignal(dict)
+    Optimizer threads publish best-so-far results into the ``progress`` slot,
+    which records every improvement in ``mse_history`` as it is offered; a
+    GUI-thread timer drains the slot at ``OPTIMIZATION_PROGRESS_CONFIG.poll_interval_ms``,
+    so result handling cost does not slow down the solver. Best-so-far MSE and
+    per-generation population statistics are kept in bounded ``MseHistory``
+    buffers and replotted at most once per poll.
+    """
 
     def __init__(self, signals):
         """Initialize calculation manager with strategy instances and threading."""
@@ -36,9 +42,14 @@ class Calculations(BaseSlots):
         self.thread: Optional[CalculationThread] = None
         self.best_combination: Optional[tuple] = None
         self.best_mse: float = float("inf")
-        self.new_best_result.connect(self.handle_new_best_result)
+        self.mse_history = MseHistory()
+        self.progress = BestResultSlot(history=self.mse_history)
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(OPTIMIZATION_PROGRESS_CONFIG.poll_interval_ms)
+        self.progress_timer.timeout.connect(self.poll_progress)
         self.calc_params = {}
-        self.mse_history = []
+        self.population_history = MseHistory()
+        self._plotted_history_versions = (0, 0)
         self.calculation_active = False
 
         self.manager = Manager()
@@ -47,6 +58,7 @@ class Calculations(BaseSlots):
         self.deconvolution_strategy = DeconvolutionStrategy(self)
         self.model_based_calculation_strategy = ModelBasedCalculationStrategy(self)
         self.result_strategy: Optional[BestResultStrategy] = None
+        self.scenario: Optional[BaseCalculationScenario] = None
 
     def set_result_strategy(self, strategy_type: str):
         """Configure result handling strategy for current calculation type."""
@@ -60,6 +72,8 @@ class Calculations(BaseSlots):
     def start_calculation_thread(self, func: Callable, *args, **kwargs) -> None:
         """Start calculation in background thread with result handling."""
         self.stop_event.clear()
+        self.progress.reset()
+        self.progress_timer.start()
         self.calculation_active = True
         self.thread = CalculationThread(func, *args, **kwargs)
         self.thread.result_ready.connect(self._calculation_finished)
@@ -81,11 +95,25 @@ class Calculations(BaseSlots):
 
     @pyqtSlot(dict)
     def process_request(self, params: dict):
-        """Handle stop calculation requests from other components."""
+        """Handle stop calculation and optimizer state requests from other components."""
         operation = params.get("operation")
         response = params.copy()
         if operation == OperationType.STOP_CALCULATION:
             response["data"] = self.stop_calculation()
+        elif operation == OperationType.EXPORT_STATE:
+            response["data"] = {
+                "best_mse": self.best_mse,
+                "best_combination": self.best_combination,
+                "mse_history": list(self.mse_history),
+            }
+        elif operation == OperationType.IMPORT_STATE:
+            state = params.get("state", {})
+            self.best_mse = state.get("best_mse", float("inf"))
+            self.best_combination = state.get("best_combination")
+            self.mse_history.clear()
+            for entry in state.get("mse_history", []):
+                self.mse_history.append(entry)
+            response["data"] = True
 
         response["target"], response["actor"] = response["actor"], response["target"]
         self.signals.response_signal.emit(response)
@@ -110,8 +138,8 @@ class Calculations(BaseSlots):
             logger.error(f"Unknown calculation scenario: {scenario_key}")
             return
 
-        scenario_instance = scenario_cls(params, self)
         try:
+            scenario_instance = scenario_cls(params, self)
             bounds = scenario_instance.get_bounds()
             for lb, ub in bounds:
                 if ub < lb:
@@ -123,12 +151,17 @@ class Calculations(BaseSlots):
             strategy_type = scenario_instance.get_result_strategy_type()
 
             self.set_result_strategy(strategy_type)
+            self.scenario = scenario_instance
 
             if optimization_method == "differential_evolution":
                 calc_params = params.get("calculation_settings", {}).get("method_parameters", {}).copy()
 
                 if scenario_key == "model_based_calculation":
+                    calc_params.pop("contribution_parameterization", None)
                     calc_params["constraints"] = scenario_instance.get_constraints()
+                    if not calc_params["constraints"]:
+                        # Without constraints every worker can evaluate whole generations
+                        calc_params["updating"] = "deferred"
                     calc_params["callback"] = make_de_callback(target_function, self)
 
                 logger.debug("Differential evolution parameters before execution:")
@@ -146,7 +179,8 @@ class Calculations(BaseSlots):
     def start_differential_evolution(self, bounds, target_function, **kwargs):
         """Initialize and start differential evolution optimization."""
         # Clear MSE history at the start of new calculation
-        self.mse_history = []
+        self.mse_history.clear()
+        self.population_history.clear()
         self.best_mse = float("inf")
         logger.debug("Starting new differential evolution calculation - cleared MSE history")
 
@@ -163,7 +197,8 @@ class Calculations(BaseSlots):
             logger.error("Optuna is not installed. Please install optuna to use this optimization method.")
             console.log("Optuna is not installed. Please install optuna to use this optimization method.")
             return
-        self.mse_history = []
+        self.mse_history.clear()
+        self.population_history.clear()
         self.best_mse = float("inf")
         logger.debug("Starting new Optuna optimization - cleared MSE history")
 
@@ -188,7 +223,7 @@ class Calculations(BaseSlots):
                 if self.result_strategy == self.deconvolution_strategy:
                     result["best_combination"] = best_combination
                     result["reaction_variables"] = reaction_variables
-                self.handle_new_best_result(result)
+                self.progress.offer(result)
 
         def run_study():
             # print("[DIAG] run_study started")
@@ -200,7 +235,7 @@ class Calculations(BaseSlots):
                 if self.result_strategy == self.deconvolution_strategy:
                     result["best_combination"] = best_combination
                     result["reaction_variables"] = reaction_variables
-                self.handle_new_best_result(result)
+                self.progress.offer(result)
                 return {"x": best_params, "fun": study.best_value}
             except Exception:
                 # print(f"[DIAG] Exception in run_study: {e}")
@@ -211,6 +246,9 @@ class Calculations(BaseSlots):
     @pyqtSlot(object)
     def _calculation_finished(self, result):
         """Handle calculation completion and reset state."""
+        self.progress_timer.stop()
+        # Deliver the last best result published after the final poll
+        self.poll_progress()
         try:
             if isinstance(result, Exception):
                 if str(result) == "array must not contain infs or NaNs":
@@ -218,7 +256,8 @@ class Calculations(BaseSlots):
                 else:
                     logger.error(f"Calculation error: {result}")
             elif isinstance(result, OptimizeResult):
-                x = result.x
+                x = result.x if self.scenario is None else self.scenario.map_solution(result.x)
+                result.x = x
                 fun = result.fun
                 logger.info(f"Calculation completed. Optimal parameters: {x}, fun={fun}")
                 console.log(f"Calculation completed. Optimal parameters: {x}, fun={fun}")
@@ -233,11 +272,32 @@ class Calculations(BaseSlots):
 
         self.calculation_active = False
         self.result_strategy = None
+        self.scenario = None
         self.best_mse = float("inf")
         self.best_combination = None
         # Keep mse_history for display - it will be cleared on next calculation start
         self.handle_request_cycle("main_window", OperationType.CALCULATION_FINISHED)
 
+    @pyqtSlot()
+    def poll_progress(self):
+        """
+        Hand the latest best result published by the optimizer, if any, to the result strategy
+        and replot the convergence histories when they changed since the previous poll.
+        """
+        result = self.progress.take()
+        if result is not None:
+            self.handle_new_best_result(result)
+
+        versions = (self.mse_history.version, self.population_history.version)
+        if versions != self._plotted_history_versions:
+            self._plotted_history_versions = versions
+            self.handle_request_cycle(
+                "main_window",
+                OperationType.PLOT_MSE_LINE,
+                mse_data=self.mse_history,
+                population_data=self.population_history,
+            )
+
     @pyqtSlot(dict)
     def handle_new_best_result(self, result: dict):
         """Process new best optimization results using configured strategy."""
@@ -1,14 +1,14 @@
 import json
-from functools import reduce
 from typing import Any, Dict, List
 
-import numpy as np
 from PyQt6.QtCore import pyqtSignal
 
 from src.core.app_settings import OperationType
 from src.core.base_signals import BaseSlots
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
+from src.core.parameter_store import ParameterSnapshot, ParameterStore
+from src.core.reaction_file import read_reactions_file
 
 
 class CalculationsData(BaseSlots):
@@ -17,19 +17,24 @@ class CalculationsData(BaseSlots):
     Manages hierarchical storage of reaction data using path_keys system for nested access.
     Provides CRUD operations, import/export functionality, and automatic persistence.
     Used extensively for deconvolution parameters, function coefficients, and optimization bounds.
+
+    Values live in a flat path-indexed ``ParameterStore``; nested dicts are only built
+    on read, so callers never share mutable state with the store. After every mutating
+    request ``dataChanged`` is emitted with the new version and the set of dirty paths.
     """
 
     dataChanged = pyqtSignal(dict)
 
     def __init__(self, signals):
         super().__init__(actor_name="calculations_data", signals=signals)
-        self._data: Dict[str, Any] = {}
+        self._store = ParameterStore()
         self._filename: str = ""
 
     def load_reactions(self, load_file_name: str, file_name: str) -> Dict[str, Any]:
         """Load and import reaction configurations from JSON file.
 
-        Automatically converts serialized numpy arrays back to proper format and stores
+        Reads both packed and legacy per-reaction ``x`` list layouts (see
+        ``src.core.reaction_file``), converts arrays to numpy and stores
         under the specified file_name key. Used for importing pre-configured reactions
         with all parameters, bounds, and function types preserved.
 
@@ -41,17 +46,11 @@ class CalculationsData(BaseSlots):
             Dict[str, Any]: The loaded reaction data if successful, otherwise empty dict.
         """
         try:
-            with open(load_file_name, "r", encoding="utf-8") as file:
-                data = json.load(file)
-
-            for reaction_key, reaction_data in data.items():
-                if "x" in reaction_data:
-                    reaction_data["x"] = np.array(reaction_data["x"])
-
+            data = read_reactions_file(load_file_name)
             self.set_value([file_name], data)
             console.log(f"Data successfully imported from file:\n\n{load_file_name}")
             return data
-        except IOError as e:
+        except (IOError, ValueError) as e:
             logger.error(f"{e}")
             return {}
 
@@ -59,7 +58,7 @@ class CalculationsData(BaseSlots):
         """Save current data to JSON file."""
         try:
             with open(self._filename, "w") as file:
-                json.dump(self._data, file, indent=4)
+                json.dump(self._store.get(()), file, indent=4)
         except IOError as e:
             logger.error(f"{e}")
 
@@ -76,7 +75,7 @@ class CalculationsData(BaseSlots):
         Returns:
             Dict[str, Any]: Retrieved data or empty dict if path not found.
         """
-        return reduce(lambda data, key: data.get(key, {}), keys, self._data)
+        return self._store.get(keys)
 
     def set_value(self, keys: List[str], value: Any) -> None:
         """Store value at specified path_keys location.
@@ -88,40 +87,43 @@ class CalculationsData(BaseSlots):
             keys (List[str]): List of keys defining the nested storage path.
             value (Any): Value to store at the specified location.
         """
-        if not keys:
-            return
-        last_key = keys.pop()
-        nested_dict = reduce(lambda data, key: data.setdefault(key, {}), keys, self._data)
-        nested_dict[last_key] = value
+        self._store.set(keys, value)
 
     def exists(self, keys: List[str]) -> bool:
         """Check if path exists in the hierarchical data structure."""
-        try:
-            _ = reduce(lambda data, key: data[key], keys, self._data)
-            return True
-        except KeyError:
-            return False
+        return self._store.exists(keys)
 
     def remove_value(self, keys: List[str]) -> None:
         """Delete value from specified path_keys location."""
-        if not keys:
-            return
-        if self.exists(keys):
-            last_key = keys.pop()
-            parent_dict = reduce(lambda data, key: data.get(key, {}), keys, self._data)
-            if last_key in parent_dict:
-                del parent_dict[last_key]
-                logger.debug({"operation": "remove_reaction", "keys": keys + [last_key]})
-
-    def process_request(self, params: dict) -> None:
+        if self._store.remove(keys):
+            logger.debug({"operation": "remove_reaction", "keys": keys})
+
+    def snapshot(self) -> ParameterSnapshot:
+        """Return immutable snapshot of all parameters, reused until the next change."""
+        return self._store.snapshot()
+
+    def _emit_changes(self) -> None:
+        """Notify listeners about paths changed since the previous notification."""
+        dirty_paths = self._store.take_dirty()
+        if dirty_paths:
+            self.dataChanged.emit({"version": self._store.version, "dirty_paths": dirty_paths})
+
+    @staticmethod
+    def _is_valid_path(path_keys: Any) -> bool:
+        return isinstance(path_keys, list) and all(isinstance(k, str) for k in path_keys)
+
+    def process_request(self, params: dict) -> None:  # noqa: C901
         """Handle incoming data operation requests through signal-slot system.
 
         Processes various operations including GET_VALUE, SET_VALUE, REMOVE_VALUE,
-        IMPORT_REACTIONS, and GET_FULL_DATA. Validates parameters and emits responses
-        back through the centralized signal system.
+        IMPORT_REACTIONS, GET_FULL_DATA and GET_SNAPSHOT. Validates parameters and emits responses
+        back through the centralized signal system. GET_VALUES and SET_VALUES handle many
+        paths in one request, so a batch of updates costs a single round-trip and a single
+        dataChanged notification.
 
         Args:
             params (dict): Request parameters containing 'operation', 'path_keys', 'value', etc.
+                Batch operations use 'paths' (list of path_keys) and, for SET_VALUES, 'values'.
         """
         operation = params.get("operation")
         actor = params.get("actor")
@@ -129,7 +131,7 @@ class CalculationsData(BaseSlots):
 
         if operation == OperationType.GET_VALUE:
             path_keys = params.get("path_keys", [])
-            if not isinstance(path_keys, list) or any(not isinstance(k, str) for k in path_keys):
+            if not self._is_valid_path(path_keys):
                 logger.error("Invalid path_keys provided for get_value.")
                 params["data"] = {}
             else:
@@ -138,16 +140,40 @@ class CalculationsData(BaseSlots):
         elif operation == OperationType.SET_VALUE:
             path_keys = params.get("path_keys", [])
             value = params.get("value")
-            if not isinstance(path_keys, list) or any(not isinstance(k, str) for k in path_keys):
+            if not self._is_valid_path(path_keys):
                 logger.error("Invalid path_keys provided for set_value.")
                 params["data"] = False
             else:
                 self.set_value(path_keys, value)
                 params["data"] = True
 
+        elif operation == OperationType.GET_VALUES:
+            paths = params.get("paths", [])
+            if not isinstance(paths, list) or not all(self._is_valid_path(p) for p in paths):
+                logger.error("Invalid paths provided for get_values.")
+                params["data"] = []
+            else:
+                params["data"] = [self.get_value(p) for p in paths]
+
+        elif operation == OperationType.SET_VALUES:
+            paths = params.get("paths", [])
+            values = params.get("values", [])
+            if (
+                not isinstance(paths, list)
+                or not all(self._is_valid_path(p) for p in paths)
+                or not isinstance(values, list)
+                or len(paths) != len(values)
+            ):
+                logger.error("Invalid paths or values provided for set_values.")
+                params["data"] = False
+            else:
+                for path_keys, value in zip(paths, values):
+                    self.set_value(path_keys, value)
+                params["data"] = True
+
         elif operation == OperationType.REMOVE_VALUE:
             path_keys = params.get("path_keys", [])
-            if not isinstance(path_keys, list) or any(not isinstance(k, str) for k in path_keys):
+            if not self._is_valid_path(path_keys):
                 logger.error("Invalid path_keys provided for remove_value.")
                 params["data"] = False
             else:
@@ -164,12 +190,26 @@ class CalculationsData(BaseSlots):
                 params["data"] = None
 
         elif operation == OperationType.GET_FULL_DATA:
-            params["data"] = self._data.copy()
+            params["data"] = self._store.get(())
+
+        elif operation == OperationType.GET_SNAPSHOT:
+            params["data"] = self._store.snapshot()
+
+        elif operation == OperationType.EXPORT_STATE:
+            params["data"] = {"data": self._store.get(())}
+
+        elif operation == OperationType.IMPORT_STATE:
+            self._store.clear()
+            for key, value in params.get("state", {}).get("data", {}).items():
+                self._store.set([key], value)
+            params["data"] = True
 
         else:
             logger.debug(f"Unknown operation: {operation}")
             params["data"] = None
 
+        self._emit_changes()
+
         response = {
             "actor": self.actor_name,
             "target": actor,
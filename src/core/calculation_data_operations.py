@@ -1,4 +1,3 @@
-import time
 from itertools import product
 
 import numpy as np
@@ -25,7 +24,6 @@ class CalculationsDataOperations(BaseSlots):
 
     def __init__(self, signals):
         super().__init__(actor_name="calculations_data_operations", signals=signals)
-        self.last_plot_time = 0
         self.calculations_in_progress = False
         self.reaction_variables: dict = {}
         self.reaction_chosen_functions: dict[str, list] = {}
@@ -66,15 +64,17 @@ class CalculationsDataOperations(BaseSlots):
             logger.warning("Unknown or missing data operation.")
 
     def _protected_plot_update_curves(self, path_keys, params):
-        """Throttle plot updates to prevent excessive redrawing during rapid parameter changes."""
+        """
+        Replot reaction curves after a value change unless calculations are running.
+
+        Every change is emitted; the plot canvas coalesces emissions into one frame,
+        so rapid edits never leave a stale picture behind.
+        """
         if self.calculations_in_progress:
             logger.debug("Skipping plot update as calculations are in progress.")
             return
-        current_time = time.time()
-        if current_time - self.last_plot_time >= 0.1:
-            self.last_plot_time = current_time
-            logger.debug("Updating reaction curves based on updated values.")
-            self.highlight_reaction(path_keys, params)
+        logger.debug("Updating reaction curves based on updated values.")
+        self.highlight_reaction(path_keys, params)
 
     def _extract_reaction_params(self, path_keys: list):
         """Get reaction parameters from storage and parse them for curve fitting."""
@@ -121,6 +121,7 @@ class CalculationsDataOperations(BaseSlots):
         ordered_vars = ["h", "z", "w", "fr", "ads1", "ads2"]
         sorted_reactions = sorted(reactions_dict.keys(), key=lambda x: int(x.split("_")[1]))
 
+        batch_paths, batch_values = [], []
         for i, reaction in enumerate(sorted_reactions):
             variables = self.reaction_variables[reaction]
             values = reactions_dict[reaction]
@@ -130,9 +131,17 @@ class CalculationsDataOperations(BaseSlots):
 
             for var, value in zip(var_list, values):
                 for bound in ["lower_bound_coeffs", "coeffs", "upper_bound_coeffs"]:
-                    pk = [file_name, reaction, bound, var]
-                    pr = {"value": value, "is_chain": True}
-                    self.update_value(pk, pr)
+                    batch_paths.append([file_name, reaction, bound, var])
+                    batch_values.append(value)
+
+        # One batched request instead of a blocking round-trip per coefficient and bound
+        is_ok = self.handle_request_cycle(
+            "calculations_data", OperationType.SET_VALUES, paths=batch_paths, values=batch_values
+        )
+        if not is_ok:
+            logger.error(f"Failed to update reaction parameters for file '{file_name}'.")
+            console.log("Error: Unable to update reaction parameters.")
+            return
 
         logger.info("Reaction parameters updated successfully.")
         console.log("Reaction parameters have been updated based on the best combination found.")
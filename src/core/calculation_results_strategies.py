@@ -1,4 +1,3 @@
-import datetime
 from abc import ABC, abstractmethod
 from typing import Dict
 
@@ -34,14 +33,8 @@ class DeconvolutionStrategy(BestResultStrategy):
         if best_mse < self.calculation.best_mse:
             self.calculation.best_mse = best_mse
             self.calculation.best_combination = best_combination
-            self.calculation.mse_history.append((datetime.datetime.now(), best_mse))
-            logger.debug(f"Added MSE to history at {datetime.datetime.now().strftime('%H:%M:%S')}: {best_mse}")
             logger.info("A new best MSE has been found.")
 
-            self.calculation.handle_request_cycle(
-                "main_window", OperationType.PLOT_MSE_LINE, mse_data=self.calculation.mse_history
-            )
-
             def reaction_param_count(func_type: str) -> int:
                 if func_type == "gauss":
                     return 3
@@ -208,14 +201,8 @@ class ModelBasedCalculationStrategy(BestResultStrategy):
         try:
             logger.debug(f"New best MSE found: {best_mse} (previous: {self.calculation.best_mse})")
             self.calculation.best_mse = best_mse
-            self.calculation.mse_history.append((datetime.datetime.now(), best_mse))
-            logger.debug(f"Added MSE to history at {datetime.datetime.now().strftime('%H:%M:%S')}: {best_mse}")
             logger.info("A new best MSE has been found in model calculation.")
 
-            self.calculation.handle_request_cycle(
-                "main_window", OperationType.PLOT_MSE_LINE, mse_data=self.calculation.mse_history
-            )
-
             parameters_yaml = "parameters:\n"
 
             for i, reaction in enumerate(reactions):
@@ -246,31 +233,32 @@ class ModelBasedCalculationStrategy(BestResultStrategy):
             console.log(f"Best MSE: {best_mse:.4f}")
             console.log(parameters_yaml.rstrip())
 
-            # Send individual best values updates for each reaction
+            # Send best values of all reactions in one update
+            best_values = []
             for i, reaction in enumerate(reactions):
                 try:
-                    logA_val = float(logA[i])
-                    ea_val = float(Ea[i])
-                    contribution_val = float(contributions[i])
-
-                    # Send update for this specific reaction
-                    self.calculation.handle_request_cycle(
-                        "main_window",
-                        OperationType.UPDATE_MODEL_BASED_BEST_VALUES,
-                        reaction_index=i,
-                        Ea=ea_val,
-                        logA=logA_val,
-                        contribution=contribution_val,
-                        mse=best_mse,
-                    )
-
-                    logger.debug(
-                        f"Sent best values update for reaction {i}: "
-                        f"Ea={ea_val}, logA={logA_val:.2f}, contribution={contribution_val:.3f}"
+                    allowed_models = reaction.get("allowed_models", [])
+                    # Rounded and clipped the same way as CompiledScheme.model_codes
+                    model_position = min(max(round(float(model_index[i])), 0), len(allowed_models) - 1)
+                    best_values.append(
+                        {
+                            "reaction_index": i,
+                            "Ea": float(Ea[i]),
+                            "logA": float(logA[i]),
+                            "contribution": float(contributions[i]),
+                            "model": allowed_models[model_position] if allowed_models else None,
+                        }
                     )
-
                 except Exception as e:
-                    logger.error(f"Error sending best values update for reaction {i}: {e}")
+                    logger.error(f"Error preparing best values update for reaction {i}: {e}")
+
+            self.calculation.handle_request_cycle(
+                "main_window",
+                OperationType.UPDATE_MODEL_BASED_BEST_VALUES,
+                best_values=best_values,
+                mse=best_mse,
+            )
+            logger.debug(f"Sent best values update for {len(best_values)} reactions")
 
         except Exception as e:
             logger.error(f"Error processing new best result: {e}")
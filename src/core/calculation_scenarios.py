@@ -1,3 +1,4 @@
+import datetime
 import threading
 from functools import wraps
 from multiprocessing import Manager
@@ -8,9 +9,12 @@ from scipy.constants import R
 from scipy.integrate import solve_ivp
 from scipy.optimize import NonlinearConstraint
 
-from src.core.app_settings import NUC_MODELS_TABLE, PARAMETER_BOUNDS
+from src.core.app_settings import PARAMETER_BOUNDS
+from src.core.compiled_scheme import CompiledScheme, extract_chains  # noqa: F401 (extract_chains re-exported)
 from src.core.curve_fitting import CurveFitting as cft
 from src.core.logger_config import logger
+from src.core.logger_console import LoggerConsole as console
+from src.core.series_data import ExperimentalSeries
 
 
 class TimeoutError(Exception):  # noqa: A001
@@ -74,6 +78,10 @@ class BaseCalculationScenario:
         """Return optimization constraints."""
         return []
 
+    def map_solution(self, x: np.ndarray) -> np.ndarray:
+        """Return the optimizer's solution vector in the form reported to the user."""
+        return x
+
 
 class DeconvolutionScenario(BaseCalculationScenario):
     """Scenario for peak deconvolution optimization."""
@@ -90,7 +98,7 @@ class DeconvolutionScenario(BaseCalculationScenario):
     def get_result_strategy_type(self) -> str:
         return "deconvolution"
 
-    def get_target_function(self, **kwargs) -> Callable:
+    def get_target_function(self, **kwargs) -> Callable:  # noqa: C901
         reaction_variables = self.params["reaction_variables"]
         reaction_combinations = self.params["reaction_combinations"]
         experimental_data = self.params["experimental_data"]
@@ -136,99 +144,59 @@ class DeconvolutionScenario(BaseCalculationScenario):
                 if mse < best_mse:
                     best_mse = mse
                     best_combination = combination
-                    self.calculations.new_best_result.emit(
-                        {
-                            "best_mse": best_mse,
-                            "best_combination": best_combination,
-                            "params": params_array,
-                            "reaction_variables": reaction_variables,
-                        }
-                    )
+                    if mse < self.calculations.progress.best:
+                        # The optimizer may reuse params_array, so publish a copy
+                        self.calculations.progress.offer(
+                            {
+                                "best_mse": best_mse,
+                                "best_combination": best_combination,
+                                "params": params_array.copy(),
+                                "reaction_variables": reaction_variables,
+                            }
+                        )
             return best_mse
 
         return target_function
 
 
-def extract_chains(scheme: dict) -> list:
-    components = [comp["id"] for comp in scheme["components"]]
-    outgoing = {node: [] for node in components}
-    incoming = {node: [] for node in components}
-
-    for idx, reaction in enumerate(scheme["reactions"]):
-        src = reaction["from"]
-        dst = reaction["to"]
-        outgoing[src].append((idx, dst))
-        incoming[dst].append((idx, src))
-
-    start_nodes = [node for node in components if len(incoming[node]) == 0]
-    end_nodes = [node for node in components if len(outgoing[node]) == 0]
-
-    chains = []
-
-    def dfs(current_node, current_chain, visited):
-        if current_node in visited:
-            return
-        visited.add(current_node)
-        if current_node in end_nodes:
-            chains.append(current_chain.copy())
-        for edge_idx, next_node in outgoing[current_node]:
-            current_chain.append(edge_idx)
-            dfs(next_node, current_chain, visited)
-            current_chain.pop()
-        visited.remove(current_node)
-
-    for start in start_nodes:
-        dfs(start, [], set())
-
-    return chains
-
-
 def constraint_fun(X, chains, num_reactions):
     contributions = X[3 * num_reactions : 4 * num_reactions]
     return np.array([np.sum(contributions[chain]) - 1.0 for chain in chains])
 
 
-def ode_function(T, y, beta, params, species_list, reactions, num_species, num_reactions, R):
-    dYdt = np.zeros_like(y)
-    for i in range(num_reactions):
-        src = reactions[i]["from"]
-        tgt = reactions[i]["to"]
-        src_index = species_list.index(src)
-        tgt_index = species_list.index(tgt)
-        e_value = y[src_index]
-        model_param_index = 2 * num_reactions + i
-        model_index = int(np.clip(round(params[model_param_index]), 0, len(reactions[i]["allowed_models"]) - 1))
-        reaction_type = reactions[i]["allowed_models"][model_index]
-        model = NUC_MODELS_TABLE.get(reaction_type)
-        f_e = model["differential_form"](e_value) if model else e_value
-        logA = params[i]
-        Ea = params[num_reactions + i]
-        k_i = (10**logA * np.exp(-Ea * 1000 / (R * T))) / beta
-        rate = k_i * f_e
-        dYdt[src_index] -= rate
-        dYdt[tgt_index] += rate
-        dYdt[num_species + i] = rate
-    return dYdt
-
-
-@integration_timeout(50.0)
-def integrate_ode_for_beta(
-    beta, contributions, params, species_list, reactions, num_species, num_reactions, exp_temperature, exp_mass, R
-):
-    y0 = np.zeros(num_species + num_reactions)
-    if num_species > 0:
-        y0[0] = 1.0
+def simulate_model_mass(beta, contributions, params, scheme, exp_temperature, exp_mass, R, stop_event=None):
+    """
+    Integrate the compiled reaction scheme for one heating rate.
 
-    def ode_wrapper(T, y):
-        return ode_function(T, y, beta, params, species_list, reactions, num_species, num_reactions, R)
+    Returns:
+        tuple | None: (model_mass, mse) from a single integration, or None when the solver fails.
 
-    sol = solve_ivp(ode_wrapper, [exp_temperature[0], exp_temperature[-1]], y0, t_eval=exp_temperature, method="RK45")
+    Raises:
+        InterruptedError: stop_event was set during integration.
+    """
+    rhs = scheme.rate_function(params, beta, R)
+    if stop_event is None:
+        ode_wrapper = rhs
+    else:
+
+        def ode_wrapper(T, y):
+            if stop_event.is_set():
+                raise InterruptedError("Simulation cancelled")
+            return rhs(T, y)
+
+    sol = solve_ivp(
+        ode_wrapper,
+        [exp_temperature[0], exp_temperature[-1]],
+        scheme.initial_state(),
+        t_eval=exp_temperature,
+        method="RK45",
+    )
     if not sol.success:
-        return 1e4
-    rates_int = sol.y[num_species : num_species + num_reactions, :]
+        return None
+    rates_int = sol.y[scheme.num_species :, :]
     M0 = exp_mass[0]
     Mfin = exp_mass[-1]
-    int_sum = np.sum(contributions[:, np.newaxis] * rates_int, axis=0)
+    int_sum = contributions @ rates_int
 
     # Physical constraint: prevent negative mass by clamping int_sum to [0, 1]
     # This ensures model_mass remains between Mfin and M0 as physically required
@@ -240,31 +208,27 @@ def integrate_ode_for_beta(
     model_mass = np.clip(model_mass, Mfin, M0)
 
     mse_i = np.mean((model_mass - exp_mass) ** 2)
-    return mse_i
+    return model_mass, mse_i
 
 
-def model_based_objective_function(
-    params, species_list, reactions, num_species, num_reactions, betas, all_exp_masses, exp_temperature, R, stop_event
-):
+@integration_timeout(50.0)
+def integrate_ode_for_beta(beta, contributions, params, scheme, exp_temperature, exp_mass, R):
+    result = simulate_model_mass(beta, contributions, params, scheme, exp_temperature, exp_mass, R)
+    if result is None:
+        return 1e4
+    return result[1]
+
+
+def model_based_objective_function(params, scheme, betas, all_exp_masses, exp_temperature, R, stop_event):
     total_mse = 0.0
+    num_reactions = scheme.num_reactions
     contributions = params[3 * num_reactions : 4 * num_reactions]
     for beta, exp_mass in zip(betas, all_exp_masses):
         if stop_event.is_set():
             return float("inf")
 
         try:
-            mse_i = integrate_ode_for_beta(
-                beta,
-                contributions,
-                params,
-                species_list,
-                reactions,
-                num_species,
-                num_reactions,
-                exp_temperature,
-                exp_mass,
-                R,
-            )
+            mse_i = integrate_ode_for_beta(beta, contributions, params, scheme, exp_temperature, exp_mass, R)
             total_mse += mse_i
         except TimeoutError:
             return 1e4
@@ -272,6 +236,10 @@ def model_based_objective_function(
 
 
 class ModelBasedScenario(BaseCalculationScenario):
+    def __init__(self, params: Dict, calculations):
+        super().__init__(params, calculations)
+        self.simplex_contributions = self._resolve_simplex_contributions()
+
     def get_result_strategy_type(self) -> str:
         return "model_based_calculation"
 
@@ -308,50 +276,62 @@ class ModelBasedScenario(BaseCalculationScenario):
             bounds.append((contrib_min, contrib_max))
         return bounds
 
+    def _resolve_simplex_contributions(self) -> bool:
+        """
+        Whether contributions are reparameterized onto the chain simplex instead of constrained.
+
+        Requested through ``contribution_parameterization="simplex"`` in the method parameters;
+        falls back to the constraint when chains share reactions and cannot be normalized independently.
+        """
+        method_parameters = self.params.get("calculation_settings", {}).get("method_parameters", {})
+        if method_parameters.get("contribution_parameterization", "constraint") != "simplex":
+            return False
+        if not CompiledScheme.from_scheme(self.params.get("reaction_scheme")).chains_partition_reactions:
+            logger.warning("Reaction chains share reactions; using the contribution constraint instead of simplex")
+            console.log("\nReaction chains share reactions, so contributions are constrained instead of normalized.\n")
+            return False
+        return True
+
     def get_constraints(self) -> list:
         try:
-            scheme = self.params.get("reaction_scheme")
-            chains = extract_chains(scheme)
-            num_reactions = len(scheme["reactions"])
+            if self.simplex_contributions:
+                return []
+
+            compiled = CompiledScheme.from_scheme(self.params.get("reaction_scheme"))
+            num_reactions = compiled.num_reactions
+            num_chains = len(compiled.chains)
 
-            if len(chains) == 0:
+            if num_chains == 0:
                 raise ValueError("No valid reaction chains found.")
 
             def constraint_function(X):
-                contributions = X[3 * num_reactions : 4 * num_reactions]
-                return np.array([np.sum(contributions[chain]) - 1.0 for chain in chains])
+                return compiled.chain_residuals(X[3 * num_reactions : 4 * num_reactions])
 
-            return [NonlinearConstraint(constraint_function, [0.0] * len(chains), [0.0] * len(chains))]
+            return [NonlinearConstraint(constraint_function, [0.0] * num_chains, [0.0] * num_chains)]
 
         except Exception as e:
             logger.error(f"Error in get_constraints: {e}")
             return []
 
-    def get_target_function(self, **kwargs) -> callable:
-        scheme = self.params.get("reaction_scheme")
-        reactions = scheme.get("reactions")
-        components = scheme.get("components")
-        species_list = [comp["id"] for comp in components]
-        num_species = len(species_list)
-        num_reactions = len(reactions)
-
-        experimental_data = self.params.get("experimental_data")
-        if experimental_data is None:
-            raise ValueError("No 'experimental_data' provided for ModelBasedScenario.")
+    def map_solution(self, x: np.ndarray) -> np.ndarray:
+        """Map the raw contribution block onto the chain simplex when the search ran in simplex mode."""
+        if not self.simplex_contributions:
+            return x
+        return CompiledScheme.from_scheme(self.params.get("reaction_scheme")).with_simplex_contributions(x)
 
-        exp_temperature = experimental_data["temperature"].to_numpy() + 273.15
+    def get_target_function(self, **kwargs) -> callable:
+        compiled = CompiledScheme.from_scheme(self.params.get("reaction_scheme"))
 
-        betas = [float(col) for col in experimental_data.columns if col.lower() != "temperature"]
+        experimental_arrays = self.params.get("experimental_arrays")
+        if experimental_arrays is None:
+            experimental_data = self.params.get("experimental_data")
+            if experimental_data is None:
+                raise ValueError("No 'experimental_data' provided for ModelBasedScenario.")
+            experimental_arrays = ExperimentalSeries.from_dataframe(experimental_data)
 
-        all_exp_masses = []
-        for beta in betas:
-            col_name = str(beta)
-            if col_name not in experimental_data.columns:
-                col_name = str(int(beta))
-            if col_name not in experimental_data.columns:
-                raise ValueError(f"Experimental data does not contain column for beta value {beta}")
-            exp_mass = experimental_data[col_name].to_numpy()
-            all_exp_masses.append(exp_mass)
+        exp_temperature = experimental_arrays.temperature_kelvin
+        betas = experimental_arrays.betas.tolist()
+        all_exp_masses = experimental_arrays.mass_rows()
 
         manager = Manager()
         best_mse = manager.Value("d", np.inf)
@@ -359,10 +339,7 @@ class ModelBasedScenario(BaseCalculationScenario):
         lock = manager.Lock()
 
         return ModelBasedTargetFunction(
-            species_list,
-            reactions,
-            num_species,
-            num_reactions,
+            compiled,
             betas,
             all_exp_masses,
             exp_temperature,
@@ -370,16 +347,14 @@ class ModelBasedScenario(BaseCalculationScenario):
             best_params,
             lock,
             stop_event=self.calculations.stop_event,
+            simplex_contributions=self.simplex_contributions,
         )
 
 
 class ModelBasedTargetFunction:
     def __init__(
         self,
-        species_list,
-        reactions,
-        num_species,
-        num_reactions,
+        scheme,
         betas,
         all_exp_masses,
         exp_temperature,
@@ -387,11 +362,9 @@ class ModelBasedTargetFunction:
         best_params,
         lock,
         stop_event,
+        simplex_contributions=False,
     ):
-        self.species_list = species_list
-        self.reactions = reactions
-        self.num_species = num_species
-        self.num_reactions = num_reactions
+        self.scheme = scheme
         self.betas = betas
         self.all_exp_masses = all_exp_masses
         self.exp_temperature = exp_temperature
@@ -400,17 +373,18 @@ class ModelBasedTargetFunction:
         self.lock = lock
         self.R = R
         self.stop_event = stop_event
+        self.simplex_contributions = simplex_contributions
 
     def __call__(self, params: np.ndarray) -> float:
         if self.stop_event.is_set():
             return float("inf")
+        if self.simplex_contributions:
+            # Best parameters are recorded in the mapped, constraint-satisfying form
+            params = self.scheme.with_simplex_contributions(params)
         try:
             total_mse = model_based_objective_function(
                 params,
-                self.species_list,
-                self.reactions,
-                self.num_species,
-                self.num_reactions,
+                self.scheme,
                 self.betas,
                 self.all_exp_masses,
                 self.exp_temperature,
@@ -429,12 +403,18 @@ class ModelBasedTargetFunction:
 
 
 def make_de_callback(target_obj, calculations_instance):
-    def callback(x, convergence):
+    def callback(intermediate_result):
         if calculations_instance.stop_event.is_set():
             return True
+        energies = np.asarray(intermediate_result.population_energies)
+        energies = energies[np.isfinite(energies)]
+        if energies.size:
+            calculations_instance.population_history.append(
+                (datetime.datetime.now(), float(energies.min()), float(energies.mean()))
+            )
         best_mse = target_obj.best_mse.value
         best_params = list(target_obj.best_params)
-        calculations_instance.new_best_result.emit(
+        calculations_instance.progress.offer(
             {
                 "best_mse": best_mse,
                 "params": best_params,
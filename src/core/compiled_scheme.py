@@ -0,0 +1,195 @@
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from src.core.app_settings import NUC_MODELS_LIST, NUC_MODELS_TABLE
+
+MODEL_CODES = {name: code for code, name in enumerate(NUC_MODELS_LIST)}
+# Differential forms indexed by model code; unknown model names get code -1 and a first-order rate
+DIFFERENTIAL_FORMS = tuple(NUC_MODELS_TABLE[name]["differential_form"] for name in NUC_MODELS_LIST)
+UNKNOWN_MODEL_CODE = -1
+
+
+def extract_chains(scheme: dict) -> list:
+    components = [comp["id"] for comp in scheme["components"]]
+    outgoing = {node: [] for node in components}
+    incoming = {node: [] for node in components}
+
+    for idx, reaction in enumerate(scheme["reactions"]):
+        src = reaction["from"]
+        dst = reaction["to"]
+        outgoing[src].append((idx, dst))
+        incoming[dst].append((idx, src))
+
+    start_nodes = [node for node in components if len(incoming[node]) == 0]
+    end_nodes = [node for node in components if len(outgoing[node]) == 0]
+
+    chains = []
+
+    def dfs(current_node, current_chain, visited):
+        if current_node in visited:
+            return
+        visited.add(current_node)
+        if current_node in end_nodes:
+            chains.append(current_chain.copy())
+        for edge_idx, next_node in outgoing[current_node]:
+            current_chain.append(edge_idx)
+            dfs(next_node, current_chain, visited)
+            current_chain.pop()
+        visited.remove(current_node)
+
+    for start in start_nodes:
+        dfs(start, [], set())
+
+    return chains
+
+
+@dataclass(frozen=True)
+class CompiledScheme:
+    """
+    Array form of a model-based reaction scheme, built once from the scheme dict.
+
+    Model-based parameter vectors are laid out as ``[logA, Ea, model_index,
+    contribution]`` blocks of ``num_reactions`` values each. The ODE state holds
+    the species fractions followed by the integrated rate of every reaction.
+
+    Attributes
+    ----------
+    species : tuple[str, ...]
+        Component ids; the first species starts with fraction 1.
+    source_index, target_index : np.ndarray
+        Species index consumed and produced by each reaction, shape (n_reactions,).
+    stoichiometry : np.ndarray
+        Species-by-reaction incidence matrix with -1 for the source and +1 for the target.
+    chains : tuple[tuple[int, ...], ...]
+        Reaction indices along every path from a start to an end species.
+    chain_matrix : np.ndarray
+        Chain-by-reaction membership matrix, so chain contribution sums are one mat-vec.
+    allowed_models : np.ndarray
+        Model codes (see MODEL_CODES) allowed per reaction, padded with UNKNOWN_MODEL_CODE,
+        shape (n_reactions, max_allowed).
+    model_counts : np.ndarray
+        Number of allowed models per reaction.
+    """
+
+    species: tuple[str, ...]
+    source_index: np.ndarray
+    target_index: np.ndarray
+    stoichiometry: np.ndarray
+    chains: tuple[tuple[int, ...], ...]
+    chain_matrix: np.ndarray
+    allowed_models: np.ndarray
+    model_counts: np.ndarray
+
+    @classmethod
+    def from_scheme(cls, scheme: dict) -> "CompiledScheme":
+        """Compile the ``reaction_scheme`` dict; raises ValueError for reactions between unknown species."""
+        species = tuple(component["id"] for component in scheme.get("components", []))
+        reactions = scheme.get("reactions", [])
+        species_index = {name: i for i, name in enumerate(species)}
+        try:
+            source_index = np.array([species_index[r["from"]] for r in reactions], dtype=np.intp)
+            target_index = np.array([species_index[r["to"]] for r in reactions], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Reaction refers to unknown species {e}") from e
+
+        num_reactions = len(reactions)
+        stoichiometry = np.zeros((len(species), num_reactions))
+        stoichiometry[source_index, np.arange(num_reactions)] -= 1.0
+        stoichiometry[target_index, np.arange(num_reactions)] += 1.0
+
+        chains = tuple(tuple(chain) for chain in extract_chains(scheme)) if species else ()
+        chain_matrix = np.zeros((len(chains), num_reactions))
+        for row, chain in enumerate(chains):
+            chain_matrix[row, list(chain)] = 1.0
+
+        model_names = [r.get("allowed_models") or [r.get("reaction_type")] for r in reactions]
+        model_counts = np.array([len(names) for names in model_names], dtype=np.intp)
+        allowed_models = np.full((num_reactions, max(model_counts, default=0)), UNKNOWN_MODEL_CODE, dtype=np.intp)
+        for row, names in enumerate(model_names):
+            allowed_models[row, : len(names)] = [MODEL_CODES.get(name, UNKNOWN_MODEL_CODE) for name in names]
+
+        for array in (source_index, target_index, stoichiometry, chain_matrix, allowed_models, model_counts):
+            array.flags.writeable = False
+        return cls(
+            species, source_index, target_index, stoichiometry, chains, chain_matrix, allowed_models, model_counts
+        )
+
+    @property
+    def num_species(self) -> int:
+        return len(self.species)
+
+    @property
+    def num_reactions(self) -> int:
+        return len(self.source_index)
+
+    def chain_residuals(self, contributions: np.ndarray) -> np.ndarray:
+        """Return the deviation of every chain's contribution sum from 1."""
+        return self.chain_matrix @ contributions - 1.0
+
+    @property
+    def chains_partition_reactions(self) -> bool:
+        """True when every reaction belongs to exactly one chain, so chains can be normalized independently."""
+        return self.num_reactions > 0 and bool(np.all(self.chain_matrix.sum(axis=0) == 1))
+
+    def simplex_contributions(self, weights: np.ndarray) -> np.ndarray:
+        """
+        Map non-negative weights to contributions that sum to 1 along every chain.
+
+        Each weight is divided by the total weight of its chain; a chain with zero
+        total weight is split evenly. Requires ``chains_partition_reactions``.
+        """
+        weights = np.clip(np.asarray(weights, dtype=float), 0.0, None)
+        totals = self.chain_matrix.T @ (self.chain_matrix @ weights)
+        sizes = self.chain_matrix.T @ self.chain_matrix.sum(axis=1)
+        return np.where(totals > 0, weights / np.where(totals > 0, totals, 1.0), 1.0 / sizes)
+
+    def with_simplex_contributions(self, params: np.ndarray) -> np.ndarray:
+        """Return a copy of a parameter vector with its contribution block mapped by simplex_contributions."""
+        n = self.num_reactions
+        mapped = np.array(params, dtype=float)
+        mapped[3 * n : 4 * n] = self.simplex_contributions(mapped[3 * n : 4 * n])
+        return mapped
+
+    def model_codes(self, model_indices: np.ndarray) -> np.ndarray:
+        """Round continuous model indices into each reaction's allowed list and return model codes."""
+        if self.num_reactions == 0:
+            return np.empty(0, dtype=np.intp)
+        positions = np.clip(np.rint(model_indices), 0, self.model_counts - 1).astype(np.intp)
+        return self.allowed_models[np.arange(self.num_reactions), positions]
+
+    def initial_state(self) -> np.ndarray:
+        y0 = np.zeros(self.num_species + self.num_reactions)
+        if self.num_species > 0:
+            y0[0] = 1.0
+        return y0
+
+    def rate_function(self, params: np.ndarray, beta: float, R: float) -> Callable[[float, np.ndarray], np.ndarray]:
+        """
+        Return the ODE right-hand side dy/dT for one parameter vector and heating rate.
+
+        Everything that does not depend on temperature or state is resolved here,
+        so each call is a few array operations plus one model call per distinct model.
+        """
+        n = self.num_reactions
+        params = np.asarray(params, dtype=float)
+        pre_exponential = 10.0 ** params[:n] / beta
+        activation = params[n : 2 * n] * 1000.0 / R
+        codes = self.model_codes(params[2 * n : 3 * n])
+        model_groups = [
+            (DIFFERENTIAL_FORMS[code] if code != UNKNOWN_MODEL_CODE else None, np.flatnonzero(codes == code))
+            for code in np.unique(codes)
+        ]
+        source_index, stoichiometry = self.source_index, self.stoichiometry
+
+        def rhs(T, y):
+            e = y[source_index]
+            f_e = e.copy()
+            for form, index in model_groups:
+                if form is not None:
+                    f_e[index] = form(e[index])
+            rate = pre_exponential * np.exp(-activation / T) * f_e
+            return np.concatenate((stoichiometry @ rate, rate))
+
+        return rhs
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.core.app_settings import FILE_CACHE_CONFIG
+from src.core.logger_config import logger
+
+
+class FileCache:
+    """
+    Binary cache of parsed experiment files backed by memory-mapped .npy matrices.
+
+    Entries are keyed by absolute path, size, modification time and parse
+    options, so any change to the source file or to the loading settings
+    invalidates the entry. Only fully numeric tables are cached; the values
+    are stored as a single float64 matrix next to a small JSON header with
+    column names and original dtypes.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding ``<key>.npy`` / ``<key>.json`` pairs.
+    enabled : bool
+        When False, lookups always miss and nothing is written.
+    max_bytes : int
+        Size limit of the cache directory. After each write the least recently
+        used entries (by modification time, refreshed on every hit) are deleted
+        until the directory fits.
+
+    Defaults are read from ``FILE_CACHE_CONFIG`` when the cache is created.
+    """
+
+    def __init__(self, cache_dir: str = None, enabled: bool = None, max_bytes: int = None):
+        self.cache_dir = cache_dir if cache_dir is not None else FILE_CACHE_CONFIG.cache_dir
+        self.enabled = enabled if enabled is not None else FILE_CACHE_CONFIG.enabled
+        self.max_bytes = max_bytes if max_bytes is not None else FILE_CACHE_CONFIG.max_bytes
+
+    def cache_key(self, file_path: str, options: dict) -> str:
+        """Build cache key from file identity (path, size, mtime) and parse options."""
+        stat = os.stat(file_path)
+        identity = {
+            "path": os.path.abspath(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "options": options,
+        }
+        return hashlib.sha1(json.dumps(identity, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry_paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.cache_dir, key)
+        return base + ".npy", base + ".json"
+
+    def load(self, file_path: str, options: dict) -> pd.DataFrame | None:
+        """Return cached DataFrame backed by a read-only memory map, or None on miss."""
+        if not self.enabled:
+            return None
+        try:
+            values_path, meta_path = self._entry_paths(self.cache_key(file_path, options))
+            if not (os.path.exists(values_path) and os.path.exists(meta_path)):
+                return None
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            values = np.load(values_path, mmap_mode="r")
+            for path in (values_path, meta_path):
+                os.utime(path)
+            df = pd.DataFrame(values, columns=meta["columns"], copy=False)
+            non_float = {col: dtype for col, dtype in zip(meta["columns"], meta["dtypes"]) if dtype != "float64"}
+            if non_float:
+                df = df.astype(non_float)
+            logger.debug(f"File cache hit for '{file_path}'")
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable file cache entry for '{file_path}': {e}")
+            return None
+
+    def store(self, file_path: str, options: dict, df: pd.DataFrame) -> bool:
+        """Write numeric DataFrame to the cache; returns False when the table is not cacheable."""
+        if not self.enabled:
+            return False
+        if df.empty or not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+            logger.debug(f"File '{file_path}' has non-numeric columns; skipping file cache")
+            return False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            values_path, meta_path = self._entry_paths(self.cache_key(file_path, options))
+            meta = {"columns": [str(col) for col in df.columns], "dtypes": [str(dtype) for dtype in df.dtypes]}
+
+            # Write to temporary names first so readers never see a partial entry
+            tmp_values, tmp_meta = values_path + ".tmp", meta_path + ".tmp"
+            with open(tmp_values, "wb") as f:
+                np.save(f, df.to_numpy(dtype=np.float64))
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_values, values_path)
+            os.replace(tmp_meta, meta_path)
+        except Exception as e:
+            logger.warning(f"Failed to write file cache for '{file_path}': {e}")
+            return False
+        self.prune(keep=os.path.splitext(os.path.basename(values_path))[0])
+        return True
+
+    def prune(self, keep: str = None) -> int:
+        """
+        Delete least recently used entries until the cache fits into ``max_bytes``.
+
+        Args:
+            keep: Key of an entry that is never deleted, such as the one just written.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        entries = {}
+        try:
+            with os.scandir(self.cache_dir) as scan:
+                for item in scan:
+                    key, ext = os.path.splitext(item.name)
+                    if ext in (".npy", ".json") and item.is_file():
+                        stat = item.stat()
+                        size, mtime, paths = entries.get(key, (0, 0.0, []))
+                        entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime), [*paths, item.path])
+        except OSError as e:
+            logger.warning(f"Could not scan file cache '{self.cache_dir}': {e}")
+            return 0
+
+        total = sum(size for size, _, _ in entries.values())
+        removed = 0
+        for key, (size, _, paths) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                for path in paths:
+                    os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove file cache entry '{key}': {e}")
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(f"File cache pruned: {removed} entries removed, {total} bytes kept")
+        return removed
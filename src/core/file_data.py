@@ -1,46 +1,177 @@
+import csv
 import enum
+import importlib.util
 import os
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
 from functools import wraps
-from io import StringIO
+from io import BytesIO, StringIO
 
 import chardet
+import numpy as np
 import pandas as pd
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QCoreApplication, pyqtSignal, pyqtSlot
 
-from src.core.app_settings import OperationType
+from src.core.app_settings import FILE_STREAMING_CONFIG, OperationType
 from src.core.base_signals import BaseSlots
+from src.core.file_cache import FileCache
+from src.core.file_transformations import TransformationRecipe, TransformationStep
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
 
+SAMPLE_SIZE = 100_000
+TRANSFORMATION_CACHE_SIZE = 16
+DECIMAL_PATTERN = re.compile(rb"\d([.,])\d")
+FAST_CSV_ENGINES = ("pyarrow", "c") if importlib.util.find_spec("pyarrow") else ("c",)
 
-def detect_encoding(func):
-    """Decorator to automatically detect file encoding using chardet."""
+
+def detect_encoding(sample: bytes) -> str:
+    """Detect encoding of a raw byte sample, short-circuiting the common UTF-8 case."""
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # A multibyte character cut at the sample boundary is still valid UTF-8
+        if e.start >= len(sample) - 3 and e.reason == "unexpected end of data":
+            return "utf-8"
+    return chardet.detect(sample)["encoding"] or "utf-8"
+
+
+def detect_decimal(sample: bytes, delimiter: str) -> str:
+    """Detect decimal separator from digit-separator-digit patterns, ignoring the column delimiter."""
+    separators = [sep for sep in DECIMAL_PATTERN.findall(sample) if sep.decode() != delimiter]
+    return "," if separators.count(b",") > separators.count(b".") else "."
+
+
+def detect_delimiter(sample_text: str) -> str:
+    """Sniff column delimiter from decoded sample text, defaulting to comma."""
+    try:
+        return csv.Sniffer().sniff(sample_text, delimiters=",;\t ").delimiter
+    except csv.Error:
+        return ","
+
+
+def detect_parse_options(sample: bytes, delimiter: str) -> tuple[str, dict]:
+    """Derive delimiter (when not given), encoding and decimal separator from a byte sample."""
+    encoding = detect_encoding(sample)
+    if not delimiter:
+        delimiter = detect_delimiter(sample.decode(encoding, errors="ignore"))
+    decimal = detect_decimal(sample, delimiter)
+    logger.debug("Detected encoding=%s, decimal=%s, delimiter=%s", encoding, decimal, delimiter)
+    return delimiter, {"encoding": encoding, "decimal": decimal}
+
+
+def read_file_buffer(func):
+    """Decorator that reads the file once and derives encoding, decimal and delimiter from the buffer."""
 
     @wraps(func)
-    def wrapper(self, *args, **kwargs):
+    def wrapper(self, **kwargs):
         with open(self.file_path, "rb") as f:
-            result = chardet.detect(f.read(100_000))
-        kwargs["encoding"] = result["encoding"]
-        return func(self, *args, **kwargs)
+            buffer = f.read()
+        self.delimiter, detected = detect_parse_options(buffer[:SAMPLE_SIZE], self.delimiter)
+        kwargs.update(detected)
+        return func(self, buffer, **kwargs)
 
     return wrapper
 
 
-def detect_decimal(func):
-    """Decorator to automatically detect decimal separator from file content."""
+def block_average(values: np.ndarray, factor: int) -> np.ndarray:
+    """Average consecutive blocks of ``factor`` rows; a trailing partial block is averaged on its own."""
+    if factor <= 1 or values.shape[0] == 0:
+        return values
+    n_blocks = values.shape[0] // factor
+    averaged = np.nanmean(values[: n_blocks * factor].reshape(n_blocks, factor, values.shape[1]), axis=1)
+    if values.shape[0] > n_blocks * factor:
+        averaged = np.vstack([averaged, np.nanmean(values[n_blocks * factor :], axis=0, keepdims=True)])
+    return averaged
 
-    @wraps(func)
-    def wrapper(self, **kwargs):
-        encoding = kwargs.get("encoding", "utf-8")
-        with open(self.file_path, "r", encoding=encoding) as f:
-            sample_lines = [next(f) for _ in range(100)]
-        sample_text = "".join(sample_lines)
 
-        decimal_sep = "," if sample_text.count(",") > sample_text.count(".") else "."
-        kwargs["decimal"] = decimal_sep
-        return func(self, **kwargs)
+def block_minmax(values: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Keep the rows holding the minimum and maximum of every column within each block of ``factor`` rows.
+
+    Rows stay in their original order and are never mixed, so narrow peaks keep
+    their height and their x position. A trailing partial block is reduced on its own.
+    """
+    if factor <= 1 or values.shape[0] == 0:
+        return values
+    n_blocks = -(-values.shape[0] // factor)
+    padded = np.full((n_blocks * factor, values.shape[1]), np.nan)
+    padded[: values.shape[0]] = values
+    blocks = padded.reshape(n_blocks, factor, values.shape[1])
+    offsets = np.arange(n_blocks)[:, None] * factor
+    lows = np.nan_to_num(blocks, nan=np.inf).argmin(axis=1) + offsets
+    highs = np.nan_to_num(blocks, nan=-np.inf).argmax(axis=1) + offsets
+    rows = np.unique(np.concatenate([lows, highs], axis=1))
+    return values[rows[rows < values.shape[0]]]
+
+
+class RowBuffer:
+    """Growable float table; capacity doubles, so appending n rows copies O(n) values in total."""
+
+    def __init__(self, n_columns: int, capacity: int = 1024):
+        self._values = np.empty((capacity, n_columns))
+        self._size = 0
+
+    def append(self, rows: np.ndarray) -> None:
+        needed = self._size + rows.shape[0]
+        if needed > self._values.shape[0]:
+            grown = np.empty((max(needed, 2 * self._values.shape[0]), self._values.shape[1]))
+            grown[: self._size] = self._values[: self._size]
+            self._values = grown
+        self._values[self._size : needed] = rows
+        self._size = needed
+
+    def view(self) -> np.ndarray:
+        """Rows appended so far, without copying."""
+        return self._values[: self._size]
+
+
+def streaming_decimation_factor(file_size: int, sample: bytes, max_rows: int) -> int:
+    """Estimate rows from the average line length of the sample and pick a factor keeping at most max_rows."""
+    lines = max(sample.count(b"\n"), 1)
+    estimated_rows = file_size * lines / max(len(sample), 1)
+    return max(1, int(np.ceil(estimated_rows / max_rows)))
+
+
+def parse_buffer(buffer: bytes, engines=FAST_CSV_ENGINES, **kwargs) -> pd.DataFrame:
+    """
+    Parse an in-memory file with the fastest available pandas engine.
 
-    return wrapper
+    Engines are tried in order; the python engine is used only when none of the
+    fast engines accepts the options or the data (e.g. regex separators).
+    """
+    for engine in engines:
+        try:
+            return pd.read_csv(BytesIO(buffer), engine=engine, on_bad_lines="skip", **kwargs)
+        except Exception as e:
+            logger.debug("Engine '%s' failed to parse buffer: %s", engine, e)
+    return pd.read_csv(BytesIO(buffer), engine="python", on_bad_lines="skip", **kwargs)
+
+
+class DataFrameViews(Mapping):
+    """
+    Read-only mapping of file name to its current transformed dataframe.
+
+    Views are materialized on access by applying the file's recipe to the
+    original data and are cached per recipe hash, so switching back to a
+    previously computed view (raw, α, DTG) is a dictionary lookup.
+    """
+
+    def __init__(self, file_data: "FileData"):
+        self._file_data = file_data
+
+    def __getitem__(self, file_name: str) -> pd.DataFrame:
+        if file_name not in self._file_data.original_data:
+            raise KeyError(file_name)
+        return self._file_data.materialize(file_name)
+
+    def __iter__(self):
+        return iter(self._file_data.original_data)
+
+    def __len__(self) -> int:
+        return len(self._file_data.original_data)
 
 
 class FileData(BaseSlots):
@@ -57,27 +188,36 @@ class FileData(BaseSlots):
         Currently loaded DataFrame from file.
     original_data : dict[str, pd.DataFrame]
         Immutable original dataframes keyed by filename.
-    dataframe_copies : dict[str, pd.DataFrame]
-        Working copies for modifications without altering originals.
+    dataframe_copies : DataFrameViews
+        Working views per recipe, cached and sharing unchanged column buffers with originals.
+    recipes : dict[str, TransformationRecipe]
+        Transformation steps per file, applied in one fused pass and validated when added.
     operations_history : dict[str, list]
         Complete modification history per file for traceability.
     loaded_files : set[str]
         Loaded file paths to prevent duplicate loading.
+    file_cache : FileCache
+        Memory-mapped binary cache that skips text parsing for unchanged files.
     """
 
     data_loaded_signal = pyqtSignal(pd.DataFrame)
+    data_chunk_loaded_signal = pyqtSignal(pd.DataFrame)
 
     def __init__(self, signals):
         super().__init__(actor_name="file_data", signals=signals)
         self.data = None
         self.original_data = {}
-        self.dataframe_copies = {}
+        self.recipes = {}
+        self.transformation_cache = OrderedDict()
+        self.dataframe_copies = DataFrameViews(self)
         self.file_path = None
         self.delimiter = ","
         self.skip_rows = 0
         self.columns_names = None
         self.operations_history = {}
         self.loaded_files = set()
+        self.file_cache = FileCache()
+        self._cache_options = None
 
     def log_operation(self, params: dict):
         """Log operation to history for traceability."""
@@ -136,7 +276,26 @@ class FileData(BaseSlots):
         _, file_extension = os.path.splitext(self.file_path)
         console.log(f"\n\nAttempting to load the file: {self.file_path}")
 
-        if file_extension == ".csv":
+        streaming = (
+            FILE_STREAMING_CONFIG.enabled
+            and file_extension in (".csv", ".txt")
+            and os.path.getsize(self.file_path) > FILE_STREAMING_CONFIG.threshold_bytes
+        )
+        self._cache_options = {
+            "extension": file_extension,
+            "delimiter": self.delimiter,
+            "skip_rows": self.skip_rows,
+            "columns_names": self.columns_names,
+            "streaming_max_rows": FILE_STREAMING_CONFIG.max_rows if streaming else None,
+        }
+        cached = self.file_cache.load(self.file_path, self._cache_options)
+
+        if cached is not None:
+            self.data = cached
+            self._fetch_data(from_cache=True)
+        elif streaming:
+            self.load_stream(FILE_STREAMING_CONFIG.chunk_rows, FILE_STREAMING_CONFIG.max_rows)
+        elif file_extension == ".csv":
             self.load_csv()
         elif file_extension == ".txt":
             self.load_txt()
@@ -146,47 +305,95 @@ class FileData(BaseSlots):
         self.loaded_files.add(self.file_path)
         console.log(f"\n\nFile '{self.file_path}' has been successfully loaded.")
 
-    @detect_encoding
-    @detect_decimal
-    def load_csv(self, **kwargs):
-        """Load CSV file with flexible parsing and error handling."""
+    @read_file_buffer
+    def load_csv(self, buffer: bytes, **kwargs):
+        """Load CSV file with fast-engine parsing and python-engine fallback."""
         try:
-            self.data = pd.read_csv(
-                self.file_path,
-                sep=self.delimiter,
-                engine="python",
-                on_bad_lines="skip",
-                skiprows=self.skip_rows,
-                header=0,
-                **kwargs,
-            )
+            self.data = parse_buffer(buffer, sep=self.delimiter, skiprows=self.skip_rows, header=0, **kwargs)
             self._fetch_data()
         except Exception as e:
             logger.error(f"Error while loading CSV file: {e}")
             console.log("\n\nError: Unable to load the CSV file.")
 
-    @detect_encoding
-    @detect_decimal
-    def load_txt(self, **kwargs):
+    @read_file_buffer
+    def load_txt(self, buffer: bytes, **kwargs):
         """Load TXT file with configurable delimiter and encoding detection."""
         try:
-            self.data = pd.read_table(
+            self.data = parse_buffer(buffer, sep=self.delimiter, skiprows=self.skip_rows, header=0, **kwargs)
+            self._fetch_data()
+        except Exception as e:
+            logger.error(f"Error while loading TXT file: {e}")
+            console.log("\n\nError: Unable to load the TXT file.")
+
+    def load_stream(
+        self, chunk_rows: int = FILE_STREAMING_CONFIG.chunk_rows, max_rows: int = FILE_STREAMING_CONFIG.max_rows
+    ):
+        """
+        Load a large file chunk by chunk with block averaging and progressive plotting.
+
+        Only a sample is read for format detection. Consecutive rows are averaged
+        in blocks sized so the result keeps at most ``max_rows`` rows; leftover
+        rows are carried over to the next chunk so block boundaries do not depend
+        on the chunk size. The averages become the analysis data: they stay evenly
+        spaced and suppress noise, which derivatives such as DTG depend on.
+
+        The preview emitted via ``data_chunk_loaded_signal`` after every chunk keeps
+        each block's minimum and maximum rows instead (see ``block_minmax``), so narrow
+        peaks stay visible while loading. Preview rows are appended to a ``RowBuffer``
+        and emitted as a view; the averaged blocks are concatenated once at the end.
+        """
+        try:
+            with open(self.file_path, "rb") as f:
+                sample = f.read(SAMPLE_SIZE)
+            self.delimiter, detected = detect_parse_options(sample, self.delimiter)
+            factor = streaming_decimation_factor(os.path.getsize(self.file_path), sample, max_rows)
+            logger.debug(f"Streaming '{self.file_path}' in chunks of {chunk_rows} rows, averaging factor {factor}")
+
+            reader = pd.read_csv(
                 self.file_path,
                 sep=self.delimiter,
                 skiprows=self.skip_rows,
                 header=0,
-                **kwargs,
+                engine="c" if len(self.delimiter) == 1 else "python",
+                on_bad_lines="skip",
+                chunksize=chunk_rows,
+                **detected,
             )
+            parts, preview, columns, carry = [], None, None, None
+            for chunk in reader:
+                values = chunk.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+                if preview is None:
+                    columns = chunk.columns
+                    preview = RowBuffer(len(columns))
+                if carry is not None:
+                    values = np.vstack([carry, values])
+                complete = values.shape[0] - values.shape[0] % factor
+                carry = values[complete:]
+                parts.append(block_average(values[:complete], factor))
+                preview.append(block_minmax(values[:complete], factor))
+
+                partial = pd.DataFrame(preview.view(), columns=columns, copy=False)
+                if self.columns_names is not None and len(self.columns_names) == len(columns):
+                    partial.columns = self.columns_names
+                self.data_chunk_loaded_signal.emit(partial)
+                if QCoreApplication.instance() is not None:
+                    QCoreApplication.processEvents()
+
+            if carry is not None and len(carry):
+                parts.append(block_average(carry, len(carry)))
+            self.data = pd.DataFrame(np.concatenate(parts), columns=columns)
             self._fetch_data()
         except Exception as e:
-            logger.error(f"Error while loading TXT file: {e}")
-            console.log("\n\nError: Unable to load the TXT file.")
+            logger.error(f"Error while streaming file: {e}")
+            console.log("\n\nError: Unable to load the file in streaming mode.")
 
-    def _fetch_data(self):
-        """Finalize data loading with column processing and signal emission."""
+    def _fetch_data(self, from_cache: bool = False):
+        """Finalize data loading with column processing, caching and signal emission."""
         file_basename = os.path.basename(self.file_path)
 
-        if self.columns_names is not None:
+        if from_cache:
+            logger.debug("Loaded data from binary file cache; skipping column processing.")
+        elif self.columns_names is not None:
             if len(self.columns_names) != len(self.data.columns):
                 logger.warning("The number of user-provided column names does not match the dataset columns.")
             self.data = self.data.apply(pd.to_numeric, errors="coerce")
@@ -194,8 +401,14 @@ class FileData(BaseSlots):
         else:
             logger.debug("No custom column names provided; using file's header row as column names.")
 
-        self.original_data[file_basename] = self.data.copy()
-        self.dataframe_copies[file_basename] = self.data.copy()
+        if not from_cache:
+            self.file_cache.store(self.file_path, self._cache_options, self.data)
+
+        # pandas copy-on-write: working views share column buffers with the original
+        # until a column is replaced, so a loaded file is held in memory only once
+        self.original_data[file_basename] = self.data
+        self.recipes.pop(file_basename, None)
+        self._drop_cached_views(file_basename)
 
         buffer = StringIO()
         self.dataframe_copies[file_basename].info(buf=buffer)
@@ -217,49 +430,116 @@ class FileData(BaseSlots):
     def reset_dataframe_copy(self, key):
         """Reset dataframe copy to original state and clear operation history."""
         if key in self.original_data:
-            self.dataframe_copies[key] = self.original_data[key].copy()
+            self.recipes.pop(key, None)
+            self._drop_cached_views(key, recipe_hash=TransformationRecipe().hash)
             if key in self.operations_history:
                 del self.operations_history[key]
             logger.debug(f"Reset data for key '{key}' and cleared operations history.")
             console.log(f"\n\nData reset for '{key}'. Original state restored.")
 
-    def modify_data(self, func, params):
+    def _drop_cached_views(self, file_name: str, recipe_hash: str | None = None):
+        """Drop cached views of a file, optionally only the one for a given recipe."""
+        for key in [key for key in self.transformation_cache if key[0] == file_name]:
+            if recipe_hash is None or key[1] == recipe_hash:
+                del self.transformation_cache[key]
+
+    def materialize(self, file_name: str) -> pd.DataFrame:
         """
-        Apply transformation function to experimental data with operation logging.
+        Return the dataframe view for the file's current recipe, computing it if needed.
+
+        Steps are validated when they are added, so a failure here only comes from
+        a restored recipe. The most recent step is then dropped together with its
+        history entry, the user is told, and the previous view is returned.
+        """
+        recipe = self.recipes.get(file_name, TransformationRecipe())
+        try:
+            return self._cached_view(file_name, recipe)
+        except Exception as e:
+            logger.error(f"Error modifying data for file '{file_name}', dropping its last transformation: {e}")
+            console.log(f"\n\nError: the last transformation of '{file_name}' failed and was undone: {e}")
+            self.recipes[file_name] = TransformationRecipe(recipe[:-1])
+            if self.operations_history.get(file_name):
+                self.operations_history[file_name].pop()
+            return self.materialize(file_name)
+
+    def _cached_view(self, file_name: str, recipe: TransformationRecipe) -> pd.DataFrame:
+        """Return the cached view for a recipe, evaluating and caching it on a miss; evaluation errors propagate."""
+        key = (file_name, recipe.hash)
+        if key in self.transformation_cache:
+            self.transformation_cache.move_to_end(key)
+            return self.transformation_cache[key]
+
+        view = recipe.apply(self.original_data[file_name])
+        self.transformation_cache[key] = view
+        while len(self.transformation_cache) > TRANSFORMATION_CACHE_SIZE:
+            self.transformation_cache.popitem(last=False)
+        return view
+
+    def modify_data(self, func, params) -> bool:
+        """
+        Append transformation to the file's preprocessing recipe with operation logging.
 
         Modifies all numeric columns except 'temperature', preserving original data
         integrity. Logs operations for traceability and supports chained transformations
         like smoothing, background subtraction, and derivative calculations.
 
+        The extended recipe is evaluated here in one vectorized pass, so a failing
+        step is reported to the caller and never recorded. The result is cached per
+        recipe hash and serves the next data request.
+
         Parameters
         ----------
-        func : callable
-            Transformation function applied to each data column.
+        func : TransformationStep or callable
+            Vectorized step, or a function applied to each data column.
         params : dict
             Operation parameters including file_name for tracking.
+
+        Returns
+        -------
+        bool
+            True if the step was applied and recorded.
         """
         file_name = params.get("file_name")
         if not callable(func):
             logger.error("The provided 'func' is not callable.")
             console.log("\n\nError: Provided function is not callable.")
-            return
+            return False
 
-        if file_name not in self.dataframe_copies:
+        if file_name not in self.original_data:
             logger.error(f"Key '{file_name}' not found in dataframe_copies.")
             console.log("\n\nError: Cannot modify data as the file was not found in memory.")
-            return
+            return False
 
+        step = func if isinstance(func, TransformationStep) else TransformationStep("custom", function=func)
+        recipe = self.recipes.get(file_name, TransformationRecipe()).append(step)
         try:
-            dataframe = self.dataframe_copies[file_name]
-            for column in dataframe.columns:
-                if column != "temperature":
-                    dataframe[column] = func(dataframe[column])
-
-            self.log_operation(params)
-            logger.info("Data has been successfully modified.")
-
+            self._cached_view(file_name, recipe)
         except Exception as e:
             logger.error(f"Error modifying data for file '{file_name}': {e}")
+            console.log(f"\n\nError: the transformation of '{file_name}' failed and was not applied: {e}")
+            return False
+
+        self.recipes[file_name] = recipe
+        self.log_operation(params)
+        logger.info("Data transformation has been applied.")
+        return True
+
+    def export_state(self) -> dict:
+        """Return loaded files, transformation recipes and history for project saving."""
+        return {
+            "original_data": dict(self.original_data),
+            "recipes": {name: list(recipe) for name, recipe in self.recipes.items()},
+            "operations_history": self.operations_history,
+            "loaded_files": sorted(self.loaded_files),
+        }
+
+    def import_state(self, state: dict):
+        """Replace loaded files and recipes with a previously exported state."""
+        self.original_data = dict(state.get("original_data", {}))
+        self.recipes = {name: TransformationRecipe(steps) for name, steps in state.get("recipes", {}).items()}
+        self.operations_history = state.get("operations_history", {})
+        self.loaded_files = set(state.get("loaded_files", []))
+        self.transformation_cache.clear()
 
     def process_request(self, params: dict):  # noqa: C901
         """
@@ -281,17 +561,17 @@ class FileData(BaseSlots):
 
         logger.debug(f"{self.actor_name} processing request '{operation}' from '{actor}'")
 
-        if not file_name:
+        if not file_name and operation not in (OperationType.EXPORT_STATE, OperationType.IMPORT_STATE):
             logger.error("No 'file_name' specified in the request.")
             console.log("\n\nError: 'file_name' must be specified for the requested operation.")
             return
 
         if operation == OperationType.TO_A_T:
             if not self.check_operation_executed(file_name, OperationType.TO_A_T):
-                self.modify_data(func, params)
+                params["data"] = self.modify_data(func, params)
             else:
                 console.log("\nThe data has already been transformed to α(t).")
-            params["data"] = True
+                params["data"] = True
 
         elif operation == OperationType.TO_DTG:
             if not self.check_operation_executed(file_name, OperationType.TO_A_T):
@@ -299,10 +579,10 @@ class FileData(BaseSlots):
                 params["data"] = True
                 return
             if not self.check_operation_executed(file_name, OperationType.TO_DTG):
-                self.modify_data(func, params)
+                params["data"] = self.modify_data(func, params)
             else:
                 console.log("\n\nThe data has already been transformed (differential operation).")
-            params["data"] = True
+                params["data"] = True
 
         elif operation == OperationType.CHECK_OPERATION:
             checked_operation: OperationType = params.get("checked_operation")
@@ -317,7 +597,7 @@ class FileData(BaseSlots):
                 console.log(f"\n\nNo data found for file '{file_name}'.")
 
         elif operation == OperationType.GET_ALL_DATA:
-            params["data"] = self.dataframe_copies
+            params["data"] = dict(self.dataframe_copies)
 
         elif operation == OperationType.RESET_FILE_DATA:
             self.reset_dataframe_copy(file_name)
@@ -327,6 +607,13 @@ class FileData(BaseSlots):
             self.load_file(file_name)
             params["data"] = True
 
+        elif operation == OperationType.EXPORT_STATE:
+            params["data"] = self.export_state()
+
+        elif operation == OperationType.IMPORT_STATE:
+            self.import_state(params.get("state", {}))
+            params["data"] = True
+
         else:
             console.log(f"\n\nUnknown operation '{operation}'. No action taken.")
             return
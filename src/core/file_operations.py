@@ -2,11 +2,12 @@ import pandas as pd
 
 from src.core.app_settings import OperationType
 from src.core.base_signals import BaseSlots
+from src.core.file_transformations import TransformationStep
 from src.core.logger_config import logger
 
 
 class ActiveFileOperations(BaseSlots):
-    """Provides data transformation functions for experimental preprocessing."""
+    """Provides data transformation steps for experimental preprocessing."""
 
     def __init__(self, signals):
         super().__init__(actor_name="active_file_operations", signals=signals)
@@ -19,10 +20,10 @@ class ActiveFileOperations(BaseSlots):
         response = params.copy()
 
         if operation == OperationType.TO_DTG:
-            response["data"] = self.diff_function
+            response["data"] = TransformationStep("dtg")
 
-        if operation == OperationType.TO_A_T:
-            response["data"] = self.to_a_t_function
+        elif operation == OperationType.TO_A_T:
+            response["data"] = TransformationStep("to_a_t")
 
         else:
             logger.warning(f"{self.actor_name} received unknown operation '{operation}'")
@@ -0,0 +1,162 @@
+import hashlib
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+TEMPERATURE_COLUMN = "temperature"
+_step_serials = itertools.count()
+
+
+def to_a_t_kernel(temperature: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert mass columns to conversion α = (m₀ - m) / (m₀ - m_f); equal end masses give zeros."""
+    if values.shape[0] == 0:
+        return temperature, values
+    m0, mf = values[0], values[-1]
+    denominator = m0 - mf
+    safe = np.where(denominator == 0, 1.0, denominator)
+    return temperature, np.where(denominator == 0, 0.0, (m0 - values) / safe)
+
+
+def dtg_kernel(temperature: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """First difference along rows, NaN in the first row (same as ``Series.diff``)."""
+    result = np.empty_like(values)
+    result[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=result[1:])
+    return temperature, result
+
+
+def smooth_kernel(temperature: np.ndarray, values: np.ndarray, window: int = 5) -> tuple[np.ndarray, np.ndarray]:
+    """Centered moving average, edge-normalized so the ends are not biased towards zero."""
+    window = int(window)
+    n_rows = values.shape[0]
+    if window <= 1 or n_rows == 0:
+        return temperature, values
+    cumsum = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(np.nan_to_num(values), axis=0)])
+    rows = np.arange(n_rows)
+    lower = np.clip(rows - window // 2, 0, n_rows)
+    upper = np.clip(rows - window // 2 + window, 0, n_rows)
+    return temperature, (cumsum[upper] - cumsum[lower]) / (upper - lower)[:, None]
+
+
+def baseline_kernel(temperature: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Subtract the straight line through the first and last point of each column."""
+    if values.shape[0] < 2 or temperature[-1] == temperature[0]:
+        return temperature, values
+    slope = (values[-1] - values[0]) / (temperature[-1] - temperature[0])
+    baseline = values[0] + np.outer(temperature - temperature[0], slope)
+    return temperature, values - baseline
+
+
+def resample_kernel(temperature: np.ndarray, values: np.ndarray, n_points: int = 1000) -> tuple[np.ndarray, np.ndarray]:
+    """Linearly interpolate all columns onto a uniform temperature grid."""
+    order = np.argsort(temperature, kind="stable")
+    sorted_temperature = temperature[order]
+    grid = np.linspace(sorted_temperature[0], sorted_temperature[-1], int(n_points))
+    resampled = np.empty((len(grid), values.shape[1]))
+    for j in range(values.shape[1]):
+        resampled[:, j] = np.interp(grid, sorted_temperature, values[order, j])
+    return grid, resampled
+
+
+VECTORIZED_KERNELS: dict[str, Callable] = {
+    "to_a_t": to_a_t_kernel,
+    "dtg": dtg_kernel,
+    "smooth": smooth_kernel,
+    "baseline": baseline_kernel,
+    "resample": resample_kernel,
+}
+
+
+@dataclass(frozen=True)
+class TransformationStep:
+    """
+    Single lazy preprocessing step applied to every non-temperature column.
+
+    Named steps use the vectorized kernels in ``VECTORIZED_KERNELS``; any other
+    per-Series callable can be wrapped with ``name="custom"``. Steps are
+    callable on a single Series so they can be used where a column function
+    is expected. Custom steps are identified by a per-step serial number,
+    since the id of a collected function can be reused by a new one.
+    """
+
+    name: str
+    params: tuple = ()
+    function: Callable | None = field(default=None, compare=False)
+    serial: int = field(default_factory=lambda: next(_step_serials), compare=False, repr=False)
+
+    @property
+    def token(self) -> str:
+        """Stable identity of the step used in recipe hashes."""
+        if self.function is not None:
+            return f"{self.name}:{getattr(self.function, '__qualname__', repr(self.function))}:{self.serial}"
+        return f"{self.name}:{self.params!r}"
+
+    def apply(self, temperature: np.ndarray, values: np.ndarray, index: pd.Index) -> tuple[np.ndarray, np.ndarray]:
+        """Apply step to the column matrix (rows: samples, columns: series)."""
+        if self.function is not None:
+            result = np.empty_like(values)
+            for j in range(values.shape[1]):
+                result[:, j] = np.asarray(self.function(pd.Series(values[:, j], index=index)), dtype=float)
+            return temperature, result
+        return VECTORIZED_KERNELS[self.name](temperature, values, *self.params)
+
+    def __call__(self, series: pd.Series) -> pd.Series:
+        if series.empty:
+            return series
+        temperature = np.arange(len(series), dtype=float)
+        _, result = self.apply(temperature, series.to_numpy(dtype=float)[:, None], series.index)
+        return pd.Series(result[:, 0], index=series.index if len(result) == len(series) else None, name=series.name)
+
+
+class TransformationRecipe(tuple):
+    """Immutable ordered sequence of ``TransformationStep`` with a content hash."""
+
+    def __new__(cls, steps=()):
+        return super().__new__(cls, steps)
+
+    def append(self, step: TransformationStep) -> "TransformationRecipe":
+        return TransformationRecipe((*self, step))
+
+    @property
+    def hash(self) -> str:
+        return hashlib.sha1("|".join(step.token for step in self).encode()).hexdigest()
+
+    def apply(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evaluate all steps in one fused pass over a single column matrix.
+
+        Data columns are extracted once, every step operates on the whole
+        matrix, and the result frame is built once. The temperature column is
+        shared with the source frame unless a step resamples it.
+        """
+        if not self:
+            return dataframe.copy(deep=False)
+
+        data_columns = [column for column in dataframe.columns if column != TEMPERATURE_COLUMN]
+        has_temperature = TEMPERATURE_COLUMN in dataframe.columns
+        temperature = (
+            dataframe[TEMPERATURE_COLUMN].to_numpy(dtype=float)
+            if has_temperature
+            else np.arange(len(dataframe), dtype=float)
+        )
+        source_temperature = temperature
+        values = dataframe[data_columns].to_numpy(dtype=float, copy=True)
+
+        index = dataframe.index
+        for step in self:
+            temperature, values = step.apply(temperature, values, index)
+            if len(temperature) != len(index):
+                index = pd.RangeIndex(len(temperature))
+
+        resampled = temperature is not source_temperature
+        positions = {column: j for j, column in enumerate(data_columns)}
+        columns = {}
+        for column in dataframe.columns:
+            if column == TEMPERATURE_COLUMN:
+                columns[column] = pd.Series(temperature, index=index) if resampled else dataframe[column]
+            else:
+                columns[column] = pd.Series(values[:, positions[column]], index=index)
+        return pd.DataFrame(columns, index=index, copy=False)
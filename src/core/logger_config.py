@@ -82,6 +82,14 @@ class LoggerManager:
 
         cls._configured = True
 
+    @classmethod
+    def set_console_level(cls, level: int) -> None:
+        """Change the level of console output only; the log file keeps its own level."""
+        for handler in logging.getLogger(cls._root_logger_name).handlers:
+            # RotatingFileHandler is a StreamHandler subclass, so match the exact type
+            if type(handler) is logging.StreamHandler:
+                handler.setLevel(level)
+
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """
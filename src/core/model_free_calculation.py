@@ -1,15 +1,25 @@
 import warnings
+from itertools import combinations
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from scipy import integrate
 from scipy.constants import R
 from scipy.interpolate import interp1d
 
-from src.core.app_settings import NUC_MODELS_TABLE, PARAMETER_BOUNDS, OperationType
+from src.core.app_settings import (
+    MODEL_FREE_BOOTSTRAP_CONFIG,
+    MODEL_FREE_BOOTSTRAP_METHODS,
+    NUC_MODELS_TABLE,
+    PARAMETER_BOUNDS,
+    OperationType,
+)
 from src.core.base_signals import BaseSlots
 from src.core.logger_config import logger
 
+QUADRATURE_ORDER = 8
+
 
 class ModelFreeCalculation(BaseSlots):
     """
@@ -50,21 +60,19 @@ class ModelFreeCalculation(BaseSlots):
         }
 
         handler = operations_map.get(operation)
-        if handler is not None:
-            handler(calculation_params, response)
-        else:
+        if handler is None:
             logger.error(f"Unknown operation '{operation}' received by {self.actor_name}")
+        elif operation == OperationType.MODEL_FREE_CALCULATION and params.get("deferred_response"):
+            # Asynchronous callers get the result from a worker thread, with per-reaction progress
+            self.respond_later(response, handler, calculation_params, response, params)
+            return
+        else:
+            handler(calculation_params, response)
 
         self.signals.response_signal.emit(response)
 
-    def _handle_model_free_calculation(self, calculation_params: dict, response: dict):
-        fit_method = calculation_params.get("fit_method")
-        reaction_data = calculation_params.get("reaction_data")
-        FitMethod = self.strategies.get(fit_method)
-        if FitMethod is None:
-            logger.error(f"Unknown fit method: {fit_method}, \n\n{calculation_params=}")
-            return
-
+    @staticmethod
+    def _build_strategy_kwargs(fit_method: str, calculation_params: dict) -> dict:
         bounds_config = PARAMETER_BOUNDS.model_free
         kwargs = {
             "alpha_min": calculation_params.get("alpha_min", bounds_config.alpha_min),
@@ -80,14 +88,38 @@ class ModelFreeCalculation(BaseSlots):
                 # Use default bounds from configuration
                 kwargs["ea_min"] = bounds_config.ea_min
                 kwargs["ea_max"] = bounds_config.ea_max
+        elif fit_method == "Kissinger":
+            if calculation_params.get("max_peaks") is not None:
+                kwargs["max_peaks"] = calculation_params["max_peaks"]
         elif fit_method == "master plots":
             if calculation_params.get("ea_mean") is not None:
                 kwargs["ea_mean"] = calculation_params["ea_mean"] * 1000  #  kJ/mol to J/mol
 
-        strategy = FitMethod(**kwargs)
+        return kwargs
+
+    def _handle_model_free_calculation(self, calculation_params: dict, response: dict, request: dict | None = None):
+        fit_method = calculation_params.get("fit_method")
+        reaction_data = calculation_params.get("reaction_data")
+        FitMethod = self.strategies.get(fit_method)
+        if FitMethod is None:
+            logger.error(f"Unknown fit method: {fit_method}, \n\n{calculation_params=}")
+            return
+
+        strategy = FitMethod(**self._build_strategy_kwargs(fit_method, calculation_params))
+
+        bootstrap_params = calculation_params.get("bootstrap")
+        if bootstrap_params is not None and fit_method in MODEL_FREE_BOOTSTRAP_METHODS:
+            strategy = IsoconversionalBootstrap(strategy, **bootstrap_params)
+            logger.info(f"Running bootstrap for '{fit_method}' with {strategy.n_resamples} resamples")
 
         result_data = {}
-        for reaction_name, reaction_df in reaction_data.items():
+        for i, (reaction_name, reaction_df) in enumerate(reaction_data.items()):
+            if request is not None:
+                if self.signals.is_cancelled(request["request_id"]):
+                    logger.info(f"Model-free calculation '{fit_method}' was cancelled")
+                    return
+                self.report_progress(request, {"reaction": reaction_name, "fraction": i / len(reaction_data)})
+
             if fit_method == "master plots":
                 if reaction_name != calculation_params.get("reaction_n"):
                     continue
@@ -260,54 +292,197 @@ class Friedman:
 
 
 class Kissinger:
-    def __init__(self, alpha_min: float, alpha_max: float):
+    """
+    Kissinger peak method with sub-sample peak localization.
+
+    Peak temperatures are located for all heating-rate columns at once and refined
+    between samples with a three-point parabolic fit, so the raw data does not need
+    upsampling. Up to `max_peaks` peaks per curve are matched to the peaks of a
+    reference curve by nearest temperature, so a curve missing a peak does not shift
+    the others, and each peak group gets its own ln(β/Tₚ²) vs 1/Tₚ regression.
+    """
+
+    def __init__(self, alpha_min: float, alpha_max: float, max_peaks: int = 1, min_peak_height: float = 0.1):
         self.alpha_min = alpha_min
         self.alpha_max = alpha_max
+        self.max_peaks = max_peaks
+        self.min_peak_height = min_peak_height
 
     def calculate(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
         return self.fetch_kissinger_Ea(reaction_df)
 
-    def fetch_kissinger_Ea(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
-        rate_cols = [col for col in reaction_df.columns if col != "temperature"]
-
-        temperature_K = reaction_df["temperature"]
-
-        peak_points = []
-        for col in rate_cols:
-            series = reaction_df[col]
+    @staticmethod
+    def refine_peaks(temperature: np.ndarray, values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """Refine peak positions with the vertex of a parabola through each peak and its neighbours.
+
+        Args:
+            temperature: Temperature array of shape (n,).
+            values: Rate matrix of shape (n, k).
+            idx: Integer peak indices of shape (p, k), clipped to interior samples.
+
+        Returns:
+            Refined peak temperatures of shape (p, k).
+        """
+        cols = np.arange(values.shape[1])
+        x0, x1, x2 = temperature[idx - 1], temperature[idx], temperature[idx + 1]
+        y0, y1, y2 = values[idx - 1, cols], values[idx, cols], values[idx + 1, cols]
+
+        # Parabola in coordinates centered on the sampled peak
+        d0, d2 = x0 - x1, x2 - x1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a = ((y2 - y1) / d2 - (y0 - y1) / d0) / (d2 - d0)
+            b = (y2 - y1) / d2 - a * d2
+            shift = -b / (2 * a)
+
+        valid = (a < 0) & np.isfinite(shift) & (shift >= d0) & (shift <= d2)
+        return np.where(valid, x1 + shift, x1)
 
-            valid = series.notna() & temperature_K.notna()
-            if valid.sum() == 0:
+    @staticmethod
+    def match_peaks(T_peaks: np.ndarray, found: np.ndarray, betas: np.ndarray) -> np.ndarray:
+        """Assign the peaks of every curve to the peaks of a reference curve by nearest temperature.
+
+        The reference is the curve with the most peaks; among those, the one with the heating
+        rate closest to the median keeps the temperature shifts to the other curves small. Each
+        curve's peaks go to distinct reference peaks in temperature order, choosing the
+        assignment with the smallest total temperature distance.
+
+        Args:
+            T_peaks: Peak temperatures of shape (p, k), sorted by temperature per column.
+            found: Mask of shape (p, k); detected peaks come first in each column.
+            betas: Heating rates of shape (k,).
+
+        Returns:
+            Reference peak number of every entry, shape (p, k); -1 where no peak was found.
+        """
+        counts = found.sum(axis=0)
+        groups = np.full(found.shape, -1)
+        if counts.size == 0 or counts.max() == 0:
+            return groups
+
+        candidates = np.flatnonzero(counts == counts.max())
+        reference = candidates[np.argmin(np.abs(betas[candidates] - np.median(betas)))]
+        reference_T = T_peaks[: counts[reference], reference]
+
+        for col, n in enumerate(counts):
+            if n == 0:
                 continue
+            T = T_peaks[:n, col]
+            assignment = min(
+                combinations(range(len(reference_T)), n),
+                key=lambda ref_peaks: np.abs(reference_T[list(ref_peaks)] - T).sum(),
+            )
+            groups[:n, col] = assignment
+        return groups
 
-            cum = series[valid].cumsum()
-            conv = cum / cum.iloc[-1]
+    def fetch_kissinger_peaks(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
+        """Locate up to `max_peaks` peaks for every heating-rate column.
 
-            idx_peak = series.idxmax()
-            T_peak = temperature_K.loc[idx_peak]
-            alpha_peak = conv.loc[idx_peak]
-            beta_val = float(col)
-            peak_points.append((beta_val, T_peak, alpha_peak))
+        Returns:
+            pd.DataFrame: One row per detected peak with peak index, beta, T_peak and conversion.
+        """
+        rate_cols = [col for col in reaction_df.columns if col != "temperature"]
+        temperature = reaction_df["temperature"].to_numpy(dtype=float)
+        values = reaction_df[rate_cols].to_numpy(dtype=float, copy=True)
+        values[~np.isfinite(temperature)] = np.nan
+
+        filled = np.where(np.isfinite(values), values, -np.inf)
+        is_peak = np.zeros_like(values, dtype=bool)
+        is_peak[1:-1] = (filled[1:-1] > filled[:-2]) & (filled[1:-1] >= filled[2:])
+        is_peak &= filled >= self.min_peak_height * np.nanmax(values, axis=0)
+
+        # Keep the highest peaks of each column, then order them by temperature
+        ranked = np.argsort(np.where(is_peak, -filled, np.inf), axis=0, kind="stable")[: self.max_peaks]
+        found = np.take_along_axis(is_peak, ranked, axis=0)
+        idx = np.sort(np.where(found, ranked, len(temperature)), axis=0)
+        found = idx < len(temperature)
+        idx = np.clip(idx, 1, len(temperature) - 2)
+
+        T_peaks = self.refine_peaks(temperature, filled, idx)
+
+        cum = np.nancumsum(np.nan_to_num(values, nan=0.0), axis=0)
+        conv = cum / cum[-1]
+        cols = np.arange(values.shape[1])
+        step = np.where(T_peaks >= temperature[idx], 1, -1)
+        neighbour = idx + step
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = (T_peaks - temperature[idx]) / (temperature[neighbour] - temperature[idx])
+        frac = np.nan_to_num(frac)
+        alpha_peaks = conv[idx, cols] + (conv[neighbour, cols] - conv[idx, cols]) * frac
+
+        betas = np.array([float(col) for col in rate_cols])
+        groups = self.match_peaks(T_peaks, found, betas)
+        peak_n, col_n = np.nonzero(found)
+        return pd.DataFrame(
+            {
+                "peak": groups[peak_n, col_n],
+                "beta": betas[col_n],
+                "T_peak": T_peaks[peak_n, col_n],
+                "conversion": alpha_peaks[peak_n, col_n],
+            }
+        )
 
-        peak_points.sort(key=lambda x: x[2])
+    @staticmethod
+    def fetch_kissinger_regression(peaks_df: pd.DataFrame) -> pd.DataFrame:
+        """Fit ln(β/Tₚ²) = ln(AR/Ea) - Ea/(R·Tₚ) for every peak group.
+
+        Returns:
+            pd.DataFrame: One row per peak with Ea, its standard error, log_A, r2 and n_points.
+        """
+        rows = []
+        for peak, group in peaks_df.groupby("peak"):
+            X = 1.0 / group["T_peak"].to_numpy()
+            Y = np.log(group["beta"].to_numpy() / group["T_peak"].to_numpy() ** 2)
+            n = len(X)
+            if n < 2:
+                continue
 
-        beta_vals = np.array([pt[0] for pt in peak_points], dtype=float)
-        T_peaks = np.array([pt[1] for pt in peak_points], dtype=float)
-        alphas = np.array([pt[2] for pt in peak_points], dtype=float)
+            x_mean, y_mean = X.mean(), Y.mean()
+            sxx = ((X - x_mean) ** 2).sum()
+            slope = ((X - x_mean) * (Y - y_mean)).sum() / sxx
+            intercept = y_mean - slope * x_mean
+            residuals = Y - (slope * X + intercept)
+            ss_res = (residuals**2).sum()
+            ss_tot = ((Y - y_mean) ** 2).sum()
+
+            stderr = np.sqrt(ss_res / (n - 2) / sxx) if n > 2 else np.nan
+            E_a = -slope * R
+            rows.append(
+                {
+                    "peak": peak,
+                    "Ea": E_a,
+                    "Ea_stderr": stderr * R,
+                    "log_A": np.log10(E_a / R) + intercept / np.log(10),
+                    "r2": 1 - ss_res / ss_tot if ss_tot > 0 else 1.0,
+                    "n_points": n,
+                }
+            )
+        return pd.DataFrame(rows, columns=["peak", "Ea", "Ea_stderr", "log_A", "r2", "n_points"])
 
-        # X = 1/Tₚ, Y = ln(β / Tₚ²)
-        X = 1.0 / T_peaks
-        Y = np.log(beta_vals / (T_peaks**2))
-        slope, intercept = np.polyfit(X, Y, 1)
-        E_a = -slope * R
+    def fetch_kissinger_Ea(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
+        peaks_df = self.fetch_kissinger_peaks(reaction_df)
+        regression_df = self.fetch_kissinger_regression(peaks_df)
 
-        result_df = pd.DataFrame({"conversion": alphas, "Kissinger_Ea": [E_a] * len(alphas)})
+        peaks_df = peaks_df.merge(regression_df[["peak", "Ea"]], on="peak").sort_values("conversion")
+        result_df = pd.DataFrame(
+            {"conversion": peaks_df["conversion"].to_numpy(), "Kissinger_Ea": peaks_df["Ea"].to_numpy()}
+        )
+        result_df.attrs["regression"] = regression_df
         return result_df
 
     def prepare_plot_data(self, df: pd.DataFrame):
-        mean_kissinger = df["Kissinger_Ea"].mean()
-        std_kissinger = df["Kissinger_Ea"].std()
-        annotation = r"$Kissinger = {:.0f}, std = {:.0f}$".format(mean_kissinger, std_kissinger)
+        regression_df = df.attrs.get("regression")
+        if regression_df is not None and not regression_df.empty:
+            lines = [
+                r"Kissinger_{{{}}} = {:.0f}, SE = {:.0f}, R^2 = {:.4f}".format(
+                    int(row.peak), row.Ea, row.Ea_stderr, row.r2
+                )
+                for row in regression_df.itertuples()
+            ]
+            annotation = "$" + r" \n ".join(lines) + "$"
+        else:
+            mean_kissinger = df["Kissinger_Ea"].mean()
+            std_kissinger = df["Kissinger_Ea"].std()
+            annotation = r"$Kissinger = {:.0f}, std = {:.0f}$".format(mean_kissinger, std_kissinger)
         plot_kwargs = {
             "title": "Kissinger Method: Ea vs Conversion",
             "xlabel": "α",
@@ -324,9 +499,25 @@ class Vyazovkin:
         self.alpha_max = alpha_max
         self.ea_min = ea_min if ea_min is not None else bounds_config.ea_min
         self.ea_max = ea_max if ea_max is not None else bounds_config.ea_max
-        self.ea_max = ea_max
 
-    def calculate(self, reaction_df: pd.DataFrame) -> pd.DataFrame:  # noqa: C901
+    @staticmethod
+    def temperature_integrals(candidate_Ea: np.ndarray, T_matrix: np.ndarray, dT: float) -> np.ndarray:
+        """Evaluate ∫exp(-Ea/RT)dT over [T - dT, T] for every Ea, α and β at once.
+
+        Uses fixed-order Gauss-Legendre quadrature in log space. Integrals are scaled by a
+        common factor per (Ea, α) pair, which leaves the Vyazovkin ratios unchanged and keeps
+        high Ea values away from underflow.
+
+        Returns:
+            Array of shape (len(candidate_Ea), n_alpha, n_beta).
+        """
+        nodes, weights = np.polynomial.legendre.leggauss(QUADRATURE_ORDER)
+        T_nodes = T_matrix[..., np.newaxis] - dT / 2 + (dT / 2) * nodes
+        log_integrand = -candidate_Ea[:, np.newaxis, np.newaxis, np.newaxis] / (R * T_nodes)
+        log_integrand -= np.nanmax(log_integrand, axis=(-2, -1), keepdims=True)
+        return np.exp(log_integrand) @ weights
+
+    def calculate(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
         beta_cols = [col for col in reaction_df.columns if col != "temperature"]
 
         conv_df = pd.DataFrame()
@@ -342,46 +533,21 @@ class Vyazovkin:
 
         conv_grid = np.linspace(self.alpha_min, self.alpha_max, 100)
 
-        T_matrix = {}
-        for col in beta_cols:
-            T_matrix[col] = f_funcs[col](conv_grid)
-
-        beta_vals = {col: float(col) for col in beta_cols}
+        T_matrix = np.column_stack([f_funcs[col](conv_grid) for col in beta_cols])
+        beta_vals = np.array([float(col) for col in beta_cols])
 
         dT = reaction_df["temperature"].diff().mean()
 
-        def integrand(T, Ea):
-            return np.exp(-Ea / (R * T))
-
-        def I_func(Ea, T, dT):
-            integral, _ = integrate.quad(integrand, T - dT, T, args=(Ea,))
-            return integral
-
-        def vyazovkin_lhs(Ea, dT, pairs):
-            n = len(pairs)
-            sum_ratio = 0.0
-            for i in range(n):
-                T_i, beta_i = pairs[i]
-                for j in range(n):
-                    if i != j:
-                        T_j, beta_j = pairs[j]
-                        I_i = I_func(Ea, T_i, dT)
-                        I_j = I_func(Ea, T_j, dT)
-                        sum_ratio += (beta_j / beta_i) * (I_i / I_j)
-            result = (n * (n - 1) - sum_ratio) * -1
-            return result
-
         candidate_Ea = np.arange(self.ea_min, self.ea_max + 1, 1000)
-        estimated_Ea = []
+        I_values = self.temperature_integrals(candidate_Ea, T_matrix, dT)
 
-        for idx, alpha in enumerate(conv_grid):
-            pairs = []
-            for col in beta_cols:
-                pairs.append((T_matrix[col][idx], beta_vals[col]))
-            f_vals = [abs(vyazovkin_lhs(Ea, dT, pairs)) for Ea in candidate_Ea]
-            best_index = np.argmin(f_vals)
-            best_Ea = candidate_Ea[best_index]
-            estimated_Ea.append(best_Ea)
+        # Σ_{i≠j} (β_j/β_i)·(I_i/I_j) = Σ_i (I_i/β_i) · Σ_j (β_j/I_j) - n
+        n = len(beta_cols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sum_ratio = (I_values / beta_vals).sum(axis=-1) * (beta_vals / I_values).sum(axis=-1) - n
+        f_vals = np.abs(sum_ratio - n * (n - 1))
+        f_vals = np.where(np.isfinite(f_vals), f_vals, np.inf)
+        estimated_Ea = candidate_Ea[np.argmin(f_vals, axis=0)]
 
         result_df = pd.DataFrame({"conversion": conv_grid, "Vyazovkin": estimated_Ea})
         return result_df
@@ -535,3 +701,118 @@ class MasterPlots:
         }
 
         return df, plot_kwargs
+
+
+def _smooth_columns(values: np.ndarray, window: int) -> np.ndarray:
+    """Centered moving average per column, leaving NaN positions untouched."""
+    if window <= 1:
+        return values.copy()
+    kernel = np.ones(window)
+    smoothed = np.full_like(values, np.nan)
+    for c in range(values.shape[1]):
+        finite = np.isfinite(values[:, c])
+        if finite.sum() >= window:
+            weights = np.convolve(np.ones(finite.sum()), kernel, mode="same")
+            smoothed[finite, c] = np.convolve(values[finite, c], kernel, mode="same") / weights
+        else:
+            smoothed[finite, c] = values[finite, c]
+    return smoothed
+
+
+def _repeated_rate_label(label: str, taken: dict) -> str:
+    """Distinct column label for a repeated heating-rate draw that still parses to the same β."""
+    digits = 6
+    while f"{float(label):.{digits}f}" in taken:
+        digits += 1
+    return f"{float(label):.{digits}f}"
+
+
+def _bootstrap_replicate(strategy, temperature, smoothed, residuals, rate_cols, noise_scale, seed) -> pd.DataFrame:
+    """Run one bootstrap replicate: resample heating rates and residual noise, then re-fit."""
+    rng = np.random.default_rng(seed)
+    n_rates = len(rate_cols)
+
+    # Case resampling of heating rates with replacement; a rate drawn twice enters the regression twice,
+    # each time with its own residual noise. The regression needs at least two distinct β.
+    columns = np.arange(n_rates)
+    if n_rates > 2:
+        columns = rng.integers(0, n_rates, n_rates)
+        while len(np.unique(columns)) < 2:
+            columns = rng.integers(0, n_rates, n_rates)
+
+    replicate = {"temperature": temperature}
+    for c in np.sort(columns):
+        finite = np.isfinite(residuals[:, c])
+        noise = np.zeros(len(temperature))
+        if finite.any():
+            noise[finite] = rng.choice(residuals[finite, c], size=finite.sum(), replace=True)
+        label = rate_cols[c] if rate_cols[c] not in replicate else _repeated_rate_label(rate_cols[c], replicate)
+        replicate[label] = smoothed[:, c] + noise_scale * noise
+
+    return strategy.calculate(pd.DataFrame(replicate))
+
+
+class IsoconversionalBootstrap:
+    """
+    Bootstrap confidence bands for isoconversional Ea(α).
+
+    Wraps LinearApproximation, Friedman or Vyazovkin strategy. Each replicate resamples the
+    heating-rate columns with replacement and the residual noise around a smoothed rate
+    curve, then re-runs the wrapped method. Replicates are distributed over a process pool; per-α percentiles
+    of the replicate Ea give the confidence band around the point estimate.
+    """
+
+    def __init__(
+        self,
+        strategy,
+        n_resamples: int = None,
+        confidence_level: float = None,
+        noise_scale: float = None,
+        smoothing_window: int = None,
+        workers: int = None,
+        seed=None,
+    ):
+        config = MODEL_FREE_BOOTSTRAP_CONFIG
+        self.strategy = strategy
+        self.n_resamples = n_resamples if n_resamples is not None else config.n_resamples
+        self.confidence_level = confidence_level if confidence_level is not None else config.confidence_level
+        self.noise_scale = noise_scale if noise_scale is not None else config.noise_scale
+        self.smoothing_window = smoothing_window if smoothing_window is not None else config.smoothing_window
+        self.workers = workers if workers is not None else config.workers
+        self.seed = seed if seed is not None else config.seed
+
+    def calculate(self, reaction_df: pd.DataFrame) -> pd.DataFrame:
+        base_df = self.strategy.calculate(reaction_df)
+        conv_grid = base_df["conversion"].to_numpy()
+        method_cols = [col for col in base_df.columns if col != "conversion"]
+
+        rate_cols = [col for col in reaction_df.columns if col != "temperature"]
+        temperature = reaction_df["temperature"].to_numpy(dtype=float)
+        values = reaction_df[rate_cols].to_numpy(dtype=float)
+        smoothed = _smooth_columns(values, self.smoothing_window)
+        residuals = values - smoothed
+
+        seeds = np.random.SeedSequence(self.seed).spawn(self.n_resamples)
+        args = (self.strategy, temperature, smoothed, residuals, rate_cols, self.noise_scale)
+        if self.workers == 1:
+            replicates = [_bootstrap_replicate(*args, seed) for seed in seeds]
+        else:
+            replicates = Parallel(n_jobs=self.workers)(delayed(_bootstrap_replicate)(*args, seed) for seed in seeds)
+
+        tail = 100 * (1 - self.confidence_level) / 2
+        result_df = base_df.copy()
+        for col in method_cols:
+            samples = np.vstack(
+                [np.interp(conv_grid, rep["conversion"], rep[col], left=np.nan, right=np.nan) for rep in replicates]
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                lower, upper = np.nanpercentile(samples, [tail, 100 - tail], axis=0)
+            result_df[f"{col}_lower"] = lower
+            result_df[f"{col}_upper"] = upper
+
+        logger.debug(f"Bootstrap finished: {self.n_resamples} resamples, confidence level {self.confidence_level}")
+        return result_df
+
+    def prepare_plot_data(self, df: pd.DataFrame):
+        return self.strategy.prepare_plot_data(df)
@@ -0,0 +1,121 @@
+import datetime
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.core.app_settings import OPTIMIZATION_PROGRESS_CONFIG
+
+
+class BestResultSlot:
+    """
+    Thread-safe single-entry mailbox for best-so-far optimizer results.
+
+    Optimizer threads ``offer`` results from inside the objective or callback;
+    only results improving on everything offered so far are kept, and a newer
+    improvement replaces the pending one. The GUI thread ``take``s the pending
+    result at its own pace, so publishing never blocks on GUI work and memory
+    stays bounded to a single result. When a ``history`` is given, every stored
+    improvement is also recorded there by the offering thread, so improvements
+    superseded between two takes still appear in the convergence plot.
+    """
+
+    def __init__(self, score_key: str = "best_mse", history: Optional["MseHistory"] = None):
+        self.score_key = score_key
+        self.history = history
+        self._lock = threading.Lock()
+        self._pending: Optional[dict] = None
+        self._best = float("inf")
+
+    @property
+    def best(self) -> float:
+        """Lowest score offered since the last reset."""
+        return self._best
+
+    def offer(self, result: dict) -> bool:
+        """Store result if its score beats every earlier offer; returns True when stored."""
+        score = result.get(self.score_key)
+        if score is None:
+            return False
+        with self._lock:
+            if not score < self._best:
+                return False
+            self._best = score
+            self._pending = result
+        if self.history is not None:
+            self.history.append((datetime.datetime.now(), score))
+        return True
+
+    def take(self) -> Optional[dict]:
+        """Return and clear the pending result, or None when nothing new was offered."""
+        with self._lock:
+            result, self._pending = self._pending, None
+        return result
+
+    def reset(self) -> None:
+        """Drop the pending result and forget the best score before a new run."""
+        with self._lock:
+            self._pending = None
+            self._best = float("inf")
+
+
+class MseHistory:
+    """
+    Fixed-capacity, thread-safe history of optimizer scores over wall-clock time.
+
+    Each point holds a timestamp, a best score and an optional population mean
+    (NaN when unknown) in preallocated arrays. When the buffer is full every
+    second point is dropped while the newest point is kept, so the history
+    always spans the whole run at a gradually coarser resolution and memory
+    stays bounded. ``version`` changes on every modification, letting readers
+    skip redraws when nothing was added.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = max(int(capacity or OPTIMIZATION_PROGRESS_CONFIG.history_capacity), 2)
+        self._lock = threading.Lock()
+        self._times = np.empty(self.capacity, dtype="datetime64[us]")
+        self._best = np.empty(self.capacity)
+        self._mean = np.empty(self.capacity)
+        self._size = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yield (datetime, best) pairs, the layout of the former list-based history."""
+        times, best, _ = self.arrays()
+        return iter(list(zip(times.tolist(), best.tolist())))
+
+    def append(self, entry: tuple) -> None:
+        """Add a (timestamp, best) or (timestamp, best, mean) point, decimating when full."""
+        timestamp, best, *rest = entry
+        mean = rest[0] if rest else np.nan
+        with self._lock:
+            if self._size == self.capacity:
+                self._decimate()
+            self._times[self._size] = np.datetime64(timestamp, "us")
+            self._best[self._size] = best
+            self._mean[self._size] = mean
+            self._size += 1
+            self.version += 1
+
+    def _decimate(self) -> None:
+        keep = np.arange(0, self._size, 2)
+        if keep[-1] != self._size - 1:
+            keep = np.append(keep, self._size - 1)
+        for column in (self._times, self._best, self._mean):
+            column[: keep.size] = column[keep]
+        self._size = keep.size
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return copies of (timestamps as datetime64, best scores, population means)."""
+        with self._lock:
+            size = self._size
+            return self._times[:size].copy(), self._best[:size].copy(), self._mean[:size].copy()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._size = 0
+            self.version += 1
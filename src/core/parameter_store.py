@@ -0,0 +1,202 @@
+from numbers import Real
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+import numpy as np
+
+Path = Tuple[str, ...]
+
+COEFFICIENT_GROUPS = ("lower_bound_coeffs", "coeffs", "upper_bound_coeffs")
+COEFFICIENT_NAMES = ("h", "z", "w", "fr", "ads1", "ads2")
+_GROUP_INDEX = {name: i for i, name in enumerate(COEFFICIENT_GROUPS)}
+_COEFFICIENT_INDEX = {name: i for i, name in enumerate(COEFFICIENT_NAMES)}
+
+
+def _coefficient_cell(path: Path) -> tuple[Path, int, int] | None:
+    """Return (reaction path, group row, coefficient column) for coefficient leaf paths."""
+    if len(path) == 4 and path[2] in _GROUP_INDEX and path[3] in _COEFFICIENT_INDEX:
+        return path[:2], _GROUP_INDEX[path[2]], _COEFFICIENT_INDEX[path[3]]
+    return None
+
+
+def _readonly(value: Any) -> Any:
+    if isinstance(value, np.ndarray) and value.flags.writeable:
+        value = value.view()
+        value.flags.writeable = False
+    return value
+
+
+def _build_nested(path: Path, children: Mapping[Path, Mapping[str, None]], leaves: Mapping[Path, Any]) -> Any:
+    """Rebuild a fresh nested dict for the subtree rooted at path."""
+    if path in leaves:
+        return leaves[path]
+    return {key: _build_nested(path + (key,), children, leaves) for key in children.get(path, ())}
+
+
+class ParameterSnapshot:
+    """
+    Immutable view of the parameter store at a given version.
+
+    Leaves are held in a read-only flat mapping keyed by path tuples; arrays
+    are read-only views. Coefficient columns are float64 matrices of shape
+    ``(len(COEFFICIENT_GROUPS), len(COEFFICIENT_NAMES))`` per reaction, with
+    NaN for coefficients that are not set.
+    """
+
+    __slots__ = ("version", "leaves", "_children", "_columns")
+
+    def __init__(self, version: int, leaves: dict, children: dict, columns: dict):
+        self.version = version
+        self.leaves: Mapping[Path, Any] = MappingProxyType(leaves)
+        self._children = MappingProxyType(children)
+        self._columns = MappingProxyType(columns)
+
+    def get(self, path: Iterable[str]) -> Any:
+        """Return value at path as a fresh nested structure, or {} when missing."""
+        path = tuple(path)
+        if path not in self.leaves and path not in self._children:
+            return {}
+        return _build_nested(path, self._children, self.leaves)
+
+    def keys(self, path: Iterable[str] = ()) -> list[str]:
+        """Return child keys of an internal node in insertion order."""
+        return list(self._children.get(tuple(path), ()))
+
+    def reaction_columns(self, file_name: str, reaction_name: str) -> np.ndarray:
+        """Return read-only coefficient matrix (rows: COEFFICIENT_GROUPS, columns: COEFFICIENT_NAMES)."""
+        columns = self._columns.get((file_name, reaction_name))
+        if columns is None:
+            columns = np.full((len(COEFFICIENT_GROUPS), len(COEFFICIENT_NAMES)), np.nan)
+            columns.flags.writeable = False
+        return columns
+
+    def coefficient_vector(self, file_name: str, group: str = "coeffs") -> np.ndarray:
+        """Return one coefficient group of every reaction in a file as a (n_reactions, n_coeffs) matrix."""
+        row = _GROUP_INDEX[group]
+        reactions = self.keys((file_name,))
+        if not reactions:
+            return np.empty((0, len(COEFFICIENT_NAMES)))
+        return np.vstack([self.reaction_columns(file_name, reaction)[row] for reaction in reactions])
+
+
+class ParameterStore:
+    """
+    Flat, path-indexed storage for reaction parameters.
+
+    Leaf values are indexed by their full path tuple, so reads and writes do
+    not walk nested dicts. Internal nodes only keep ordered child keys. Numeric
+    coefficients at ``(file, reaction, <group>, <name>)`` are mirrored into a
+    typed float64 matrix per reaction. Every mutation bumps ``version`` and
+    records the changed path in a dirty set that consumers drain with
+    ``take_dirty``.
+    """
+
+    def __init__(self):
+        self._leaves: Dict[Path, Any] = {}
+        self._children: Dict[Path, Dict[str, None]] = {(): {}}
+        self._columns: Dict[Path, np.ndarray] = {}
+        self._dirty: set[Path] = set()
+        self._snapshot: ParameterSnapshot | None = None
+        self.version = 0
+
+    def _touch(self, path: Path) -> None:
+        self._dirty.add(path)
+        self._snapshot = None
+        self.version += 1
+
+    def _ensure_node(self, path: Path) -> None:
+        """Create internal nodes along path, replacing leaves that are in the way."""
+        for depth in range(len(path) + 1):
+            node = path[:depth]
+            if node in self._leaves:
+                self._drop_leaf(node)
+            if node not in self._children:
+                self._children[node] = {}
+                self._children[node[:-1]][node[-1]] = None
+
+    def _drop_leaf(self, path: Path) -> None:
+        del self._leaves[path]
+        cell = _coefficient_cell(path)
+        if cell is not None and cell[0] in self._columns:
+            self._columns[cell[0]][cell[1], cell[2]] = np.nan
+
+    def _drop_subtree(self, path: Path) -> None:
+        if path in self._leaves:
+            self._drop_leaf(path)
+            return
+        for key in self._children.pop(path, ()):
+            self._drop_subtree(path + (key,))
+        self._columns.pop(path, None)
+
+    def _insert(self, path: Path, value: Any) -> None:
+        if isinstance(value, dict):
+            self._ensure_node(path)
+            for key, item in value.items():
+                self._insert(path + (key,), item)
+            return
+        self._ensure_node(path[:-1])
+        self._children[path[:-1]][path[-1]] = None
+        self._leaves[path] = _readonly(value)
+        cell = _coefficient_cell(path)
+        if cell is not None and isinstance(value, Real) and not isinstance(value, bool):
+            reaction, row, column = cell
+            if reaction not in self._columns:
+                self._columns[reaction] = np.full((len(COEFFICIENT_GROUPS), len(COEFFICIENT_NAMES)), np.nan)
+            self._columns[reaction][row, column] = float(value)
+
+    def exists(self, path: Iterable[str]) -> bool:
+        path = tuple(path)
+        return path in self._leaves or path in self._children
+
+    def get(self, path: Iterable[str]) -> Any:
+        """Return leaf value or a freshly built nested dict for an internal node; {} when missing."""
+        path = tuple(path)
+        if path in self._leaves:
+            return self._leaves[path]
+        if path not in self._children:
+            return {}
+        return _build_nested(path, self._children, self._leaves)
+
+    def set(self, path: Iterable[str], value: Any) -> None:
+        """Store value at path, replacing any previous leaf or subtree there."""
+        path = tuple(path)
+        if not path:
+            return
+        if self.exists(path):
+            # Parent keeps the key in place, so overwriting does not reorder siblings
+            self._drop_subtree(path)
+        self._insert(path, value)
+        self._touch(path)
+
+    def remove(self, path: Iterable[str]) -> bool:
+        """Delete value or subtree at path; returns False when the path does not exist."""
+        path = tuple(path)
+        if not path or not self.exists(path):
+            return False
+        self._drop_subtree(path)
+        self._children[path[:-1]].pop(path[-1], None)
+        self._touch(path)
+        return True
+
+    def clear(self) -> None:
+        self._leaves.clear()
+        self._children = {(): {}}
+        self._columns.clear()
+        self._touch(())
+
+    def snapshot(self) -> ParameterSnapshot:
+        """Return an immutable snapshot; reused until the next mutation."""
+        if self._snapshot is None:
+            columns = {}
+            for reaction, matrix in self._columns.items():
+                frozen = matrix.copy()
+                frozen.flags.writeable = False
+                columns[reaction] = frozen
+            children = {path: MappingProxyType(dict(keys)) for path, keys in self._children.items()}
+            self._snapshot = ParameterSnapshot(self.version, dict(self._leaves), children, columns)
+        return self._snapshot
+
+    def take_dirty(self) -> frozenset[Path]:
+        """Return and reset the set of paths changed since the previous call."""
+        dirty, self._dirty = frozenset(self._dirty), set()
+        return dirty
@@ -0,0 +1,235 @@
+import json
+import os
+import zipfile
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+from src.core.app_settings import OperationType
+from src.core.file_transformations import TransformationStep
+from src.core.logger_config import logger
+from src.core.series_data import ExperimentalSeries
+
+PROJECT_FORMAT_VERSION = 1
+PROJECT_METADATA_NAME = "project.json"
+PROJECT_FILE_EXTENSION = ".otk"
+PROJECT_ENUMS = {"OperationType": OperationType}
+
+
+class ProjectWriter:
+    """
+    Serializer of nested session state into a single zip project file.
+
+    Numeric arrays are stored as uncompressed ``.npy`` members so they can be
+    memory-mapped directly from the archive on load; everything else goes into
+    one JSON document where arrays are replaced with member references.
+    """
+
+    def __init__(self):
+        self.arrays: dict[str, np.ndarray] = {}
+
+    def _add_array(self, array: np.ndarray) -> dict:
+        name = f"arrays/{len(self.arrays)}.npy"
+        self.arrays[name] = np.ascontiguousarray(array)
+        return {"__ndarray__": name}
+
+    def encode(self, value):  # noqa: C901
+        """Convert value to a JSON-compatible structure, moving arrays aside."""
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind in "biufc":
+                return self._add_array(value)
+            return {"__list_array__": [self.encode(item) for item in value.tolist()]}
+        if isinstance(value, pd.DataFrame):
+            return {
+                "__dataframe__": {
+                    "columns": [self.encode(col) for col in value.columns],
+                    "index": self.encode(value.index.to_numpy()),
+                    "data": [self.encode(value[col].to_numpy()) for col in value.columns],
+                }
+            }
+        if isinstance(value, ExperimentalSeries):
+            return {
+                "__experimental_series__": {
+                    "temperature": self._add_array(value.temperature),
+                    "betas": self._add_array(value.betas),
+                    "masses": self._add_array(value.masses),
+                    "rate_columns": list(value.rate_columns),
+                }
+            }
+        if isinstance(value, TransformationStep):
+            if value.function is not None:
+                raise TypeError(f"Custom transformation '{value.token}' cannot be saved to a project")
+            return {"__step__": [value.name, self.encode(value.params)]}
+        if isinstance(value, Enum):
+            return {"__enum__": [type(value).__name__, value.name]}
+        if isinstance(value, datetime):
+            return {"__datetime__": value.isoformat()}
+        if isinstance(value, tuple):
+            return {"__tuple__": [self.encode(item) for item in value]}
+        if isinstance(value, (list, set)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value):
+                return {key: self.encode(item) for key, item in value.items()}
+            return {"__dict__": [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        if isinstance(value, np.generic):
+            return value.item()
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise TypeError(f"Unsupported value in project state: {type(value).__name__}")
+
+
+class ProjectReader:
+    """Deserializer of project files; arrays are memory-mapped from the archive when lazy."""
+
+    def __init__(self, path: str, lazy: bool = True):
+        self.path = path
+        self.lazy = lazy
+        self._archive = zipfile.ZipFile(path, "r")
+
+    def close(self):
+        self._archive.close()
+
+    def _read_array(self, name: str) -> np.ndarray:
+        info = self._archive.getinfo(name)
+        if self.lazy and info.compress_type == zipfile.ZIP_STORED:
+            with open(self.path, "rb") as f:
+                # Local file header: fixed 30 bytes, then name and extra field of variable length
+                f.seek(info.header_offset + 26)
+                name_length, extra_length = np.frombuffer(f.read(4), dtype="<u2")
+                f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                offset = f.tell()
+            if dtype.hasobject:
+                raise ValueError(f"Object array member '{name}' is not supported")
+            if int(np.prod(shape)) == 0:
+                return np.empty(shape, dtype=dtype)
+            order = "F" if fortran_order else "C"
+            return np.memmap(self.path, dtype=dtype, mode="c", offset=offset, shape=shape, order=order)
+        with self._archive.open(name) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    def decode(self, value):  # noqa: C901
+        """Rebuild Python objects from the JSON structure written by ``ProjectWriter``."""
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "__ndarray__" in value:
+            return self._read_array(value["__ndarray__"])
+        if "__list_array__" in value:
+            return np.array(self.decode(value["__list_array__"]), dtype=object)
+        if "__dataframe__" in value:
+            frame = value["__dataframe__"]
+            columns = self.decode(frame["columns"])
+            data = dict(zip(columns, self.decode(frame["data"])))
+            return pd.DataFrame(data, index=self.decode(frame["index"]), columns=columns, copy=False)
+        if "__experimental_series__" in value:
+            fields = value["__experimental_series__"]
+            arrays = [self.decode(fields[key]) for key in ("temperature", "betas", "masses")]
+            for array in arrays:
+                array.flags.writeable = False
+            return ExperimentalSeries(*arrays, tuple(fields["rate_columns"]))
+        if "__step__" in value:
+            name, params = value["__step__"]
+            return TransformationStep(name, tuple(self.decode(params)))
+        if "__enum__" in value:
+            enum_name, member = value["__enum__"]
+            return PROJECT_ENUMS[enum_name][member]
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__tuple__" in value:
+            return tuple(self.decode(value["__tuple__"]))
+        if "__dict__" in value:
+            return {self.decode(key): self.decode(item) for key, item in value["__dict__"]}
+        return {key: self.decode(item) for key, item in value.items()}
+
+    def read(self) -> dict:
+        with self._archive.open(PROJECT_METADATA_NAME) as member:
+            metadata = json.load(member)
+        if metadata.get("version", 0) > PROJECT_FORMAT_VERSION:
+            raise ValueError(f"Project format version {metadata['version']} is newer than supported")
+        return self.decode(metadata["state"])
+
+
+def save_project(path: str, state: dict) -> None:
+    """
+    Write session state (files, series, reactions, results, optimizer state) to one file.
+
+    The archive is written to a temporary file and moved into place, so an
+    interrupted save never corrupts an existing project.
+    """
+    writer = ProjectWriter()
+    metadata = {"version": PROJECT_FORMAT_VERSION, "state": writer.encode(state)}
+
+    tmp_path = path + ".tmp"
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+            archive.writestr(PROJECT_METADATA_NAME, json.dumps(metadata))
+            for name, array in writer.arrays.items():
+                with archive.open(name, "w", force_zip64=array.nbytes > 2**31) as member:
+                    np.lib.format.write_array(member, array, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logger.debug(f"Project saved to '{path}' with {len(writer.arrays)} arrays")
+
+
+def is_memory_mapped(array: np.ndarray) -> bool:
+    """Return True when array or any array it is a view of is a memory map."""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base if isinstance(array, np.ndarray) else None
+    return False
+
+
+def load_into_memory(value):
+    """
+    Return session state with every memory-mapped array replaced by an in-memory copy.
+
+    Lazily opened projects keep their arrays mapped from the project file, and
+    Windows refuses to replace a file that is still mapped, so the state must be
+    read into memory before it is saved over the project it was opened from.
+    """
+    if isinstance(value, np.ndarray):
+        return np.array(value) if is_memory_mapped(value) else value
+    if isinstance(value, pd.DataFrame):
+        frame = value.copy(deep=True)
+        # A deep copy still shares the index values
+        if is_memory_mapped(frame.index.to_numpy()):
+            frame.index = pd.Index(np.array(frame.index.to_numpy()), name=frame.index.name)
+        return frame
+    if isinstance(value, ExperimentalSeries):
+        arrays = [load_into_memory(getattr(value, key)) for key in ("temperature", "betas", "masses")]
+        for array in arrays:
+            array.flags.writeable = False
+        return ExperimentalSeries(*arrays, value.rate_columns)
+    if isinstance(value, dict):
+        return {key: load_into_memory(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(load_into_memory(item) for item in value)
+    return value
+
+
+def load_project(path: str, lazy: bool = True) -> dict:
+    """
+    Read session state written by ``save_project``.
+
+    With ``lazy=True`` numeric arrays are copy-on-write memory maps into the
+    project file, so only the pages that are actually used are read. Pass the
+    state through ``load_into_memory`` before saving over the same file.
+    """
+    reader = ProjectReader(path, lazy=lazy)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
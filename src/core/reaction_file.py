@@ -0,0 +1,121 @@
+import base64
+import hashlib
+import json
+from typing import Any, Dict
+
+import numpy as np
+
+REACTIONS_FORMAT = "open_thermokinetics.reactions"
+REACTIONS_FORMAT_VERSION = 2
+ARRAY_REFERENCE_KEY = "__array__"
+
+
+def encode_array(array: np.ndarray) -> dict:
+    """
+    Encode a 1-D numeric array as a compact JSON object.
+
+    Arrays that are exactly reproduced by ``np.linspace`` are stored as a range
+    (start, stop, num); anything else is stored as base64 of little-endian
+    float64 bytes.
+    """
+    array = np.asarray(array, dtype=np.float64)
+    if array.ndim == 1 and array.size >= 2:
+        grid = np.linspace(array[0], array[-1], array.size)
+        if np.array_equal(grid, array):
+            return {"range": [float(array[0]), float(array[-1]), int(array.size)]}
+    data = np.ascontiguousarray(array, dtype="<f8")
+    return {"shape": list(data.shape), "data": base64.b64encode(data.tobytes()).decode("ascii")}
+
+
+def decode_array(encoded: dict) -> np.ndarray:
+    """Rebuild an array written by ``encode_array``."""
+    if "range" in encoded:
+        start, stop, num = encoded["range"]
+        return np.linspace(start, stop, int(num))
+    data = np.frombuffer(base64.b64decode(encoded["data"]), dtype="<f8")
+    return data.reshape(encoded["shape"]).astype(np.float64)
+
+
+def pack_reactions(data: Dict[str, Any]) -> dict:
+    """
+    Convert reaction data to the packed export structure.
+
+    Every array in the reaction tree is written once to a shared ``arrays``
+    table and replaced by ``{"__array__": index}``; reactions sharing the same
+    temperature axis therefore reference a single entry.
+    """
+    arrays: list[dict] = []
+    indices: dict[str, int] = {}
+
+    def pack(value):
+        if isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value, dtype=np.float64)
+            digest = hashlib.sha1(array.tobytes() + str(array.shape).encode()).hexdigest()
+            if digest not in indices:
+                indices[digest] = len(arrays)
+                arrays.append(encode_array(array))
+            return {ARRAY_REFERENCE_KEY: indices[digest]}
+        if isinstance(value, dict):
+            return {key: pack(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [pack(item) for item in value]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    packed = pack(data)
+    return {"format": REACTIONS_FORMAT, "version": REACTIONS_FORMAT_VERSION, "arrays": arrays, "reactions": packed}
+
+
+def unpack_reactions(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a loaded JSON document to reaction data with numpy arrays.
+
+    Accepts both the packed format and the legacy layout where every reaction
+    stores its own ``x`` list. Identical arrays are shared between reactions
+    in both cases.
+    """
+    if payload.get("format") == REACTIONS_FORMAT:
+        if payload.get("version", 0) > REACTIONS_FORMAT_VERSION:
+            raise ValueError(f"Reactions file version {payload['version']} is newer than supported")
+        arrays = [decode_array(encoded) for encoded in payload.get("arrays", [])]
+
+        def unpack(value):
+            if isinstance(value, dict):
+                if ARRAY_REFERENCE_KEY in value and len(value) == 1:
+                    return arrays[value[ARRAY_REFERENCE_KEY]]
+                return {key: unpack(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [unpack(item) for item in value]
+            return value
+
+        return unpack(payload["reactions"])
+
+    return _unpack_legacy_reactions(payload)
+
+
+def _unpack_legacy_reactions(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert per-reaction ``x`` lists to numpy arrays, reusing one array for equal lists."""
+    shared: list[tuple[list, np.ndarray]] = []
+    for reaction_data in payload.values():
+        if not isinstance(reaction_data, dict) or "x" not in reaction_data:
+            continue
+        x_values = reaction_data["x"]
+        array = next((array for source, array in shared if source == x_values), None)
+        if array is None:
+            array = np.array(x_values)
+            shared.append((x_values, array))
+        reaction_data["x"] = array
+    return payload
+
+
+def read_reactions_file(path: str) -> Dict[str, Any]:
+    """Read reaction data from a packed or legacy JSON reactions file."""
+    with open(path, "r", encoding="utf-8") as file:
+        return unpack_reactions(json.load(file))
+
+
+def write_reactions_file(path: str, data: Dict[str, Any], indent: int | None = None) -> None:
+    """Write reaction data to a packed JSON reactions file."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(pack_reactions(data), file, ensure_ascii=False, indent=indent)
@@ -1,9 +1,186 @@
+from dataclasses import dataclass
 from functools import reduce
 from typing import Any, Optional
 
+import numpy as np
+import pandas as pd
+
 from src.core.app_settings import OPTIMIZATION_CONFIG, PARAMETER_BOUNDS, OperationType
 from src.core.base_signals import BaseSlots
+from src.core.curve_fitting import CurveFitting as cft
 from src.core.logger_config import logger
+from src.core.logger_console import LoggerConsole as console
+
+
+def build_series_dataframe(curves: dict[str, pd.DataFrame], temperature_grid: np.ndarray = None) -> pd.DataFrame:
+    """
+    Resample heating-rate curves onto one common temperature grid in a single pass.
+
+    Each curve is sorted by temperature and linearly interpolated with
+    ``np.interp`` into a preallocated 2-D float array. Without an explicit
+    grid, an evenly spaced grid is built over the temperature range shared by
+    all curves (their union if they do not overlap), with as many points as
+    the longest curve. Rows with non-numeric or non-finite values are dropped.
+
+    Parameters
+    ----------
+    curves : dict[str, pd.DataFrame]
+        Heating-rate column name -> frame with 'temperature' and one data column.
+    temperature_grid : np.ndarray, optional
+        Target temperatures; derived automatically when omitted.
+
+    Returns
+    -------
+    pd.DataFrame
+        'temperature' followed by one column per heating rate, backed by one array.
+
+    Raises
+    ------
+    ValueError
+        If a curve has no finite rows left.
+    """
+    prepared = []
+    for rate, df in curves.items():
+        data_column = [col for col in df.columns if col.lower() != "temperature"][-1]
+        xy = df[["temperature", data_column]].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        xy = xy[np.isfinite(xy).all(axis=1)]
+        if len(xy) == 0:
+            raise ValueError(f"Heating rate '{rate}' has no rows with numeric temperature and '{data_column}' values.")
+        xy = xy[np.argsort(xy[:, 0], kind="stable")]
+        prepared.append((rate, xy[:, 0], xy[:, 1]))
+
+    if temperature_grid is None:
+        lower = max(t[0] for _, t, _ in prepared)
+        upper = min(t[-1] for _, t, _ in prepared)
+        if lower >= upper:
+            lower = min(t[0] for _, t, _ in prepared)
+            upper = max(t[-1] for _, t, _ in prepared)
+        temperature_grid = np.linspace(lower, upper, max(len(t) for _, t, _ in prepared))
+
+    values = np.empty((len(temperature_grid), len(prepared) + 1))
+    values[:, 0] = temperature_grid
+    for j, (_, temperature, signal) in enumerate(prepared, start=1):
+        values[:, j] = np.interp(temperature_grid, temperature, signal)
+
+    return pd.DataFrame(values, columns=["temperature", *(rate for rate, _, _ in prepared)])
+
+
+def deconvolution_reactions(experimental_data: pd.DataFrame, deconvolution_results: dict) -> tuple[list[str], set[str]]:
+    """
+    Find the reactions deconvolved for every heating rate of a series.
+
+    Heating rates without a matching experimental column are skipped.
+
+    Returns
+    -------
+    tuple[list[str], set[str]]
+        Reactions present for all heating rates, sorted by number, and reactions missing for some of them.
+    """
+    experimental_columns = [float(col) for col in experimental_data.columns if col != "temperature"]
+    reactions_per_key = {}
+
+    for key, reaction_data in deconvolution_results.items():
+        if float(key) not in experimental_columns:
+            logger.error(f"Missing corresponding data for key: {float(key)} in {experimental_columns=}")
+            console.log(f"Missing corresponding data for key: {float(key)} in {experimental_columns=}")
+            continue
+        reactions_per_key[key] = set(reaction_data.keys())
+
+    common_reactions = set.intersection(*reactions_per_key.values()) if reactions_per_key else set()
+    logger.debug(f"common_reactions: {common_reactions}")
+    all_reactions = {reaction for reactions_set in reactions_per_key.values() for reaction in reactions_set}
+    missing_reactions = all_reactions - common_reactions
+
+    if missing_reactions:
+        logger.error(f"The following reactions do not appear in all keys: {missing_reactions}")
+        console.log(f"The following reactions do not appear in all keys: {missing_reactions}")
+
+    return sorted(common_reactions, key=lambda x: int(x.split("_")[1])), missing_reactions
+
+
+def build_reaction_dataframe(
+    experimental_data: pd.DataFrame, deconvolution_results: dict, reaction_n: str = "reaction_0"
+) -> pd.DataFrame:
+    """
+    Evaluate one deconvolved reaction for every heating rate over the series temperature range.
+
+    Returns
+    -------
+    pd.DataFrame
+        One column per heating-rate key of ``deconvolution_results`` and 'temperature',
+        sampled on the 250-point grid of ``CurveFitting.calculate_reaction``.
+    """
+    temperatures = experimental_data["temperature"]
+    x_range = (np.min(temperatures), np.max(temperatures))
+    fitted_data = {}
+    for key, result in deconvolution_results.items():
+        reaction_data = result.get(reaction_n)
+        if reaction_data:
+            function_type = reaction_data.get("function")
+            coeffs = reaction_data.get("coeffs", {})
+            if function_type in ("gauss", "fraser", "ads"):
+                keys = cft._get_allowed_keys_for_type(function_type)
+                fitted_data[key] = cft.calculate_reaction(
+                    (x_range, function_type, tuple(coeffs.get(name, 0) for name in keys))
+                )
+            else:
+                fitted_data[key] = np.zeros_like(temperatures)
+
+    # 250 depends on cft.calculate_reaction
+    fitted_data["temperature"] = np.linspace(*x_range, 250)
+    return pd.DataFrame(fitted_data)
+
+
+@dataclass(frozen=True)
+class ExperimentalSeries:
+    """
+    Array-backed experimental data of a series, built once when the series is added.
+
+    Attributes
+    ----------
+    temperature : np.ndarray
+        Temperature grid in °C, shape (n_points,).
+    betas : np.ndarray
+        Heating rates in K/min, shape (n_rates,).
+    masses : np.ndarray
+        Contiguous signal matrix, one row per heating rate, shape (n_rates, n_points).
+    rate_columns : tuple[str, ...]
+        Original column names of the heating rates.
+    """
+
+    temperature: np.ndarray
+    betas: np.ndarray
+    masses: np.ndarray
+    rate_columns: tuple[str, ...]
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "ExperimentalSeries":
+        """Build from a frame with 'temperature' and one numeric-named column per heating rate."""
+        rate_columns = tuple(col for col in df.columns if col.lower() != "temperature")
+        try:
+            betas = np.array([float(col) for col in rate_columns])
+        except ValueError as e:
+            raise ValueError(f"Heating-rate columns must be numeric, got {list(rate_columns)}") from e
+
+        temperature = np.array(df["temperature"], dtype=float)
+        masses = np.ascontiguousarray(df[list(rate_columns)].to_numpy(dtype=float).T)
+        for array in (temperature, betas, masses):
+            array.flags.writeable = False
+        return cls(temperature, betas, masses, rate_columns)
+
+    @property
+    def temperature_kelvin(self) -> np.ndarray:
+        return self.temperature + 273.15
+
+    def mass_rows(self) -> list[np.ndarray]:
+        """Per-heating-rate signal views into the mass matrix (no copies)."""
+        return list(self.masses)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Frame view whose columns share memory with the arrays."""
+        columns = {"temperature": self.temperature}
+        columns.update(zip(self.rate_columns, self.masses))
+        return pd.DataFrame(columns, copy=False)
 
 
 class SeriesData(BaseSlots):
@@ -105,6 +282,13 @@ class SeriesData(BaseSlots):
             else:
                 r["data"] = self.get_value(keys)
 
+        def handle_export_state(p: dict, r: dict) -> None:
+            r["data"] = self.export_state()
+
+        def handle_import_state(p: dict, r: dict) -> None:
+            self.import_state(p.get("state", {}))
+            r["data"] = True
+
         operations_map = {
             OperationType.ADD_NEW_SERIES: handle_add_new_series,
             OperationType.DELETE_SERIES: handle_delete_series,
@@ -114,6 +298,8 @@ class SeriesData(BaseSlots):
             OperationType.SCHEME_CHANGE: handle_scheme_change,
             OperationType.UPDATE_SERIES: handle_update_series,
             OperationType.GET_SERIES_VALUE: handle_get_series_value,
+            OperationType.EXPORT_STATE: handle_export_state,
+            OperationType.IMPORT_STATE: handle_import_state,
         }
 
         handler = operations_map.get(operation)
@@ -173,6 +359,8 @@ class SeriesData(BaseSlots):
         ----------
         data : Any
             Experimental data (typically DataFrame with multiple heating rates).
+            DataFrames are converted once to an ``ExperimentalSeries`` and the
+            stored frame becomes a zero-copy view of its arrays.
         experimental_masses : list[float]
             Mass coefficients for each heating rate experiment.
         name : str, optional
@@ -202,8 +390,16 @@ class SeriesData(BaseSlots):
             ],
         }
 
+        experimental_arrays = None
+        if isinstance(data, pd.DataFrame):
+            try:
+                experimental_arrays = ExperimentalSeries.from_dataframe(data)
+            except ValueError as e:
+                logger.warning(f"Keeping experimental data of '{name}' as DataFrame only: {e}")
+
         self.series[name] = {
-            "experimental_data": data,
+            "experimental_data": experimental_arrays.to_dataframe() if experimental_arrays is not None else data,
+            "experimental_arrays": experimental_arrays,
             "experimental_masses": experimental_masses,
             "reaction_scheme": reaction_scheme,
             "calculation_settings": {
@@ -315,6 +511,8 @@ class SeriesData(BaseSlots):
 
         if info_type == "experimental":
             return series_entry.get("experimental_data", None)
+        elif info_type == "arrays":
+            return series_entry.get("experimental_arrays", None)
         elif info_type == "scheme":
             return series_entry.get("reaction_scheme", None)
         elif info_type == "all":
@@ -323,6 +521,25 @@ class SeriesData(BaseSlots):
             logger.warning(f"Unknown info_type='{info_type}'. Returning all data by default.")
             return series_entry.copy()
 
+    def export_state(self) -> dict:
+        """Return all series for project saving; array-backed frames are stored only once."""
+        series = {}
+        for name, entry in self.series.items():
+            entry = dict(entry)
+            if entry.get("experimental_arrays") is not None:
+                entry.pop("experimental_data", None)
+            series[name] = entry
+        return {"series": series, "default_name_counter": self.default_name_counter}
+
+    def import_state(self, state: dict):
+        """Replace all series with a previously exported state."""
+        self.series = {}
+        for name, entry in state.get("series", {}).items():
+            if entry.get("experimental_arrays") is not None:
+                entry["experimental_data"] = entry["experimental_arrays"].to_dataframe()
+            self.series[name] = entry
+        self.default_name_counter = state.get("default_name_counter", 1)
+
     def get_all_series(self):
         """Return copy of all series data."""
         return self.series.copy()
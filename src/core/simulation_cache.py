@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from src.core.app_settings import SIMULATION_CACHE_CONFIG
+from src.core.logger_config import logger
+from src.core.series_data import ExperimentalSeries
+
+# Reaction fields that change the simulated curves; ranges only matter to the optimizer
+SIMULATION_REACTION_FIELDS = ("from", "to", "reaction_type", "allowed_models", "Ea", "log_A", "contribution")
+
+
+def simulation_key(reaction_scheme: dict, experimental_data: ExperimentalSeries) -> str:
+    """
+    Build a cache key from everything a model-based simulation depends on.
+
+    Covers the scheme topology, per-reaction model and kinetic parameters, the
+    heating rates, the temperature grid and the experimental masses, which set
+    the mass scale of the simulated curves and their MSE.
+    """
+    identity = {
+        "components": [component.get("id") for component in reaction_scheme.get("components", [])],
+        "reactions": [
+            {field: reaction.get(field) for field in SIMULATION_REACTION_FIELDS}
+            for reaction in reaction_scheme.get("reactions", [])
+        ],
+    }
+    digest = hashlib.sha1(json.dumps(identity, sort_keys=True, default=str).encode())
+    for array in (experimental_data.betas, experimental_data.temperature, experimental_data.masses):
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class SimulationCache:
+    """
+    Thread-safe LRU cache of simulated mass curves and their MSE.
+
+    Entries are evicted in least-recently-used order once the total size of
+    the cached frames exceeds ``max_bytes``; a single result larger than the
+    budget is not cached.
+    """
+
+    def __init__(
+        self, max_bytes: int = SIMULATION_CACHE_CONFIG.max_bytes, enabled: bool = SIMULATION_CACHE_CONFIG.enabled
+    ):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries: OrderedDict[str, tuple[pd.DataFrame, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[pd.DataFrame, float] | None:
+        """Return (simulation frame, total MSE) and mark the entry as recently used, or None on miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        simulation_df, total_mse, _ = entry
+        return simulation_df.copy(), total_mse
+
+    def put(self, key: str, simulation_df: pd.DataFrame, total_mse: float) -> None:
+        """Store a simulation result, evicting least recently used entries beyond the memory budget."""
+        if not self.enabled:
+            return
+        size = int(simulation_df.memory_usage(index=True, deep=False).sum())
+        if size > self.max_bytes:
+            logger.debug(f"Simulation result of {size} bytes exceeds the cache budget; not cached")
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[2]
+            self._entries[key] = (simulation_df.copy(), total_mse, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
@@ -46,6 +46,7 @@ def main():
     window.main_tab.sidebar.load_button.file_selected.connect(file_data.load_file)
     window.main_tab.sidebar.chosen_experiment_signal.connect(file_data.plot_dataframe_copy)
     file_data.data_loaded_signal.connect(window.main_tab.plot_canvas.plot_data_from_dataframe)
+    file_data.data_chunk_loaded_signal.connect(window.main_tab.plot_canvas.plot_data_from_dataframe)
     calculations_data_operations.reaction_params_to_gui.connect(window.main_tab.plot_canvas.add_anchors)
     calculations_data_operations.plot_reaction.connect(window.main_tab.plot_canvas.plot_reaction)
     calculations_data_operations.deconvolution_signal.connect(calculations.run_calculation_scenario)
@@ -39,9 +39,10 @@ class AnchorGroup:
         h_upper, z_upper, _ = upper_params[:3]
         h_lower, z_lower, _ = lower_params[:3]
 
-        (self.center,) = self.axes.plot(z_center, h_center, "ko", picker=5)
-        (self.upper_bound,) = self.axes.plot(z_upper, h_upper, "ro", picker=5)
-        (self.lower_bound,) = self.axes.plot(z_lower, h_lower, "ro", picker=5)
+        # Anchors are animated: the canvas blits them over its cached background
+        (self.center,) = self.axes.plot(z_center, h_center, "ko", picker=5, animated=True)
+        (self.upper_bound,) = self.axes.plot(z_upper, h_upper, "ro", picker=5, animated=True)
+        (self.lower_bound,) = self.axes.plot(z_lower, h_lower, "ro", picker=5, animated=True)
 
     def set_center_position(self, x, y):
         """
@@ -55,13 +56,13 @@ class AnchorGroup:
         dx = x - self.center.get_xdata()[0]
         dy = y - self.center.get_ydata()[0]
 
-        self.center.set_xdata(x)
-        self.center.set_ydata(y)
+        self.center.set_xdata([x])
+        self.center.set_ydata([y])
 
-        self.upper_bound.set_xdata(self.upper_bound.get_xdata()[0] + dx)
-        self.upper_bound.set_ydata(self.upper_bound.get_ydata()[0] + dy)
-        self.lower_bound.set_xdata(self.lower_bound.get_xdata()[0] + dx)
-        self.lower_bound.set_ydata(self.lower_bound.get_ydata()[0] + dy)
+        self.upper_bound.set_xdata([self.upper_bound.get_xdata()[0] + dx])
+        self.upper_bound.set_ydata([self.upper_bound.get_ydata()[0] + dy])
+        self.lower_bound.set_xdata([self.lower_bound.get_xdata()[0] + dx])
+        self.lower_bound.set_ydata([self.lower_bound.get_ydata()[0] + dy])
 
     def set_bound_position(self, bound, x, y):
         """
@@ -79,8 +80,8 @@ class AnchorGroup:
         elif bound == self.lower_bound and y >= self.center.get_ydata()[0]:
             y = self.center.get_ydata()[0] - 0.1
 
-        bound.set_xdata(x)
-        bound.set_ydata(y)
+        bound.set_xdata([x])
+        bound.set_ydata([y])
 
         if bound == self.upper_bound:
             opposite_bound = self.lower_bound
@@ -89,8 +90,8 @@ class AnchorGroup:
             opposite_bound = self.upper_bound
             dy = self.center.get_ydata()[0] - y
 
-        opposite_bound.set_xdata(x)
-        opposite_bound.set_ydata(self.center.get_ydata()[0] - dy)
+        opposite_bound.set_xdata([x])
+        opposite_bound.set_ydata([self.center.get_ydata()[0] - dy])
 
     def log_anchor_positions(self):
         """Log current positions of all three anchors for debugging."""
@@ -157,13 +158,13 @@ class PositionAnchorGroup(AnchorGroup):
         """
         dx = x - self.center.get_xdata()[0]
 
-        self.center.set_xdata(x)
-        self.center.set_ydata(0)
+        self.center.set_xdata([x])
+        self.center.set_ydata([0])
 
-        self.upper_bound.set_xdata(self.upper_bound.get_xdata()[0] + dx)
-        self.upper_bound.set_ydata(0)
-        self.lower_bound.set_xdata(self.lower_bound.get_xdata()[0] + dx)
-        self.lower_bound.set_ydata(0)
+        self.upper_bound.set_xdata([self.upper_bound.get_xdata()[0] + dx])
+        self.upper_bound.set_ydata([0])
+        self.lower_bound.set_xdata([self.lower_bound.get_xdata()[0] + dx])
+        self.lower_bound.set_ydata([0])
 
     def set_bound_position(self, bound, x):
         """
@@ -179,8 +180,8 @@ class PositionAnchorGroup(AnchorGroup):
         elif bound == self.lower_bound and x >= self.center.get_xdata()[0]:
             x = self.center.get_xdata()[0] - 0.1
 
-        bound.set_xdata(x)
-        bound.set_ydata(0)
+        bound.set_xdata([x])
+        bound.set_ydata([0])
 
         if bound == self.upper_bound:
             opposite_bound = self.lower_bound
@@ -189,8 +190,8 @@ class PositionAnchorGroup(AnchorGroup):
             opposite_bound = self.upper_bound
             dx = self.center.get_xdata()[0] - x
 
-        opposite_bound.set_xdata(self.center.get_xdata()[0] - dx)
-        opposite_bound.set_ydata(0)
+        opposite_bound.set_xdata([self.center.get_xdata()[0] - dx])
+        opposite_bound.set_ydata([0])
 
 
 class HeightAnchorGroup(AnchorGroup):
@@ -237,14 +238,14 @@ class HeightAnchorGroup(AnchorGroup):
         elif bound == self.lower_bound and y >= self.center.get_ydata()[0]:
             y = self.center.get_ydata()[0] - 0.1
 
-        bound.set_ydata(y)
+        bound.set_ydata([y])
 
         # Update opposite bound symmetrically relative to the center
         if bound == self.upper_bound:
             opposite_bound = self.lower_bound
             dy = y - self.center.get_ydata()[0]
-            opposite_bound.set_ydata(self.center.get_ydata()[0] - dy)
+            opposite_bound.set_ydata([self.center.get_ydata()[0] - dy])
         else:
             opposite_bound = self.upper_bound
             dy = self.center.get_ydata()[0] - y
-            opposite_bound.set_ydata(self.center.get_ydata()[0] + dy)
+            opposite_bound.set_ydata([self.center.get_ydata()[0] + dy])
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
 
@@ -23,6 +23,19 @@ class PlotCanvasConfig:
     FILL_ALPHA: float = None
     FILL_COLOR: str = None
 
+    # Rendering configurations
+    FRAME_INTERVAL_MS: int = 16
+    LOD_MIN_POINTS: int = 2000
+
+    # Convergence plot configurations
+    MSE_LINE_CONFIG: Dict[str, Dict[str, object]] = field(
+        default_factory=lambda: {
+            "mse_line": {"color": "red", "marker": "o", "linestyle": "-", "label": "best so far"},
+            "generation_best": {"color": "tab:blue", "linewidth": 0.75, "label": "generation best"},
+            "generation_mean": {"color": "tab:blue", "linewidth": 0.75, "linestyle": "--", "label": "generation mean"},
+        }
+    )
+
     def __post_init__(self):
         """Initialize default values."""
         if self.PLOT_STYLE is None:
@@ -0,0 +1,61 @@
+"""
+Level-of-detail reduction for PlotCanvas curves.
+Keeps the per-pixel minimum and maximum of large curves so drawing cost follows screen width.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def is_decimatable(x: np.ndarray, y: np.ndarray) -> bool:
+    """Return True for numeric 1-D curves of equal length with non-decreasing x."""
+    if x.ndim != 1 or x.shape != y.shape or x.dtype.kind not in "iuf" or y.dtype.kind not in "iuf":
+        return False
+    return bool(np.all(np.diff(x) >= 0))
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, x_min: float, x_max: float, n_bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a curve sorted by x to at most two samples per pixel column.
+
+    Samples inside [x_min, x_max] are grouped into n_bins equal-width columns and
+    only the minimum and maximum of every column are kept, in their original
+    order, so the drawn envelope matches the full-resolution curve. One sample
+    on each side of the view is kept so the line runs to the plot edges.
+
+    Args:
+        x: Sorted x values.
+        y: y values matching x.
+        x_min: Left edge of the visible range.
+        x_max: Right edge of the visible range.
+        n_bins: Number of pixel columns of the view.
+
+    Returns:
+        tuple: Reduced (x, y); a slice of the input when no reduction is needed.
+    """
+    x_min, x_max = sorted((x_min, x_max))
+    start = max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+    stop = min(int(np.searchsorted(x, x_max, side="right")) + 1, x.size)
+    x_view, y_view = x[start:stop], y[start:stop]
+    size = x_view.size
+    if n_bins < 1 or size <= 2 * n_bins:
+        return x_view, y_view
+
+    edges = np.linspace(x_min, x_max, n_bins + 1)[1:-1]
+    starts = np.unique(np.concatenate(([0], np.searchsorted(x_view, edges, side="left"))))
+    starts = starts[starts < size]
+    counts = np.diff(np.append(starts, size))
+    index = np.arange(size)
+
+    keep = [np.array([0, size - 1])]
+    for reduce in (np.fmin, np.fmax):
+        extreme = np.repeat(reduce.reduceat(y_view, starts), counts)
+        # First sample of each column reaching the extreme; NaN-only columns yield `size` and are dropped
+        candidates = np.where(y_view == extreme, index, size)
+        keep.append(np.minimum.reduceat(candidates, starts))
+    keep = np.unique(np.concatenate(keep))
+    keep = keep[keep < size]
+    return x_view[keep], y_view[keep]
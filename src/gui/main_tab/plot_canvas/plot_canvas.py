@@ -3,15 +3,16 @@ Main PlotCanvas widget implementation using modular architecture.
 Orchestrates plotting functionality through multiple mixin classes.
 """
 
+from functools import partial
 from typing import Dict, Optional
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 # see: https://pypi.org/project/SciencePlots/
 import scienceplots  # noqa pylint: disable=unused-import
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
@@ -23,27 +24,30 @@ from src.core.logger_console import LoggerConsole as console
 from src.gui.main_tab.plot_canvas.anchor_group import HeightAnchorGroup, PositionAnchorGroup
 from src.gui.main_tab.plot_canvas.config import PLOT_CANVAS_CONFIG
 from src.gui.main_tab.plot_canvas.plot_interaction import PlotInteractionMixin
+from src.gui.main_tab.plot_canvas.plot_rendering import BlitFigureCanvas, PlotRenderingMixin
 from src.gui.main_tab.plot_canvas.plot_styling import PlotStylingMixin
 
 plt.style.use(PLOT_CANVAS_CONFIG.PLOT_STYLE)
 
 
-class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
+class PlotCanvas(QWidget, PlotRenderingMixin, PlotInteractionMixin, PlotStylingMixin):
     """
     A PyQt6 widget that contains a Matplotlib figure with interactive anchors.
 
     This class orchestrates plotting functionality through multiple mixin classes:
+    - PlotRenderingMixin: Batches redraws into frames and blits animated artists
     - PlotInteractionMixin: Handles mouse events and anchor interactions
     - PlotStylingMixin: Manages plot appearance and styling operations
 
     Attributes:
         update_value (pyqtSignal): Signal emitted when anchor positions change.
         figure: Matplotlib Figure instance.
-        canvas: FigureCanvas instance for the Figure.
+        canvas: BlitFigureCanvas instance for the Figure.
         axes: Matplotlib Axes instance.
         toolbar: NavigationToolbar for the canvas.
         lines (Dict[str, Line2D]): Dictionary of line objects keyed by their name.
-        background: Stored background for efficient redrawing.
+        fills (Dict[str, PolyCollection]): Bound fill areas keyed by bound type.
+        background: Static background captured after the last full draw, used for blitting.
         dragging_anchor: The currently dragged anchor line object (if any).
         dragging_anchor_group: Which group ('position' or 'height') is being dragged.
         position_anchor_group: An instance of PositionAnchorGroup.
@@ -58,7 +62,7 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
 
         # Initialize matplotlib components
         self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = BlitFigureCanvas(self.figure)
         self.axes = self.figure.add_subplot(111)
         self.toolbar = NavigationToolbar(self.canvas, self)
         self.lines: Dict[str, Line2D] = {}
@@ -69,11 +73,10 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
-        # Initialize interaction-related attributes
-        self.background = None
+        # Initialize frame rendering and interaction-related attributes
+        self.setup_rendering()
         self.dragging_anchor = None
         self.dragging_anchor_group = None
-        self.cid_draw = None
         self.cid_press = None
         self.cid_release = None
         self.cid_motion = None
@@ -88,13 +91,10 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
     def toggle_event_connections(self, enable: bool):
         """Toggle mouse event connections for interactive functionality."""
         if enable:
-            self.cid_draw = self.canvas.mpl_connect("draw_event", self.on_draw)
             self.cid_press = self.canvas.mpl_connect("button_press_event", self.on_click)
             self.cid_release = self.canvas.mpl_connect("button_release_event", self.on_release)
             self.cid_motion = self.canvas.mpl_connect("motion_notify_event", self.on_motion)
         else:
-            if self.cid_draw:
-                self.canvas.mpl_disconnect(self.cid_draw)
             if self.cid_press:
                 self.canvas.mpl_disconnect(self.cid_press)
             if self.cid_release:
@@ -102,33 +102,28 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
             if self.cid_motion:
                 self.canvas.mpl_disconnect(self.cid_motion)
 
-    def on_draw(self, event):
-        """Handle the draw_event to capture the background after the figure is first drawn."""
-        logger.debug("Capturing the canvas background after initial draw.")
-        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
-
-    def restore_background(self):
-        """Restore the previously saved background to the canvas."""
-        if self.background:
-            self.canvas.restore_region(self.background)
-
     def add_or_update_line(self, key, x, y, **kwargs):
-        """Add a new line or update an existing line on the axes."""
+        """
+        Add a new line or update an existing line on the axes.
+
+        The redraw is deferred to the next frame: animated lines are blitted,
+        static lines trigger one full draw for all updates made in that frame.
+        Large curves are drawn at a level of detail matching the view.
+        """
         if key in self.lines:
             logger.debug(f"Updating line '{key}' with new data.")
             line = self.lines[key]
-            line.set_data(x, y)
         else:
             logger.debug(f"Adding a new line '{key}' to the plot.")
+            # Created with full data so the data limits cover the whole curve
             (line,) = self.axes.plot(x, y, **kwargs)
             self.lines[key] = line
-        self.canvas.draw_idle()
-        self.figure.tight_layout()
+        self.set_line_data(key, line, x, y)
+        self.request_frame(full=not line.get_animated())
 
     def plot_data_from_dataframe(self, data: pd.DataFrame):
         """Plot data from a Pandas DataFrame with 'temperature' column for x-axis."""
-        self.axes.clear()
-        self.lines.clear()
+        self.clear_axes()
 
         if "temperature" in data.columns:
             logger.debug("Plotting file data from DataFrame.")
@@ -140,20 +135,63 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
             logger.error("DataFrame does not contain 'temperature' column.")
             console.log("The file does not contain a 'temperature' column for X-axis.")
 
-    def plot_mse_history(self, mse_data):
-        """Plot MSE history over time with proper clearing and time formatting."""
-        if not mse_data:
+    def plot_mse_history(self, mse_data, population_data=None):
+        """
+        Plot MSE history over time, updating the convergence plot in place.
+
+        The axes are set up once per MSE session; later calls only replace the
+        data of the animated convergence lines, so a new point costs a blit.
+        A full redraw with rescaling happens only when the data leaves the view.
+        Saved figures still contain the lines, see ``BlitFigureCanvas``.
+
+        Args:
+            mse_data: MseHistory or a list of (datetime, mse) pairs with the best-so-far MSE.
+            population_data: Optional MseHistory with per-generation best and mean energies.
+        """
+        times, mses = self._mse_arrays(mse_data)
+        if times.size == 0:
             logger.debug("No MSE data to plot")
             return
-
-        # Extract times and MSE values
+        logger.debug(f"Plotting MSE history with {times.size} points")
+
+        if not self.is_mse_mode() or "mse_line" not in self.lines:
+            self._setup_mse_axes()
+
+        curves = {"mse_line": (times, mses)}
+        if population_data is not None and len(population_data):
+            generation_times, generation_best, generation_mean = population_data.arrays()
+            curves["generation_best"] = (generation_times, generation_best)
+            if np.isfinite(generation_mean).any():
+                curves["generation_mean"] = (generation_times, generation_mean)
+
+        rescale = False
+        for key, (x, y) in curves.items():
+            line = self.lines.get(key)
+            # A new line, a restarted history or points outside the limits need a full redraw
+            rescale |= line is None or len(x) < len(line.get_xdata()) or not self.fits_view(mdates.date2num(x), y)
+            self.add_or_update_line(key, x, y, animated=True, **PLOT_CANVAS_CONFIG.MSE_LINE_CONFIG[key])
+
+        if rescale:
+            if len(curves) > 1:
+                self.axes.legend(loc="upper right")
+            self.axes.relim()
+            self.axes.autoscale_view()
+            self.request_frame(full=True)
+
+    @staticmethod
+    def _mse_arrays(mse_data):
+        """Return (times, values) arrays from an MseHistory or a list of (datetime, mse) pairs."""
+        if hasattr(mse_data, "arrays"):
+            times, mses, _ = mse_data.arrays()
+            return times, mses
+        if not mse_data:
+            return np.array([], dtype="datetime64[us]"), np.array([])
         times, mses = zip(*mse_data)
-        logger.debug(f"Plotting MSE history with {len(times)} points")
-        logger.debug(f"Time range: {times[0].strftime('%H:%M:%S')} to {times[-1].strftime('%H:%M:%S')}")
+        return np.array(times, dtype="datetime64[us]"), np.asarray(mses, dtype=float)
 
-        # Clear previous plot completely
-        self.axes.clear()
-        self.lines.clear()
+    def _setup_mse_axes(self):
+        """Clear the canvas and prepare time-formatted axes for the convergence plot."""
+        self.clear_axes()
 
         # Clear any existing anchors that might interfere
         if hasattr(self, "position_anchor_group"):
@@ -161,14 +199,10 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
         if hasattr(self, "height_anchor_group"):
             self.height_anchor_group = None
 
-        # Set up the plot
         self.axes.set_title("MSE over time")
         self.axes.set_xlabel("Time")
         self.axes.set_ylabel("MSE")
 
-        # Plot the MSE line
-        self.add_or_update_line("mse_line", times, mses, color="red", marker="o", linestyle="-")
-
         # Format time axis
         self.axes.xaxis.set_major_locator(mdates.AutoDateLocator())
         self.axes.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
@@ -176,33 +210,37 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
         # Rotate date labels for better readability
         self.figure.autofmt_xdate()
 
-        # Ensure the plot is redrawn
-        self.canvas.draw()
-        self.figure.tight_layout()
-        logger.debug("MSE history plot updated")
-
     def is_mse_mode(self) -> bool:
         """Check if the canvas is currently displaying MSE data."""
         return self.axes.get_title() == "MSE over time"
 
     @pyqtSlot(tuple, list)
     def plot_reaction(self, keys, values):
-        """Slot to plot reaction data with automatic line property determination."""
-        file_name, reaction_name = keys
+        """
+        Slot to queue reaction curve data for the next frame.
+
+        Emissions for the same curve within one frame are coalesced: only the latest
+        data is plotted and bound fills are recomputed once after all curves.
+        """
+        reaction_name = keys[1]
+        self.schedule_update(("reaction", reaction_name), partial(self._apply_reaction, reaction_name, values))
+        self.schedule_update("fill_between", self.update_fill_between)
+
+    def _apply_reaction(self, reaction_name, values):
+        """Plot reaction data with automatic line property determination."""
         x, y = values
 
-        if reaction_name in self.lines:
-            logger.debug(f"Removing existing line '{reaction_name}' before replotting.")
-            line = self.lines[reaction_name]
-            line.remove()
-            del self.lines[reaction_name]
-            # Delegate to PlotStylingMixin for line properties and fill operations
-        line_properties = self.determine_line_properties(reaction_name)
-        logger.debug(f"Plotting reaction '{reaction_name}' with provided data.")
-        self.add_or_update_line(reaction_name, x, y, **line_properties)
-
-        # Update fill between areas if needed (delegated to PlotStylingMixin)
-        self.update_fill_between()
+        if reaction_name in self.lines and not self.fits_view(x, y):
+            # Data left the view: let autoscale include the new curve on the next full draw
+            self.set_line_data(reaction_name, self.lines[reaction_name], x, y)
+            self.axes.relim()
+            self.axes.autoscale_view()
+            self.request_frame(full=True)
+        else:
+            # Delegate to PlotStylingMixin for line properties
+            line_properties = self.determine_line_properties(reaction_name)
+            logger.debug(f"Plotting reaction '{reaction_name}' with provided data.")
+            self.add_or_update_line(reaction_name, x, y, animated=True, **line_properties)
 
     @pyqtSlot(dict)
     def add_anchors(self, reaction_data: dict):
@@ -236,9 +274,12 @@ class PlotCanvas(QWidget, PlotInteractionMixin, PlotStylingMixin):
         upper_params = extract_anchor_params(reaction_data["upper_bound_coeffs"])
         lower_params = extract_anchor_params(reaction_data["lower_bound_coeffs"])
 
-        # Create anchor groups
+        # Replace anchor groups, dropping the previous anchors from the axes
+        for anchor_group in (self.position_anchor_group, self.height_anchor_group):
+            if anchor_group is not None:
+                for anchor in (anchor_group.center, anchor_group.upper_bound, anchor_group.lower_bound):
+                    self.remove_artist(anchor)
         self.position_anchor_group = PositionAnchorGroup(self.axes, center_params, upper_params, lower_params)
         self.height_anchor_group = HeightAnchorGroup(self.axes, center_params, upper_params, lower_params)
 
-        self.canvas.draw_idle()
-        self.figure.tight_layout()
+        self.request_frame()
@@ -23,10 +23,8 @@ class PlotInteractionMixin:
 
     def __init__(self):
         """Initialize interaction-related attributes."""
-        self.background = None
         self.dragging_anchor = None
         self.dragging_anchor_group = None
-        self.cid_draw = None
         self.cid_press = None
         self.cid_release = None
         self.cid_motion = None
@@ -41,13 +39,10 @@ class PlotInteractionMixin:
             enable: True to enable mouse events, False to disable
         """
         if enable:
-            self.cid_draw = self.canvas.mpl_connect("draw_event", self.on_draw)
             self.cid_press = self.canvas.mpl_connect("button_press_event", self.on_click)
             self.cid_release = self.canvas.mpl_connect("button_release_event", self.on_release)
             self.cid_motion = self.canvas.mpl_connect("motion_notify_event", self.on_motion)
         else:
-            if self.cid_draw:
-                self.canvas.mpl_disconnect(self.cid_draw)
             if self.cid_press:
                 self.canvas.mpl_disconnect(self.cid_press)
             if self.cid_release:
@@ -55,19 +50,6 @@ class PlotInteractionMixin:
             if self.cid_motion:
                 self.canvas.mpl_disconnect(self.cid_motion)
 
-    def on_draw(self, event):
-        """
-        Handle the draw_event to capture the background after the figure is first drawn.
-        This background can be restored later for performance.
-        """
-        logger.debug("Capturing the canvas background after initial draw.")
-        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
-
-    def restore_background(self):
-        """Restore the previously saved background to the canvas."""
-        if self.background:
-            self.canvas.restore_region(self.background)
-
     def find_dragging_anchor(self, event, anchor_group):
         """
         Determine which anchor (if any) within the anchor group is closest to the event position.
@@ -235,12 +217,5 @@ class PlotInteractionMixin:
         # Update anchor positions
         self.update_anchor_position(event, anchor_group, axis)
 
-        # Efficiently update display
-        if self.background:
-            self.restore_background()
-            self.axes.draw_artist(anchor_group.center)
-            self.axes.draw_artist(anchor_group.upper_bound)
-            self.axes.draw_artist(anchor_group.lower_bound)
-            self.canvas.blit(self.figure.bbox)
-        else:
-            self.canvas.draw_idle()
+        # Anchors are animated, so the next frame only blits them over the cached background
+        self.request_frame()
@@ -0,0 +1,221 @@
+"""
+Frame-based rendering for PlotCanvas.
+Batches redraw requests into frames, blits animated artists over a cached background
+and shows large curves at a view-dependent level of detail.
+"""
+
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from PyQt6.QtCore import QTimer
+
+from src.core.logger_config import logger
+from src.gui.main_tab.plot_canvas.config import PLOT_CANVAS_CONFIG
+from src.gui.main_tab.plot_canvas.level_of_detail import is_decimatable, minmax_decimate
+
+
+class BlitFigureCanvas(FigureCanvasQTAgg):
+    """
+    Qt canvas that includes animated artists in saved images.
+
+    Matplotlib leaves animated artists out of ``savefig``, so blitted curves would
+    be missing from exported figures. While printing, every animated artist is
+    drawn as a static one and ``printing`` is set so draw handlers skip the blit
+    path; the on-screen background is recaptured by a full draw afterwards.
+    """
+
+    printing = False
+
+    def print_figure(self, *args, **kwargs):
+        animated = self.figure.findobj(lambda artist: artist.get_animated())
+        for artist in animated:
+            artist.set_animated(False)
+        self.printing = True
+        try:
+            return super().print_figure(*args, **kwargs)
+        finally:
+            self.printing = False
+            for artist in animated:
+                artist.set_animated(True)
+            self.draw_idle()
+
+
+class PlotRenderingMixin:
+    """
+    Mixin class providing frame-based rendering for PlotCanvas.
+
+    Static artists (experimental data, simulations, decorations) are rendered by
+    a full canvas draw. Artists created with ``animated=True`` (reaction curves,
+    bound fills, anchors) are excluded from full draws by Matplotlib and are
+    painted on top of the background captured after each full draw, so changing
+    them only costs a blit. Saving the figure goes through ``BlitFigureCanvas``,
+    which draws them as static artists for the export. Redraw requests are coalesced by a single-shot timer
+    and rendered at most once per frame; layout is recomputed only when the axes
+    decorations changed. Data updates queued with ``schedule_update`` are applied
+    at the start of the frame, only the latest update per key is kept.
+
+    Curves longer than ``LOD_MIN_POINTS`` keep their full-resolution data in
+    ``line_sources`` and are drawn as a per-pixel min/max reduction of the
+    visible x range, recomputed whenever the x limits or the axes width change.
+    """
+
+    def setup_rendering(self):
+        """Create the frame timer and start capturing the background after every full draw."""
+        self.background = None
+        self.fills = {}
+        self.line_sources = {}
+        self._pending_updates: Dict[Hashable, Callable[[], None]] = {}
+        self._lod_width = None
+        self._background_size = None
+        self._layout_dirty = False
+        self._full_draw_pending = False
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(PLOT_CANVAS_CONFIG.FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self.render_frame)
+        self.cid_draw = self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    def request_frame(self, full: bool = False, layout: bool = False):
+        """
+        Schedule a redraw for the next frame.
+
+        Args:
+            full: Static artists changed and a full canvas draw is needed.
+            layout: Axes decorations changed and tight_layout must run before drawing.
+        """
+        self._full_draw_pending |= full or layout
+        self._layout_dirty |= layout
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def schedule_update(self, key: Hashable, update: Callable[[], None]):
+        """
+        Queue a data update for the next frame, replacing any update pending under the same key.
+
+        Updates run in the order of their latest scheduling, so an update that depends on
+        others (such as recomputing fills from bound curves) runs after them.
+        """
+        self._pending_updates.pop(key, None)
+        self._pending_updates[key] = update
+        self.request_frame()
+
+    def render_frame(self):
+        """Apply queued updates and render: full draw when static content changed, otherwise a blit."""
+        updates, self._pending_updates = self._pending_updates, {}
+        for update in updates.values():
+            update()
+        self._frame_timer.stop()
+        full_draw, layout = self._full_draw_pending, self._layout_dirty
+        self._full_draw_pending = self._layout_dirty = False
+
+        if layout:
+            self.figure.tight_layout()
+        if full_draw or not self._background_valid():
+            self.canvas.draw()
+            return
+
+        self.restore_background()
+        self.draw_animated_artists()
+        self.canvas.blit(self.figure.bbox)
+
+    def on_draw(self, event):
+        """Capture the static background after a full draw and paint animated artists over it."""
+        if self.canvas.printing:
+            return
+        logger.debug("Capturing the canvas background after full draw.")
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._background_size = self.canvas.get_width_height()
+        self.draw_animated_artists()
+        if self.line_sources and self._lod_width != self._lod_bins():
+            # Axes were resized: redraw once more at the new pixel resolution
+            self.refresh_level_of_detail()
+            self.request_frame(full=True)
+
+    def restore_background(self):
+        """Restore the previously saved background to the canvas."""
+        if self.background:
+            self.canvas.restore_region(self.background)
+
+    def _background_valid(self) -> bool:
+        return self.background is not None and self._background_size == self.canvas.get_width_height()
+
+    def animated_artists(self) -> list:
+        """Return visible animated artists of the axes in drawing order."""
+        artists = [artist for artist in self.axes.get_children() if artist.get_animated() and artist.get_visible()]
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+
+    def draw_animated_artists(self):
+        """Render animated artists into the canvas buffer."""
+        for artist in self.animated_artists():
+            self.axes.draw_artist(artist)
+
+    def clear_axes(self):
+        """Clear the axes together with line and fill bookkeeping and schedule a relayout."""
+        self.axes.clear()
+        self.lines.clear()
+        self.fills.clear()
+        self.line_sources.clear()
+        # Updates queued for the old content must not reappear on the cleared axes
+        self._pending_updates.clear()
+        # Axes.clear() resets the axes callback registry
+        self.axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
+        self.request_frame(layout=True)
+
+    def set_line_data(self, key: str, line, x, y):
+        """
+        Set line data, keeping large sorted curves at full resolution in line_sources
+        and drawing them reduced to the current view.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if x.size > PLOT_CANVAS_CONFIG.LOD_MIN_POINTS and is_decimatable(x, y):
+            self.line_sources[key] = (x, y)
+            self._lod_width = self._lod_bins()
+            # get_xlim() applies pending autoscaling, so the reduction matches the drawn view
+            line.set_data(*minmax_decimate(x, y, *self.axes.get_xlim(), self._lod_width))
+        else:
+            self.line_sources.pop(key, None)
+            line.set_data(x, y)
+
+    def line_data(self, key: str):
+        """Return full-resolution (x, y) of a line, regardless of the displayed level of detail."""
+        if key in self.line_sources:
+            return self.line_sources[key]
+        line = self.lines[key]
+        return line.get_xdata(), line.get_ydata()
+
+    def refresh_level_of_detail(self):
+        """Recompute reduced data of all large curves for the current x limits and axes width."""
+        self._lod_width = self._lod_bins()
+        x_min, x_max = self.axes.get_xlim()
+        for key, (x, y) in self.line_sources.items():
+            line = self.lines.get(key)
+            if line is not None:
+                line.set_data(*minmax_decimate(x, y, x_min, x_max, self._lod_width))
+
+    def _lod_bins(self) -> int:
+        return max(int(self.axes.bbox.width), 1)
+
+    def _on_xlim_changed(self, axes):
+        # Fired by zoom, pan and autoscaling right before the lines are drawn, so no extra frame is needed
+        if self.line_sources:
+            self.refresh_level_of_detail()
+
+    def remove_artist(self, artist) -> None:
+        """Remove an artist from the axes if it is still attached to them."""
+        if artist is not None and artist.axes is self.axes and artist in self.axes.get_children():
+            artist.remove()
+
+    def fits_view(self, x, y) -> bool:
+        """Return True when finite data points lie inside the current view limits."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.any():
+            return True
+        x_min, x_max = sorted(self.axes.get_xlim())
+        y_min, y_max = sorted(self.axes.get_ylim())
+        x, y = x[finite], y[finite]
+        return x.min() >= x_min and x.max() <= x_max and y.min() >= y_min and y.max() <= y_max
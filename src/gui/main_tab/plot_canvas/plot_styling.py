@@ -13,6 +13,9 @@ from src.core.app_settings import MODEL_FIT_ANNOTATION_CONFIG, MODEL_FREE_ANNOTA
 from src.core.logger_config import logger
 from src.gui.main_tab.plot_canvas.config import PLOT_CANVAS_CONFIG
 
+# Percentile columns added to model-free results by IsoconversionalBootstrap
+BOOTSTRAP_BAND_SUFFIXES = ("_lower", "_upper")
+
 
 class PlotStylingMixin:
     """
@@ -46,26 +49,46 @@ class PlotStylingMixin:
         """
         Update the fill_between regions if both upper and lower bound lines are present.
         This adds a shaded area between upper and lower bounds to visually indicate the range.
+        Each region replaces its previous fill and is animated, so it is blitted with the bound curves.
         """
         # Fill between cumulative bounds
         if "cumulative_upper_bound_coeffs" in self.lines and "cumulative_lower_bound_coeffs" in self.lines:
-            x = self.lines["cumulative_upper_bound_coeffs"].get_xdata()
-            upper_y = self.lines["cumulative_upper_bound_coeffs"].get_ydata()
-            lower_y = self.lines["cumulative_lower_bound_coeffs"].get_ydata()
             logger.debug("Filling area between cumulative bounds.")
-            self.axes.fill_between(
-                x, lower_y, upper_y, color=PLOT_CANVAS_CONFIG.FILL_COLOR, alpha=PLOT_CANVAS_CONFIG.FILL_ALPHA
-            )
+            self._replace_fill("cumulative", "cumulative_upper_bound_coeffs", "cumulative_lower_bound_coeffs")
 
         # Fill between direct bounds
         if "upper_bound_coeffs" in self.lines and "lower_bound_coeffs" in self.lines:
-            x = self.lines["upper_bound_coeffs"].get_xdata()
-            upper_y = self.lines["upper_bound_coeffs"].get_ydata()
-            lower_y = self.lines["lower_bound_coeffs"].get_ydata()
             logger.debug("Filling area between direct bounds.")
-            self.axes.fill_between(
-                x, lower_y, upper_y, color=PLOT_CANVAS_CONFIG.FILL_COLOR, alpha=PLOT_CANVAS_CONFIG.FILL_ALPHA
-            )
+            self._replace_fill("direct", "upper_bound_coeffs", "lower_bound_coeffs")
+
+    def _replace_fill(self, fill_key: str, upper_key: str, lower_key: str):
+        """Replace the animated fill stored under fill_key with the area between two bound lines."""
+        self.remove_artist(self.fills.pop(fill_key, None))
+        x, upper_y = self.line_data(upper_key)
+        _, lower_y = self.line_data(lower_key)
+        self.fills[fill_key] = self.axes.fill_between(
+            x,
+            lower_y,
+            upper_y,
+            color=PLOT_CANVAS_CONFIG.FILL_COLOR,
+            alpha=PLOT_CANVAS_CONFIG.FILL_ALPHA,
+            animated=True,
+        )
+        self.request_frame()
+
+    def _add_confidence_band(self, col: str, x, plot_df):
+        """Shade the bootstrap band of a model-free result column in the color of its line."""
+        lower_col, upper_col = (col + suffix for suffix in BOOTSTRAP_BAND_SUFFIXES)
+        if lower_col not in plot_df.columns or upper_col not in plot_df.columns:
+            return
+        self.fills[col] = self.axes.fill_between(
+            x,
+            plot_df[lower_col],
+            plot_df[upper_col],
+            color=self.lines[col].get_color(),
+            alpha=PLOT_CANVAS_CONFIG.FILL_ALPHA,
+            linewidth=0,
+        )
 
     def _get_random_line_style_and_width(self):
         """Get random line style and width for mock plots."""
@@ -97,8 +120,7 @@ class PlotStylingMixin:
 
         function_type = random.choice(PLOT_CANVAS_CONFIG.MOCK_PLOT_FUNCTION_TYPES)
 
-        self.axes.clear()
-        self.lines.clear()
+        self.clear_axes()
 
         for model_key, funcs in NUC_MODELS_TABLE.items():
             try:
@@ -149,7 +171,6 @@ class PlotStylingMixin:
             self.axes.set_title(title, loc="left")
 
         self.axes.tick_params(axis="both", which="major", labelsize=8)
-        self.canvas.draw_idle()
 
     def add_model_fit_annotation(self, annotation: str):
         """
@@ -209,8 +230,7 @@ class PlotStylingMixin:
         ylabel = plot_kwargs.pop("ylabel", "Value")
         annotation = plot_kwargs.pop("annotation", None)
 
-        self.axes.clear()
-        self.lines = {}
+        self.clear_axes()
         self.add_or_update_line("lhs_clean", plot_df["reverse_temperature"], plot_df["lhs_clean"], label="lhs_clean")
         self.add_or_update_line("y", plot_df["reverse_temperature"], plot_df["y"], label="y")
 
@@ -219,9 +239,6 @@ class PlotStylingMixin:
         self.axes.set_ylabel(ylabel)
         self.axes.legend()
 
-        self.canvas.draw_idle()
-        self.figure.tight_layout()
-
         if annotation:
             self.add_model_fit_annotation(annotation)
 
@@ -283,22 +300,20 @@ class PlotStylingMixin:
         ylabel = plot_kwargs.pop("ylabel", "Value")
         annotation = plot_kwargs.pop("annotation", None)
 
-        self.axes.clear()
-        self.lines = {}
+        self.clear_axes()
 
         x = plot_df["conversion"]
 
+        band_columns = [col for col in plot_df.columns if col.endswith(BOOTSTRAP_BAND_SUFFIXES)]
         for col in plot_df.columns:
-            if col != "conversion":
+            if col != "conversion" and col not in band_columns:
                 self.add_or_update_line(col, x, plot_df[col], label=col)
+                self._add_confidence_band(col, x, plot_df)
 
         self.axes.set_title(title)
         self.axes.set_xlabel(xlabel)
         self.axes.set_ylabel(ylabel)
         self.axes.legend()
 
-        self.canvas.draw_idle()
-        self.figure.tight_layout()
-
         if annotation:
             self.add_model_free_annotation(annotation)
@@ -286,6 +286,18 @@ class SideBar(QWidget):
         else:
             QMessageBox.critical(self, "Error", "Failed to delete the selected file.")
 
+    def clear_session_items(self):
+        """Remove all experiment file and series entries, keeping the action items of both sections."""
+        while self.experiments_data_root.rowCount() > 2:
+            self.experiments_data_root.removeRow(0)
+        action_items = (self.add_new_series_item, self.import_series_item, self.delete_series_item)
+        for row in reversed(range(self.series_root.rowCount())):
+            child = self.series_root.child(row)
+            if not any(child is item for item in action_items):
+                self.series_root.removeRow(row)
+        self.active_file_item = None
+        self.active_series_item = None
+
     def get_experiment_files_names(self) -> list[str]:
         """
         Returns a list of names of all experiment files currently listed in the sidebar.
@@ -2,35 +2,23 @@
 File transfer operations for importing and exporting reaction configurations.
 
 This module handles the import/export functionality for deconvolution reactions,
-including JSON file operations and filename generation.
+including packed JSON file operations and filename generation.
 """
 
-import json
 import os
 from typing import Any, Dict
 
-import numpy as np
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QFileDialog, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 
 from src.core.app_settings import OperationType
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
+from src.core.reaction_file import write_reactions_file
 
 from .config import DeconvolutionConfig
 
 
-class NumpyArrayEncoder(json.JSONEncoder):
-    """
-    Custom JSON encoder that converts NumPy arrays to lists for JSON serialization.
-    """
-
-    def default(self, obj):
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super(NumpyArrayEncoder, self).default(obj)
-
-
 class FileTransferButtons(QWidget):
     """
     Widget for handling import and export operations of reaction configurations.
@@ -128,16 +116,9 @@ class FileTransferButtons(QWidget):
 
         if save_file_name:
             try:
-                with open(save_file_name, "w", encoding=self.config.file_transfer.encoding) as file:
-                    json.dump(
-                        data,
-                        file,
-                        ensure_ascii=False,
-                        indent=self.config.file_transfer.export_indent,
-                        cls=NumpyArrayEncoder,
-                    )
-                    console.log(f"Data successfully exported to file:\n\n{save_file_name}")
-                    logger.info(f"Data successfully exported to file: {save_file_name}")
+                write_reactions_file(save_file_name, data, indent=self.config.file_transfer.export_indent)
+                console.log(f"Data successfully exported to file:\n\n{save_file_name}")
+                logger.info(f"Data successfully exported to file: {save_file_name}")
             except Exception as e:
                 logger.error(f"Failed to export data to {save_file_name}: {e}")
                 console.log(f"Export failed: {e}")
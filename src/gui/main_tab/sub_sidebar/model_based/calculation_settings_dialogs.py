@@ -101,7 +101,7 @@ class CalculationSettingsDialog(QDialog):
             if isinstance(default_value, bool):
                 edit_widget = QCheckBox()
                 edit_widget.setChecked(default_value)
-            elif param_name in ["strategy", "init", "updating"]:
+            elif param_name in ["strategy", "init", "updating", "contribution_parameterization"]:
                 edit_widget = QComboBox()
                 edit_widget.addItems(self.get_options_for_parameter(param_name))
                 edit_widget.setCurrentText(str(default_value))
@@ -341,6 +341,10 @@ class CalculationSettingsDialog(QDialog):
             "popsize": "Population size multiplier",
             "workers": "Number of parallel workers",
             "polish": "Whether to polish final result",
+            "contribution_parameterization": (
+                "constraint: chain contribution sums enforced by a constraint; "
+                "simplex: contributions normalized per chain, unconstrained search"
+            ),
         }
         return tooltips.get(param_name, f"Parameter: {param_name}")
 
@@ -350,6 +354,7 @@ class CalculationSettingsDialog(QDialog):
             "strategy": ["best1bin", "best1exp", "rand1exp", "randtobest1exp", "currenttobest1exp"],
             "init": ["latinhypercube", "random"],
             "updating": ["immediate", "deferred"],
+            "contribution_parameterization": ["constraint", "simplex"],
         }
         return options.get(param_name, ["default"])
 
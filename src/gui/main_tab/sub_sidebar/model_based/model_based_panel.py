@@ -7,24 +7,27 @@ import numpy as np
 import pandas as pd
 from PyQt6.QtCore import pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QMessageBox, QVBoxLayout, QWidget
-from scipy.integrate import solve_ivp
 
 from src.core.app_settings import NUC_MODELS_LIST, PARAMETER_BOUNDS, OperationType
-from src.core.calculation_scenarios import model_based_objective_function, ode_function
+from src.core.compiled_scheme import CompiledScheme
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
+from src.core.series_data import ExperimentalSeries
+from src.core.simulation_cache import SimulationCache, simulation_key
 from src.gui.main_tab.sub_sidebar.model_based.adjustment_controls import AdjustingSettingsBox
 from src.gui.main_tab.sub_sidebar.model_based.calculation_controls import ModelCalcButtons, RangeAndCalculateWidget
 from src.gui.main_tab.sub_sidebar.model_based.calculation_settings_dialogs import CalculationSettingsDialog
 from src.gui.main_tab.sub_sidebar.model_based.config import MODEL_BASED_CONFIG
 from src.gui.main_tab.sub_sidebar.model_based.models_scheme import ModelsScheme
 from src.gui.main_tab.sub_sidebar.model_based.parameter_table import ReactionDefaults, ReactionTable
+from src.gui.main_tab.sub_sidebar.model_based.simulation_preview import SimulationPreview, simulate_scheme
 
 
 class ModelBasedTab(QWidget):
     """Main widget for model-based kinetic analysis."""
 
     model_params_changed = pyqtSignal(dict)
+    simulation_ready = pyqtSignal(object)
 
     def __init__(self, parent=None):
         """Initialize model-based analysis interface."""
@@ -34,6 +37,10 @@ class ModelBasedTab(QWidget):
         self._calculation_method = None
         self._calculation_method_params = {}
         self._best_values_cache = {}
+        self.simulation_cache = SimulationCache()
+        self._simulation_key = None
+        self.simulation_preview = SimulationPreview(self)
+        self.simulation_preview.simulation_ready.connect(self._on_simulation_ready)
 
         self._setup_ui()
         self._connect_signals()
@@ -378,101 +385,85 @@ class ModelBasedTab(QWidget):
 
             QMessageBox.information(self, "Settings Saved", "The settings have been updated successfully.")
 
-    def _simulate_reaction_model(self, experimental_data: pd.DataFrame, reaction_scheme: dict):
+    def request_simulation(self, experimental_data: pd.DataFrame | ExperimentalSeries, reaction_scheme: dict):
         """
-        Simulate reaction model using model_based_objective_function directly.
+        Simulate the reaction model on a worker thread.
 
-        This function uses the exact same function as ModelBasedTargetFunction.__call__
-        to ensure consistent MSE calculation and avoid code duplication.
+        Results are emitted through ``simulation_ready``; a newer request cancels
+        the running simulation, so only the latest parameters are plotted.
+        Parameter sets found in ``simulation_cache`` are emitted immediately.
         """
-        if not self._validate_simulation_inputs(experimental_data, reaction_scheme):
-            return pd.DataFrame()
-
-        sim_params = self._prepare_simulation_parameters(experimental_data, reaction_scheme)
-        if not sim_params:
-            console.log("\nFailed to prepare simulation parameters. Check reaction scheme configuration.\n")
-            return pd.DataFrame()
+        prepared = self._prepare_simulation(experimental_data, reaction_scheme)
+        if prepared is None:
+            return
 
-        # Create parameters array in the format expected by model_based_objective_function
-        core_params = self._create_core_compatible_params(
-            sim_params["logA"], sim_params["Ea"], sim_params["contributions"]
-        )
+        key = simulation_key(reaction_scheme, prepared[0])
+        cached = self.simulation_cache.get(key)
+        if cached is not None:
+            # A running simulation is for older parameters and must not overwrite this result
+            self.simulation_preview.cancel()
+            self._emit_simulation(*cached)
+            return
+        self._simulation_key = key
+        self.simulation_preview.request(*prepared)
 
-        # Use model_based_objective_function directly to calculate MSE
-        total_mse = self._calculate_mse_using_core_function(experimental_data, sim_params, core_params)
+    def _on_simulation_ready(self, simulation_df: pd.DataFrame, total_mse: float):
+        # Only the latest request is delivered, so its key is the last one requested
+        self.simulation_cache.put(self._simulation_key, simulation_df, total_mse)
+        self._emit_simulation(simulation_df, total_mse)
 
-        # Output MSE to console
+    def _emit_simulation(self, simulation_df: pd.DataFrame, total_mse: float):
         console.log(f"\nModel simulation MSE: {total_mse:.6f}\n")
+        self.simulation_ready.emit(simulation_df)
 
-        # Generate simulation data for visualization
-        simulation_results = self._generate_simulation_curves(experimental_data, sim_params, core_params)
-
-        return pd.DataFrame(simulation_results)
-
-    def _calculate_mse_using_core_function(
-        self, experimental_data: pd.DataFrame, sim_params: dict, core_params: np.ndarray
-    ) -> float:
-        """Calculate MSE using the same logic as ModelBasedTargetFunction."""
-        try:
-            # Extract data exactly as done in ModelBasedTargetFunction
-            species_list = sim_params["species_list"]
-            reactions = sim_params["reactions"]
-            num_species = sim_params["num_species"]
-            num_reactions = sim_params["num_reactions"]
-            exp_temperature = sim_params["T_K"]  # Temperature in Kelvin
-
-            # Extract betas and experimental masses exactly as in ModelBasedTargetFunction
-            betas = [float(col) for col in experimental_data.columns if col.lower() != "temperature"]
-            all_exp_masses = self._extract_experimental_masses(experimental_data, betas)
-
-            # Create dummy stop_event for simulation (no stopping needed in UI)
-            from threading import Event
-
-            stop_event = Event()
-
-            # Call model_based_objective_function directly - same logic as ModelBasedTargetFunction.__call__
-            total_mse = model_based_objective_function(
-                core_params,
-                species_list,
-                reactions,
-                num_species,
-                num_reactions,
-                betas,
-                all_exp_masses,
-                exp_temperature,
-                R=8.314,
-                stop_event=stop_event,
-            )
-
-            return total_mse
+    def _simulate_reaction_model(self, experimental_data: pd.DataFrame | ExperimentalSeries, reaction_scheme: dict):
+        """
+        Simulate reaction model synchronously.
 
-        except Exception as e:
-            logger.error(f"MSE calculation error: {e}")
-            console.log(f"\nError calculating MSE: {str(e)}\n")
-            return float("inf")
+        Curves and MSE come from one integration per heating rate, using the same
+        integration and mass model as ModelBasedTargetFunction.
+        """
+        prepared = self._prepare_simulation(experimental_data, reaction_scheme)
+        if prepared is None:
+            return pd.DataFrame()
 
-    def _generate_simulation_curves(
-        self, experimental_data: pd.DataFrame, sim_params: dict, core_params: np.ndarray
-    ) -> dict:
-        """Generate simulation curves for each heating rate for visualization."""
-        simulation_results = {"temperature": sim_params["T"]}
+        key = simulation_key(reaction_scheme, prepared[0])
+        cached = self.simulation_cache.get(key)
+        if cached is not None:
+            simulation_df, total_mse = cached
+        else:
+            simulation_df, total_mse = simulate_scheme(*prepared)
+            self.simulation_cache.put(key, simulation_df, total_mse)
+        console.log(f"\nModel simulation MSE: {total_mse:.6f}\n")
+        return simulation_df
 
-        betas = [float(col) for col in experimental_data.columns if col.lower() != "temperature"]
-        all_exp_masses = self._extract_experimental_masses(experimental_data, betas)
+    def _prepare_simulation(self, experimental_data: pd.DataFrame | ExperimentalSeries, reaction_scheme: dict):
+        """Return (experimental series, simulation parameters, core parameter array) or None on invalid input."""
+        if not self._validate_simulation_inputs(experimental_data, reaction_scheme):
+            return None
+        if not isinstance(experimental_data, ExperimentalSeries):
+            experimental_data = ExperimentalSeries.from_dataframe(experimental_data)
 
-        for beta, exp_mass in zip(betas, all_exp_masses):
-            try:
-                model_mass = self._get_mass_from_core_ode(beta, sim_params, core_params, exp_mass)
-                simulation_results[str(beta)] = model_mass
-            except Exception as e:
-                logger.error(f"Simulation curve generation error for β={beta}: {e}")
-                simulation_results[str(beta)] = exp_mass  # Fallback to experimental data
+        sim_params = self._prepare_simulation_parameters(experimental_data, reaction_scheme)
+        if not sim_params:
+            console.log("\nFailed to prepare simulation parameters. Check reaction scheme configuration.\n")
+            return None
 
-        return simulation_results
+        # Create parameters array in the format expected by model_based_objective_function
+        core_params = self._create_core_compatible_params(
+            sim_params["logA"], sim_params["Ea"], sim_params["contributions"]
+        )
+        return experimental_data, sim_params, core_params
 
-    def _validate_simulation_inputs(self, experimental_data: pd.DataFrame, reaction_scheme: dict) -> bool:
+    def _validate_simulation_inputs(
+        self, experimental_data: pd.DataFrame | ExperimentalSeries, reaction_scheme: dict
+    ) -> bool:
         """Validate inputs for simulation."""
-        if experimental_data.empty:
+        if isinstance(experimental_data, ExperimentalSeries):
+            is_empty = experimental_data.masses.size == 0
+        else:
+            is_empty = experimental_data.empty
+        if is_empty:
             console.log("\nCannot simulate model: No experimental data available.\n")
             return False
         if not reaction_scheme:
@@ -480,25 +471,11 @@ class ModelBasedTab(QWidget):
             return False
         return True
 
-    def _extract_experimental_masses(self, experimental_data: pd.DataFrame, betas: list) -> list:
-        """Extract experimental masses for each heating rate."""
-        all_exp_masses = []
-        for beta in betas:
-            col_name = str(beta)
-            if col_name not in experimental_data.columns:
-                col_name = str(int(beta))
-            if col_name not in experimental_data.columns:
-                logger.error(f"Experimental data does not contain column for beta value {beta}")
-                continue
-            exp_mass = experimental_data[col_name].to_numpy()
-            all_exp_masses.append(exp_mass)
-        return all_exp_masses
-
-    def _prepare_simulation_parameters(self, experimental_data: pd.DataFrame, reaction_scheme: dict) -> dict:
+    def _prepare_simulation_parameters(self, experimental_data: ExperimentalSeries, reaction_scheme: dict) -> dict:
         """Prepare parameters for reaction simulation."""
-        T = experimental_data["temperature"].values
-        T_K = T + 273.15
-        beta_columns = [col for col in experimental_data.columns if col.lower() != "temperature"]
+        T = experimental_data.temperature
+        T_K = experimental_data.temperature_kelvin
+        beta_columns = list(experimental_data.rate_columns)
 
         reactions = reaction_scheme.get("reactions", [])
         components = reaction_scheme.get("components", [])
@@ -506,6 +483,13 @@ class ModelBasedTab(QWidget):
         num_species = len(species_list)
         num_reactions = len(reactions)
 
+        try:
+            # Compiled arrays are detached from the scheme dict, which the panel edits in place
+            compiled = CompiledScheme.from_scheme(reaction_scheme)
+        except ValueError as e:
+            logger.error(f"Invalid reaction scheme: {e}")
+            return {}
+
         logA = np.array([reaction.get("log_A", 8) for reaction in reactions])
         Ea = np.array([reaction.get("Ea", 120) for reaction in reactions])
         contributions = np.array([reaction.get("contribution", 0.5) for reaction in reactions])
@@ -515,6 +499,7 @@ class ModelBasedTab(QWidget):
             "T_K": T_K,
             "beta_columns": beta_columns,
             "reactions": reactions,
+            "scheme": compiled,
             "species_list": species_list,
             "num_species": num_species,
             "num_reactions": num_reactions,
@@ -527,51 +512,3 @@ class ModelBasedTab(QWidget):
         num_reactions = len(logA)
         model_indices = np.zeros(num_reactions)  # GUI uses fixed models
         return np.concatenate([logA, Ea, model_indices, contributions])
-
-    def _get_mass_from_core_ode(
-        self, beta_value: float, sim_params: dict, core_params: np.ndarray, exp_mass: np.ndarray
-    ) -> np.ndarray:
-        try:
-            y0 = np.zeros(sim_params["num_species"] + sim_params["num_reactions"])
-            if sim_params["num_species"] > 0:
-                y0[0] = 1.0
-
-            def ode_wrapper(T, y):
-                return ode_function(
-                    T,
-                    y,
-                    beta_value,  # Pass β directly (K/min)
-                    core_params,
-                    sim_params["species_list"],
-                    sim_params["reactions"],
-                    sim_params["num_species"],
-                    sim_params["num_reactions"],
-                    R=8.314,
-                )
-
-            T_K = sim_params["T_K"]
-            sol = solve_ivp(ode_wrapper, [T_K[0], T_K[-1]], y0, t_eval=T_K, method="RK45")
-
-            if not sol.success:
-                logger.error(f"Core ODE solution failed for β = {beta_value}")
-                console.log(
-                    f"\nODE integration failed for heating rate {beta_value} K/min. " f"Check reaction parameters.\n"
-                )
-                return exp_mass
-
-            # Extract rates and calculate mass
-            rates_int = sol.y[sim_params["num_species"] : sim_params["num_species"] + sim_params["num_reactions"], :]
-            int_sum = np.sum(sim_params["contributions"][:, np.newaxis] * rates_int, axis=0)
-            M0 = exp_mass[0]
-            Mfin = exp_mass[-1]
-            model_mass = M0 - (M0 - Mfin) * int_sum
-
-            return model_mass
-
-        except Exception as e:
-            logger.error(f"Core ODE mass calculation failed for β = {beta_value}: {e}")
-            console.log(
-                f"\nMass calculation from ODE failed for {beta_value} K/min: {str(e)}\n"
-                f"Check reaction scheme and parameters.\n"
-            )
-            return exp_mass
@@ -0,0 +1,125 @@
+"""
+Background model simulation for the model-based panel.
+Integrates the reaction scheme off the GUI thread and keeps only the result of the latest request.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.core.calculation_scenarios import simulate_model_mass
+from src.core.calculation_thread import CalculationThread
+from src.core.logger_config import logger
+from src.core.logger_console import LoggerConsole as console
+from src.core.series_data import ExperimentalSeries
+
+# Objective penalty for a heating rate whose integration failed, as in model_based_objective_function
+FAILED_INTEGRATION_MSE = 1e4
+
+
+def simulate_scheme(
+    experimental_data: ExperimentalSeries, sim_params: dict, core_params: np.ndarray, stop_event=None
+) -> tuple[pd.DataFrame, float] | None:
+    """
+    Simulate mass curves for every heating rate with one integration per rate.
+
+    Returns:
+        tuple | None: (DataFrame with "temperature" and one column per heating rate, total MSE),
+            or None when stop_event was set before the simulation finished. Rates whose
+            integration failed fall back to the experimental curve.
+    """
+    simulation_results = {"temperature": sim_params["T"]}
+    total_mse = 0.0
+
+    for beta, exp_mass in zip(experimental_data.betas.tolist(), experimental_data.mass_rows()):
+        try:
+            result = simulate_model_mass(
+                beta,
+                sim_params["contributions"],
+                core_params,
+                sim_params["scheme"],
+                sim_params["T_K"],
+                exp_mass,
+                R=8.314,
+                stop_event=stop_event,
+            )
+        except InterruptedError:
+            return None
+        if result is None:
+            logger.error(f"Core ODE solution failed for β = {beta}")
+            console.log(f"\nODE integration failed for heating rate {beta} K/min. Check reaction parameters.\n")
+            simulation_results[str(beta)] = exp_mass
+            total_mse += FAILED_INTEGRATION_MSE
+            continue
+        simulation_results[str(beta)], mse = result
+        total_mse += mse
+
+    return pd.DataFrame(simulation_results), total_mse
+
+
+class SimulationPreview(QObject):
+    """
+    Runs model simulations on a worker thread, one at a time.
+
+    A new request cancels the running simulation and replaces any request that
+    has not started yet, so rapid parameter changes cost at most one stale
+    integration step. Results are delivered on the GUI thread through
+    ``simulation_ready`` only for the latest request.
+    """
+
+    simulation_ready = pyqtSignal(object, float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread = None
+        self._pending = None
+        self._generation = 0
+        self._running_generation = 0
+        self._stop_event = threading.Event()
+
+    def request(self, experimental_data: ExperimentalSeries, sim_params: dict, core_params: np.ndarray):
+        """Schedule a simulation, superseding every earlier request."""
+        self._generation += 1
+        self._pending = (self._generation, experimental_data, sim_params, core_params)
+        self._stop_event.set()
+        if self._thread is None:
+            self._start_pending()
+
+    def cancel(self):
+        """Stop the running simulation and drop queued requests; nothing is emitted for them."""
+        self._generation += 1
+        self._pending = None
+        self._stop_event.set()
+
+    def is_busy(self) -> bool:
+        return self._thread is not None
+
+    def _start_pending(self):
+        self._running_generation, experimental_data, sim_params, core_params = self._pending
+        self._pending = None
+        self._stop_event = threading.Event()
+        self._thread = CalculationThread(
+            simulate_scheme, experimental_data, sim_params, core_params, stop_event=self._stop_event
+        )
+        self._thread.result_ready.connect(self._on_result)
+        self._thread.finished.connect(self._on_thread_finished)
+        self._thread.start()
+
+    def _on_result(self, result):
+        if result is None or self._running_generation != self._generation:
+            logger.debug(f"Dropping outdated simulation {self._running_generation}, latest is {self._generation}")
+            return
+        if isinstance(result, Exception):
+            console.log(f"\nModel simulation failed: {result}\n")
+            return
+        simulation_df, total_mse = result
+        self.simulation_ready.emit(simulation_df, total_mse)
+
+    def _on_thread_finished(self):
+        # finished is emitted right before run() returns; wait() makes releasing the thread safe
+        self._thread.wait()
+        self._thread = None
+        if self._pending is not None:
+            self._start_pending()
@@ -25,7 +25,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.core.app_settings import MODEL_FREE_ANNOTATION_CONFIG, MODEL_FREE_METHODS, OperationType
+from src.core.app_settings import (
+    MODEL_FREE_ANNOTATION_CONFIG,
+    MODEL_FREE_BOOTSTRAP_METHODS,
+    MODEL_FREE_METHODS,
+    OperationType,
+)
 from src.core.logger_config import logger  # noqa: F401
 
 
@@ -85,10 +90,19 @@ class ModelFreeSubBar(QWidget):
         self.master_plot_dropdown.addItems(["y(α)", "g(α)", "z(α)"])
         self.form_layout.addRow(self.master_plot_label, self.master_plot_dropdown)
 
+        self.max_peaks_label = QLabel("max peaks:", self)
+        self.max_peaks_input = QSpinBox(self)
+        self.max_peaks_input.setRange(1, 5)
+        self.max_peaks_input.setValue(1)
+        self.max_peaks_input.setToolTip("Number of DTG peaks per curve analysed separately by Kissinger")
+        self.form_layout.addRow(self.max_peaks_label, self.max_peaks_input)
+
         self.ea_min_label.hide()
         self.ea_min_input.hide()
         self.ea_max_label.hide()
         self.ea_max_input.hide()
+        self.max_peaks_label.hide()
+        self.max_peaks_input.hide()
         self.ea_mean_label.hide()
         self.ea_mean_input.hide()
         self.master_plot_dropdown.hide()
@@ -96,6 +110,10 @@ class ModelFreeSubBar(QWidget):
 
         self.layout.addLayout(self.form_layout)
 
+        self.bootstrap_checkbox = QCheckBox("confidence bands (bootstrap)", self)
+        self.bootstrap_checkbox.setToolTip("Estimate Ea(α) confidence bands by bootstrap resampling")
+        self.layout.addWidget(self.bootstrap_checkbox)
+
         self.method_combobox.currentTextChanged.connect(self.on_model_combobox_changed)
 
         # Calculate button
@@ -150,6 +168,9 @@ class ModelFreeSubBar(QWidget):
             self.ea_max_label.hide()
             self.ea_max_input.hide()
 
+        self.max_peaks_label.setVisible(text == "Kissinger")
+        self.max_peaks_input.setVisible(text == "Kissinger")
+
         if text == "master plots":
             self.ea_mean_label.show()
             self.ea_mean_input.show()
@@ -165,6 +186,8 @@ class ModelFreeSubBar(QWidget):
             self.results_table.show()
             self.beta_combobox.hide()
 
+        self.bootstrap_checkbox.setVisible(text in MODEL_FREE_BOOTSTRAP_METHODS)
+
     def emit_combobox_text(self, _=None):
         reaction = self.reaction_combobox.currentText()
 
@@ -178,7 +201,7 @@ class ModelFreeSubBar(QWidget):
 
         self.table_combobox_text_changed_signal.emit(emit_params)
 
-    def on_calculate_clicked(self):
+    def on_calculate_clicked(self):  # noqa: C901
         try:
             alpha_min = float(self.alpha_min_input.text())
             alpha_max = float(self.alpha_max_input.text())
@@ -204,6 +227,12 @@ class ModelFreeSubBar(QWidget):
                 calc_params["ea_min"] = ea_min
                 calc_params["ea_max"] = ea_max
 
+            if fit_method == "Kissinger":
+                calc_params["max_peaks"] = self.max_peaks_input.value()
+
+            if fit_method in MODEL_FREE_BOOTSTRAP_METHODS and self.bootstrap_checkbox.isChecked():
+                calc_params["bootstrap"] = {}
+
             if fit_method == "master plots":
                 if self.ea_mean_input.text() == "":
                     raise ValueError(
@@ -5,9 +5,6 @@ Provides interface for loading deconvolution results from multiple heating rates
 performing model-fit and model-free analysis, and visualizing kinetic parameters.
 """
 
-import json
-
-import numpy as np
 import pandas as pd
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import (
@@ -27,9 +24,9 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.app_settings import MODEL_FIT_METHODS, OperationType
-from src.core.curve_fitting import CurveFitting as cft
 from src.core.logger_config import logger
-from src.core.logger_console import LoggerConsole as console
+from src.core.reaction_file import read_reactions_file
+from src.core.series_data import build_reaction_dataframe, deconvolution_reactions
 from src.gui.main_tab.sub_sidebar.series.config import SeriesConfig
 
 
@@ -204,54 +201,15 @@ class SeriesSubBar(QWidget):
 
     def load_reactions(self, load_file_name: str, file_name: str):
         try:
-            with open(load_file_name, "r", encoding="utf-8") as file:
-                data = json.load(file)
-
-            for reaction_key, reaction_data in data.items():
-                if "x" in reaction_data:
-                    reaction_data["x"] = np.array(reaction_data["x"])
-
-            logger.debug(f"Loaded data for {file_name}: {data}")
-
+            data = read_reactions_file(load_file_name)
+            logger.debug(f"Loaded {len(data)} reactions for {file_name}")
             return data
-        except IOError as e:
+        except (IOError, ValueError) as e:
             logger.error(f"Error loading file {load_file_name}: {e}")
             return {}
 
     def check_missing_reactions(self, experimental_data: pd.DataFrame, deconvolution_results: dict):
-        experimental_columns = experimental_data.columns.tolist()
-        experimental_columns = [col for col in experimental_columns if col != "temperature"]
-        reactions_per_key = {}
-
-        for key in deconvolution_results:
-            key_float = float(key)
-
-            if key_float not in [float(x) for x in experimental_columns]:
-                logger.error(f"Missing corresponding data for key: {key_float} in {experimental_columns=}")
-                console.log(f"Missing corresponding data for key: {key_float} in {experimental_columns=}")
-                continue
-
-            reaction_data = deconvolution_results[key]
-            reaction_keys = list(reaction_data.keys())
-
-            reactions_for_this_key = set()
-            for reaction in reaction_keys:
-                reactions_for_this_key.add(reaction)
-
-            reactions_per_key[key] = reactions_for_this_key
-
-        common_reactions = set.intersection(*reactions_per_key.values()) if reactions_per_key else set()
-        logger.debug(f"common_reactions: {common_reactions}")
-        all_reactions = {reaction for reactions_set in reactions_per_key.values() for reaction in reactions_set}
-        missing_reactions = all_reactions - common_reactions
-
-        if missing_reactions:
-            logger.error(f"The following reactions do not appear in all keys: {missing_reactions}")
-            console.log(f"The following reactions do not appear in all keys: {missing_reactions}")
-
-        sorted_common_reactions = list(common_reactions)
-        sorted_common_reactions.sort(key=lambda x: int(x.split("_")[1]))
-        return sorted_common_reactions, missing_reactions
+        return deconvolution_reactions(experimental_data, deconvolution_results)
 
     def _update_table_with_reactions(self, common_reactions):
         self.results_combobox.blockSignals(True)
@@ -278,53 +236,7 @@ class SeriesSubBar(QWidget):
     def get_reaction_dataframe(
         self, experimental_data: pd.DataFrame, deconvolution_results: dict, reaction_n="reaction_0"
     ) -> pd.DataFrame:
-        temperatures = experimental_data["temperature"]
-        fitted_data = {}
-        for key, result in deconvolution_results.items():
-            reaction_data = result.get(reaction_n)
-            if reaction_data:
-                function_type = reaction_data.get("function")
-                coeffs = reaction_data.get("coeffs", {})
-
-                if function_type == "gauss":
-                    fitted_values = cft.calculate_reaction(
-                        (
-                            (np.min(temperatures), np.max(temperatures)),
-                            function_type,
-                            (coeffs.get("h", 0), coeffs.get("z", 0), coeffs.get("w", 0)),
-                        )
-                    )
-                elif function_type == "fraser":
-                    fitted_values = cft.calculate_reaction(
-                        (
-                            (np.min(temperatures), np.max(temperatures)),
-                            function_type,
-                            (coeffs.get("h", 0), coeffs.get("z", 0), coeffs.get("w", 0), coeffs.get("fr", 0)),
-                        )
-                    )
-                elif function_type == "ads":
-                    fitted_values = cft.calculate_reaction(
-                        (
-                            (np.min(temperatures), np.max(temperatures)),
-                            function_type,
-                            (
-                                coeffs.get("h", 0),
-                                coeffs.get("z", 0),
-                                coeffs.get("w", 0),
-                                coeffs.get("ads1", 0),
-                                coeffs.get("ads2", 0),
-                            ),
-                        )
-                    )
-                else:
-                    fitted_values = np.zeros_like(temperatures)
-
-                fitted_data[key] = fitted_values
-
-        # 250 depends on cft.calculate_reaction
-        fitted_data["temperature"] = np.linspace(np.min(temperatures), np.max(temperatures), 250)
-        reaction_df = pd.DataFrame(fitted_data)
-        return reaction_df
+        return build_reaction_dataframe(experimental_data, deconvolution_results, reaction_n)
 
     def update_series_ui(self, experimental_data: pd.DataFrame, deconvolution_results: dict):
         reactions, _ = self.check_missing_reactions(experimental_data, deconvolution_results)
@@ -1,13 +1,16 @@
-from functools import reduce
+import gc
+import os
 
 import pandas as pd
 from PyQt6.QtCore import pyqtSignal, pyqtSlot
-from PyQt6.QtWidgets import QMainWindow, QTabWidget
+from PyQt6.QtWidgets import QFileDialog, QMainWindow, QTabWidget
 
 from src.core.app_settings import OperationType
-from src.core.base_signals import BaseSignals, BaseSlots
+from src.core.base_signals import BaseSignals, BaseSlots, describe_request
 from src.core.logger_config import logger
 from src.core.logger_console import LoggerConsole as console
+from src.core.project_file import PROJECT_FILE_EXTENSION, load_into_memory, load_project, save_project
+from src.core.series_data import build_series_dataframe
 from src.gui.main_tab.main_tab import MainTab
 from src.gui.user_guide_tab.user_guide_tab import UserGuideTab
 
@@ -32,6 +35,8 @@ class MainWindow(QMainWindow):
     to_main_tab_signal = pyqtSignal(dict)
     model_based_calculation_signal = pyqtSignal(dict)
 
+    PROJECT_ACTORS = ("file_data", "series_data", "calculations_data", "calculations")
+
     def __init__(self, signals: BaseSignals):
         """Initialize main window with tabs and signal connections."""
         super().__init__()
@@ -50,15 +55,85 @@ class MainWindow(QMainWindow):
         self.actor_name = "main_window"
 
         self.base_slots = BaseSlots(actor_name=self.actor_name, signals=self.signals)
+        self.model_free_future = None
+        # Project file the session arrays are still memory-mapped from
+        self.mapped_project_path = None
 
         self.signals.register_component(self.actor_name, self.process_request, self.process_response)
 
         self.main_tab.to_main_window_signal.connect(self.handle_request_from_main_tab)
         self.main_tab.sidebar.to_main_window_signal.connect(self.handle_request_from_main_tab)
         self.to_main_tab_signal.connect(self.main_tab.response_slot)
+        self.main_tab.sub_sidebar.model_based.simulation_ready.connect(self._plot_model_simulation)
+
+        file_menu = self.menuBar().addMenu("File")
+        file_menu.addAction("Open project...", self._open_project_dialog)
+        file_menu.addAction("Save project...", self._save_project_dialog)
 
         logger.debug(f"{self.actor_name} init signals and slots.")
 
+    def _save_project_dialog(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save project", "", f"Project files (*{PROJECT_FILE_EXTENSION})")
+        if path:
+            if not path.endswith(PROJECT_FILE_EXTENSION):
+                path += PROJECT_FILE_EXTENSION
+            self.save_project(path)
+
+    def _open_project_dialog(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open project", "", f"Project files (*{PROJECT_FILE_EXTENSION})")
+        if path:
+            self.open_project(path)
+
+    def save_project(self, path: str) -> bool:
+        """Collect state of all data actors and write it to a single project file."""
+        state = {actor: self.handle_request_cycle(actor, OperationType.EXPORT_STATE) for actor in self.PROJECT_ACTORS}
+        if self._is_mapped_project(path):
+            # The file cannot be replaced while the session still maps arrays from it
+            state = load_into_memory(state)
+            self._import_state(state)
+            self.mapped_project_path = None
+            gc.collect()
+        try:
+            save_project(path, state)
+        except (OSError, TypeError) as e:
+            logger.error(f"Failed to save project '{path}': {e}")
+            console.log(f"\n\nError: Unable to save the project: {e}")
+            return False
+        console.log(f"\n\nProject saved to '{path}'.")
+        return True
+
+    def _is_mapped_project(self, path: str) -> bool:
+        if self.mapped_project_path is None or not os.path.exists(path):
+            return False
+        return os.path.samefile(path, self.mapped_project_path)
+
+    def _import_state(self, state: dict) -> None:
+        for actor in self.PROJECT_ACTORS:
+            if actor in state:
+                self.handle_request_cycle(actor, OperationType.IMPORT_STATE, state=state[actor])
+
+    def open_project(self, path: str) -> bool:
+        """Restore all data actors from a project file and rebuild the sidebar tree."""
+        try:
+            state = load_project(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to open project '{path}': {e}")
+            console.log(f"\n\nError: Unable to open the project: {e}")
+            return False
+
+        self._import_state(state)
+        self.mapped_project_path = path
+
+        sidebar = self.main_tab.sidebar
+        sidebar.clear_session_items()
+        for file_name in state.get("file_data", {}).get("original_data", {}):
+            sidebar.add_experiment_file((file_name,))
+        for series_name in state.get("series_data", {}).get("series", {}):
+            sidebar.add_series(series_name)
+
+        console.log(f"\n\nProject '{path}' has been opened.")
+        return True
+
     @pyqtSlot(dict)
     def process_request(self, params: dict):
         """
@@ -101,13 +176,13 @@ class MainWindow(QMainWindow):
     @pyqtSlot(dict)
     def process_response(self, params: dict):
         """Delegate response processing to base slots handler."""
-        logger.debug(f"{self.actor_name} received response: {params}")
+        logger.debug(f"{self.actor_name} received response: {describe_request(params)}")
         self.base_slots.process_response(params)
 
     def handle_request_cycle(self, target: str, operation: str, **kwargs):
         """Execute request-response cycle with logging for debugging."""
         result = self.base_slots.handle_request_cycle(target, operation, **kwargs)
-        logger.debug(f"handle_request_cycle result for '{operation}': {result}")
+        logger.debug(f"handle_request_cycle result for '{operation}': {type(result).__name__}")
         return result
 
     @pyqtSlot(dict)
@@ -172,9 +247,9 @@ class MainWindow(QMainWindow):
             return False
 
     def _handle_plot_mse_line(self, params: dict):
-        """Plot MSE history data on canvas."""
+        """Plot MSE history and per-generation population statistics on canvas."""
         mse_data = params.get("mse_data", [])
-        self.main_tab.plot_canvas.plot_mse_history(mse_data)
+        self.main_tab.plot_canvas.plot_mse_history(mse_data, params.get("population_data"))
         return True
 
     def _handle_calculation_finished(self, params: dict):
@@ -214,13 +289,30 @@ class MainWindow(QMainWindow):
             )
             for reaction in reactions
         }
-        fit_results = self.handle_request_cycle(
-            "model_free_calculation", OperationType.MODEL_FREE_CALCULATION, calculation_params=params
+        if self.model_free_future is not None:
+            self.model_free_future.cancel()
+        self.model_free_future = self.base_slots.request_async(
+            "model_free_calculation",
+            OperationType.MODEL_FREE_CALCULATION,
+            on_done=lambda future: self._on_model_free_calculation_done(future, series_name, params["fit_method"]),
+            on_progress=lambda progress: logger.debug(f"Model-free calculation progress: {progress}"),
+            calculation_params=params,
         )
+
+    def _on_model_free_calculation_done(self, future, series_name: str, fit_method: str):
+        """Store and show model-free results once the worker has finished."""
+        if future is self.model_free_future:
+            self.model_free_future = None
+        if future.cancelled():
+            return
+        fit_results = future.result()
+        if isinstance(fit_results, dict) and "error" in fit_results:
+            console.log(f"\nModel-free calculation '{fit_method}' failed: {fit_results['error']}\n")
+            return
         if not fit_results:
             console.log("\nThere are not enough beta columns for model free calculation.\n")
             return
-        update_data = {"model_free_results": {params["fit_method"]: fit_results}}
+        update_data = {"model_free_results": {fit_method: fit_results}}
         self.handle_request_cycle(
             "series_data", OperationType.UPDATE_SERIES, series_name=series_name, update_data=update_data
         )
@@ -463,7 +555,7 @@ class MainWindow(QMainWindow):
             df = self.handle_request_cycle("file_data", OperationType.GET_DF_DATA, **params)
             self.main_tab.plot_canvas.plot_data_from_dataframe(df)
         else:
-            logger.error(f"{self.actor_name} no response in handle_request_from_main_tab")
+            logger.error(f"{self.actor_name}: transformation of '{params.get('file_name')}' was not applied")
 
     def _handle_differential(self, params):
         params["function"] = self.handle_request_cycle("active_file_operations", OperationType.TO_DTG)
@@ -472,7 +564,7 @@ class MainWindow(QMainWindow):
             df = self.handle_request_cycle("file_data", OperationType.GET_DF_DATA, **params)
             self.main_tab.plot_canvas.plot_data_from_dataframe(df)
         else:
-            logger.error(f"{self.actor_name} no response in handle_request_from_main_tab")
+            logger.error(f"{self.actor_name}: transformation of '{params.get('file_name')}' was not applied")
 
     def _handle_add_reaction(self, params):
         """Add new reaction to deconvolution analysis."""
@@ -526,6 +618,8 @@ class MainWindow(QMainWindow):
 
     def _handle_stop_calculation(self, params):
         """Stop currently running calculation."""
+        if self.model_free_future is not None:
+            self.model_free_future.cancel()
         _ = self.handle_request_cycle("calculations", OperationType.STOP_CALCULATION)
 
     def _handle_add_new_series(self, params):
@@ -535,32 +629,25 @@ class MainWindow(QMainWindow):
             logger.warning(f"{self.actor_name} user canceled or gave invalid input for new series.")
             return
 
-        df_with_rates = {}
+        curves_by_rate = {}
         experimental_masses = []
         for file_name, heating_rate, mass in selected_files:
             experimental_masses.append(mass)
-            df = df_copies[file_name].copy()
-            other_col = None
-            for col in df.columns:
-                if col.lower() != "temperature":
-                    other_col = col
-
             rate_col_name = str(heating_rate)
-            if rate_col_name in df_with_rates:
+            if rate_col_name in curves_by_rate:
                 logger.error(
                     f"Duplicate heating rate '{heating_rate}' for file '{file_name}'. "
                     "Each heating rate must be unique."
                 )
                 continue
+            curves_by_rate[rate_col_name] = df_copies[file_name]
 
-            df.rename(columns={other_col: rate_col_name}, inplace=True)
-            df_with_rates[file_name] = df
-
-        merged_df = reduce(
-            lambda left, right: pd.merge(left, right, on="temperature", how="outer"), df_with_rates.values()
-        )
-        merged_df.sort_values(by="temperature", inplace=True)
-        merged_df.interpolate(method="linear", inplace=True)
+        try:
+            merged_df = build_series_dataframe(curves_by_rate)
+        except ValueError as e:
+            logger.error(f"{self.actor_name}: couldn't build series '{series_name}': {e}")
+            console.log(f"\nCouldn't add series '{series_name}': {e}\n")
+            return
 
         self.main_tab.plot_canvas.plot_data_from_dataframe(merged_df)
 
@@ -605,6 +692,7 @@ class MainWindow(QMainWindow):
         params["calculation_scenario"] = "model_based_calculation"
         params["reaction_scheme"] = series_entry.get("reaction_scheme")
         params["experimental_data"] = series_entry.get("experimental_data")
+        params["experimental_arrays"] = series_entry.get("experimental_arrays")
         params["calculation_settings"] = series_entry.get("calculation_settings")
 
         logger.info(f"Emitting model_based_calculation_signal with params: {params}")
@@ -618,24 +706,32 @@ class MainWindow(QMainWindow):
         Args:
             params: Dictionary containing best parameter values from optimization
                    Format: {
-                       "reaction_index": int,    # Index of the reaction being optimized
-                       "Ea": float,             # Best activation energy value
-                       "logA": float,           # Best log(A) value
-                       "contribution": float,   # Best contribution value
+                       "best_values": [         # One entry per reaction
+                           {
+                               "reaction_index": int,   # Index of the reaction being optimized
+                               "Ea": float,             # Best activation energy value
+                               "logA": float,           # Best log(A) value
+                               "contribution": float,   # Best contribution value
+                           },
+                       ],
                        "mse": float             # Current best MSE value
                    }
+                   A single reaction may also be passed with its keys at the top level.
         """
         logger.debug(f"MainWindow._handle_update_model_based_best_values: Received best values: {params}")
 
-        # Extract best values data
-        best_values_data = {
-            "reaction_index": params.get("reaction_index", 0),
-            "Ea": params.get("Ea"),
-            "logA": params.get("logA"),
-            "contribution": params.get("contribution"),
-        }  # Route to ModelBasedTab for display update
+        entries = params.get("best_values") or [params]
         try:
-            self.main_tab.sub_sidebar.model_based.update_best_values(best_values_data)
+            for entry in entries:
+                # Route to ModelBasedTab for display update
+                self.main_tab.sub_sidebar.model_based.update_best_values(
+                    {
+                        "reaction_index": entry.get("reaction_index", 0),
+                        "Ea": entry.get("Ea"),
+                        "logA": entry.get("logA"),
+                        "contribution": entry.get("contribution"),
+                    }
+                )
             logger.debug("MainWindow: Successfully routed best values to ModelBasedTab")
             return {"success": True, "message": "Best values updated successfully"}
         except Exception as e:
@@ -643,7 +739,7 @@ class MainWindow(QMainWindow):
             return {"success": False, "error": str(e)}
 
     def update_model_simulation(self, series_name: str):
-        """Update model simulation and plot simulation curves."""
+        """Start the model simulation in the background; curves are plotted when it finishes."""
         logger.debug(f"update_model_simulation called for series: {series_name}")
 
         series_entry = self.handle_request_cycle(
@@ -664,10 +760,12 @@ class MainWindow(QMainWindow):
         logger.debug(f"Reaction scheme components: {len(reaction_scheme.get('components', []))}")
         logger.debug(f"Reaction scheme reactions: {len(reaction_scheme.get('reactions', []))}")
 
-        simulation_df = self.main_tab.sub_sidebar.model_based._simulate_reaction_model(
-            experimental_data, reaction_scheme
+        self.main_tab.sub_sidebar.model_based.request_simulation(
+            series_entry.get("experimental_arrays") or experimental_data, reaction_scheme
         )
 
+    def _plot_model_simulation(self, simulation_df: pd.DataFrame):
+        """Plot simulation curves delivered by the model-based panel."""
         if simulation_df is None or simulation_df.empty:
             logger.warning("Simulation returned empty dataframe")
             return
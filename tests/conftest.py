@@ -1,6 +1,7 @@
 """Common pytest fixtures for Open ThermoKinetics test suite.
 
 Provides fixtures for:
+- Isolation of the on-disk file cache (autouse)
 - Sample data (numpy arrays, DataFrames)
 - Test file paths
 - Qt application for GUI tests
@@ -19,6 +20,21 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# ============================================================================
+# Isolation fixtures
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def isolated_file_cache(tmp_path, monkeypatch):
+    """Point the parsed-file cache at a per-test directory instead of the user's home cache."""
+    from src.core.app_settings import FileCacheConfig
+
+    monkeypatch.setattr(
+        "src.core.file_cache.FILE_CACHE_CONFIG", FileCacheConfig(cache_dir=str(tmp_path / "file_cache"))
+    )
+
+
 # ============================================================================
 # Mock fixtures for BaseSlots-derived classes (Qt-free testing)
 # ============================================================================
@@ -39,6 +55,7 @@ def mock_signals():
     signals.request_signal = MagicMock()
     signals.request_signal.emit = MagicMock()
     signals.register_component = MagicMock()
+    signals.direct_dispatch = False
     return signals
 
 
@@ -1,8 +1,10 @@
 """Tests for base_signals module — signal-slot communication."""
 
+import time
 from unittest.mock import MagicMock
 
 import pytest
+from PyQt6.QtCore import QTimer
 
 from src.core.base_signals import BaseSignals, BaseSlots
 
@@ -179,6 +181,167 @@ class TestBaseSlots:
         assert requester.pending_requests[request_id]["received"] is False
 
 
+class EchoResponder(BaseSlots):
+    """Responder that answers every request synchronously with its operation name."""
+
+    def __init__(self, signals):
+        super().__init__("responder", signals)
+        self.requests = []
+
+    def process_request(self, params: dict) -> None:
+        self.requests.append(params)
+        params["data"] = f"done:{params['operation']}"
+        params["target"], params["actor"] = params["actor"], params["target"]
+        self.signals.response_signal.emit(params)
+
+
+class TestDirectDispatch:
+    """Tests for same-thread direct dispatch in handle_request_cycle."""
+
+    def test_direct_cycle_skips_request_signal(self, qtbot):
+        """Same-thread request should call the handler in place without emitting request_signal."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        responder = EchoResponder(signals)
+        emitted = []
+        signals.request_signal.connect(emitted.append)
+
+        assert signals.can_dispatch_directly("responder")
+        assert requester.handle_request_cycle("responder", "TEST_OP", value=1) == "done:TEST_OP"
+        assert emitted == []
+        assert responder.requests[0]["value"] == 1
+        assert requester.pending_requests == {}
+
+    def test_direct_cycle_with_shadowed_thread_attribute(self, qtbot):
+        """A responder whose `thread` attribute shadows QObject.thread() should still be dispatched directly."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        responder = EchoResponder(signals)
+        responder.thread = None
+
+        assert signals.can_dispatch_directly("responder")
+        assert requester.handle_request_cycle("responder", "TEST_OP") == "done:TEST_OP"
+
+    def test_signal_path_when_disabled(self, qtbot):
+        """With direct_dispatch off the request should travel through request_signal."""
+        signals = BaseSignals()
+        signals.direct_dispatch = False
+        requester = BaseSlots("requester", signals)
+        EchoResponder(signals)
+        emitted = []
+        signals.request_signal.connect(emitted.append)
+
+        assert requester.handle_request_cycle("responder", "TEST_OP") == "done:TEST_OP"
+        assert len(emitted) == 1
+
+    def test_late_response_falls_back_to_waiting(self, qtbot):
+        """A handler that answers later should still complete through the event loop."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+
+        def answer_later(params):
+            response = {**params, "actor": "responder", "target": "requester", "data": 42}
+            QTimer.singleShot(10, lambda: signals.response_signal.emit(response))
+
+        signals.register_component("responder", answer_later, MagicMock())
+
+        assert requester.handle_request_cycle("responder", "TEST_OP") == 42
+        assert signals._direct_responses == {}
+
+
+class WorkerResponder(BaseSlots):
+    """Responder that finishes deferred requests on a worker thread with progress."""
+
+    def __init__(self, signals):
+        super().__init__("worker", signals)
+
+    def process_request(self, params: dict) -> None:
+        response = {**params, "actor": "worker", "target": params["actor"]}
+
+        def work():
+            for step in range(3):
+                if self.signals.is_cancelled(params["request_id"]):
+                    return
+                self.report_progress(params, step)
+                time.sleep(0.01)
+            response["data"] = params["value"] * 2
+
+        self.respond_later(response, work)
+
+
+class FailingResponder(BaseSlots):
+    """Responder whose deferred work raises on the worker thread."""
+
+    def __init__(self, signals):
+        super().__init__("failing", signals)
+
+    def process_request(self, params: dict) -> None:
+        def work():
+            raise ValueError("matrix is singular")
+
+        self.respond_later({**params, "actor": "failing", "target": params["actor"]}, work)
+
+
+class TestRequestAsync:
+    """Tests for the non-blocking future-based request API."""
+
+    def test_sync_handler_completes_future(self, qtbot):
+        """Synchronous handler should complete the future during the emit."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        EchoResponder(signals)
+        done = []
+
+        future = requester.request_async("responder", "TEST_OP", on_done=done.append)
+
+        assert future.done()
+        assert future.result() == "done:TEST_OP"
+        assert done == [future]
+        assert requester.pending_futures == {}
+
+    def test_worker_result_and_progress(self, qtbot):
+        """Worker-thread handler should report progress and complete later without blocking."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        WorkerResponder(signals)
+        progress = []
+
+        future = requester.request_async("worker", "TEST_OP", on_progress=progress.append, value=21)
+        assert not future.done()
+
+        qtbot.waitUntil(future.done, timeout=2000)
+        assert future.result() == 42
+        assert progress == [0, 1, 2]
+
+    def test_worker_error_is_reported(self, qtbot):
+        """An exception on the worker thread should reach the requester as an error message."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        FailingResponder(signals)
+
+        future = requester.request_async("failing", "TEST_OP")
+
+        qtbot.waitUntil(future.done, timeout=2000)
+        assert future.result() == {"error": "matrix is singular"}
+
+    def test_cancel_ignores_late_response(self, qtbot):
+        """Cancelled future should not be completed by the late response."""
+        signals = BaseSignals()
+        requester = BaseSlots("requester", signals)
+        WorkerResponder(signals)
+        done = []
+
+        future = requester.request_async("worker", "TEST_OP", on_done=done.append, value=1)
+        assert future.cancel() is True
+
+        assert future.cancelled()
+        assert done == [future]
+        with pytest.raises(RuntimeError):
+            future.result()
+        qtbot.waitUntil(lambda: not signals.cancelled_requests, timeout=2000)
+        assert future.cancelled()
+
+
 class TestBaseSlotsMockVersion:
     """Tests for BaseSlots using mock_signals fixture (no Qt event loop)."""
 
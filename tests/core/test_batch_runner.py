@@ -0,0 +1,214 @@
+"""Tests for batch_runner module - headless processing of job files."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.app_settings import BATCH_CONFIG
+from src.core.batch_runner import HeadlessSession, load_job, normalize_job, run_batch, run_sample, write_result_tables
+
+RESOURCES_DIR = Path(__file__).resolve().parents[2] / "resources"
+HEATING_RATES = (3, 5, 10)
+
+
+def resource_files() -> list[dict]:
+    return [
+        {"path": f"NH4_rate_{rate}.csv", "heating_rate": rate, "reactions": f"NH4_rate_{rate}_3_rcts_ads_ads_ads.json"}
+        for rate in HEATING_RATES
+    ]
+
+
+class TestNormalizeJob:
+    """Tests for job validation and defaults merging."""
+
+    def test_merges_defaults_and_resolves_paths(self, tmp_path):
+        """Should deep-merge defaults into samples and resolve paths against the job directory."""
+        job = {
+            "output_dir": "out",
+            "defaults": {
+                "model_free": [{"fit_method": "Friedman"}],
+                "model_based": {"reaction_scheme": {"reactions": [{"from": "A", "to": "B"}]}, "method_parameters": {}},
+            },
+            "samples": [
+                {
+                    "name": "s1",
+                    "files": [{"path": "rate_3.csv", "heating_rate": 3, "reactions": "r3.json"}],
+                    "model_based": {"method_parameters": {"maxiter": 5}},
+                },
+                {"files": [{"path": "rate_5.csv", "heating_rate": 5, "mass": 2.5}], "model_free": None},
+            ],
+        }
+
+        result = normalize_job(job, str(tmp_path))
+
+        assert result["output_dir"] == str(tmp_path / "out")
+        first, second = result["samples"]
+        assert first["files"][0] == {
+            "path": str(tmp_path / "rate_3.csv"),
+            "heating_rate": 3,
+            "reactions": str(tmp_path / "r3.json"),
+            "mass": 1.0,
+            "delimiter": ",",
+            "skip_rows": 0,
+            "columns": None,
+        }
+        assert first["model_free"] == [{"fit_method": "Friedman"}]
+        assert first["model_based"]["method_parameters"] == {"maxiter": 5}
+        assert first["model_based"]["reaction_scheme"]["reactions"] == [{"from": "A", "to": "B"}]
+        assert second["name"] == "sample_2"
+        assert second["files"][0]["mass"] == 2.5
+        assert second["model_free"] == []
+
+    @pytest.mark.parametrize(
+        "job, message",
+        [
+            ({"samples": []}, "non-empty 'samples'"),
+            ({"samples": [{"name": "a", "files": []}]}, "has no files"),
+            ({"samples": [{"name": "a", "files": [{"path": "x.csv"}]}]}, "'path' and 'heating_rate'"),
+            (
+                {"samples": [{"name": "a", "files": [{"path": "x.csv", "heating_rate": 3}]}] * 2},
+                "Duplicate sample name",
+            ),
+            (
+                {"samples": [{"files": [{"path": "x.csv", "heating_rate": 3}, {"path": "y.csv", "heating_rate": 3}]}]},
+                "same heating rate",
+            ),
+            (
+                {"samples": [{"files": [{"path": "x.csv", "heating_rate": 3}], "model_fit": {"fit_method": "?"}}]},
+                "unknown model_fit fit_method",
+            ),
+            (
+                {
+                    "samples": [
+                        {"files": [{"path": "x.csv", "heating_rate": 3}], "model_based": {"reaction_scheme": {}}}
+                    ]
+                },
+                "reaction_scheme with reactions",
+            ),
+        ],
+    )
+    def test_invalid_jobs(self, job, message):
+        """Should reject malformed jobs with a ValueError naming the problem."""
+        with pytest.raises(ValueError, match=message):
+            normalize_job(job)
+
+    def test_load_job_defaults_output_dir(self, tmp_path):
+        """Should read a JSON job and place results next to it by default."""
+        path = tmp_path / "night_run.json"
+        path.write_text(json.dumps({"samples": [{"files": [{"path": "x.csv", "heating_rate": 3}]}]}))
+
+        job = load_job(str(path))
+
+        assert job["output_dir"] == str(tmp_path / "night_run_results")
+        assert job["samples"][0]["files"][0]["path"] == str(tmp_path / "x.csv")
+
+    def test_load_job_invalid_json(self, tmp_path):
+        """Should report unparsable job files as ValueError."""
+        path = tmp_path / "job.json"
+        path.write_text("{samples: ")
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            load_job(str(path))
+
+    def test_load_job_yaml_names_batch_extra(self, tmp_path, mocker):
+        """Should point to the batch extra when PyYAML is missing."""
+        mocker.patch("src.core.batch_runner.yaml", None)
+        path = tmp_path / "job.yaml"
+        path.write_text("samples: []\n")
+
+        with pytest.raises(ValueError, match=r"solid-state-kinetics\[batch\]"):
+            load_job(str(path))
+
+
+class TestWriteResultTables:
+    """Tests for exporting nested analysis results."""
+
+    def test_writes_nested_frames(self, tmp_path):
+        """Should write one CSV per DataFrame, named by its keys, and skip other values."""
+        frame = pd.DataFrame({"conversion": [0.1, 0.2], "Ea": [100.0, 110.0]})
+        results = {"reaction_1": {3: frame, "note": "skip"}, "reaction/2": frame}
+
+        write_result_tables(results, str(tmp_path / "Friedman"))
+
+        assert sorted(p.name for p in (tmp_path / "Friedman").iterdir()) == ["reaction_1_3.csv", "reaction_2.csv"]
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "Friedman" / "reaction_1_3.csv"), frame)
+
+
+class TestHeadlessSession:
+    """Tests for the actor-driving session of one sample."""
+
+    def test_bootstrap_workers_forced(self, qtbot, mocker):
+        """Should run model-free bootstrap resampling with the batch optimizer worker count."""
+        session = HeadlessSession()
+        mocker.patch.object(session, "reaction_data", return_value={})
+        request = mocker.patch.object(session, "handle_request_cycle", return_value={"reaction_1": pd.DataFrame()})
+        spec = {"fit_method": "Friedman", "bootstrap": {"n_resamples": 10, "workers": 8}}
+
+        session.run_analysis("series", "model_free", spec)
+
+        params = request.call_args_list[0].kwargs["calculation_params"]
+        assert params["bootstrap"] == {"n_resamples": 10, "workers": BATCH_CONFIG.optimizer_workers}
+        assert spec["bootstrap"]["workers"] == 8
+
+
+class TestRunSample:
+    """End-to-end tests on the bundled NH4 measurements with minimal optimizer budgets."""
+
+    def test_analyses_and_model_based_fit(self, qtbot, tmp_path):
+        """Should run model-free and model-based analyses and save tables, project and summary."""
+        job = normalize_job(
+            {
+                "samples": [
+                    {
+                        "name": "NH4 run",
+                        "files": resource_files(),
+                        "model_free": [{"fit_method": "Friedman"}],
+                        "model_based": {
+                            "reaction_scheme": {
+                                "components": [{"id": "A"}, {"id": "B"}],
+                                "reactions": [{"from": "A", "to": "B", "allowed_models": ["F1", "F2"]}],
+                            },
+                            "method_parameters": {
+                                "maxiter": 1,
+                                "popsize": 3,
+                                "seed": 1,
+                                "contribution_parameterization": "simplex",
+                            },
+                        },
+                    }
+                ]
+            },
+            str(RESOURCES_DIR),
+        )
+
+        summary = run_sample(job["samples"][0], str(tmp_path))
+
+        sample_dir = tmp_path / "NH4_run"
+        assert summary["status"] == "ok", summary["error"]
+        assert summary["model_free"] == ["Friedman"]
+        assert np.isfinite(summary["model_based"]["mse"])
+        assert summary["model_based"]["best_values"][0]["model"] in ("F1", "F2")
+        assert (sample_dir / "NH4_run.otk").exists()
+        assert sorted(p.name for p in (sample_dir / "model_free" / "Friedman").iterdir()) == [
+            "reaction_1.csv",
+            "reaction_2.csv",
+            "reaction_3.csv",
+        ]
+        assert json.loads((sample_dir / "summary.json").read_text()) == summary
+
+    def test_failure_is_reported(self, qtbot, tmp_path):
+        """Should end a sample with a missing file as failed and still write the batch summary."""
+        job = normalize_job({"samples": [{"name": "broken", "files": [{"path": "missing.csv", "heating_rate": 3}]}]})
+        job["output_dir"] = str(tmp_path)
+        finished = []
+
+        summaries = run_batch(job, workers=1, on_sample_done=lambda summary, done, total: finished.append(done))
+
+        assert summaries[0]["status"] == "failed"
+        assert summaries[0]["error"]
+        assert finished == [1]
+        table = pd.read_csv(tmp_path / "summary.csv")
+        assert table.loc[0, "sample"] == "broken" and table.loc[0, "status"] == "failed"
@@ -1,8 +1,10 @@
 """Tests for calculation module — calculation orchestration."""
 
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from scipy.optimize import OptimizeResult
 
 from src.core.app_settings import OperationType
 from src.core.calculation import Calculations
@@ -20,7 +22,7 @@ class TestCalculationsInit:
         assert calc.best_mse == float("inf")
         assert calc.best_combination is None
         assert calc.calc_params == {}
-        assert calc.mse_history == []
+        assert len(calc.mse_history) == 0
         assert calc.calculation_active is False
 
     def test_calculations_has_strategies(self, mock_signals):
@@ -154,6 +156,33 @@ class TestCalculationsRunScenario:
             # Should raise ValueError internally and log error
             assert calc.thread is None
 
+    def test_run_model_based_without_constraints_uses_deferred_updating(self, mock_signals):
+        """Unconstrained model-based runs should drop the parameterization key and update deferred."""
+        calc = Calculations(mock_signals)
+        params = {
+            "calculation_scenario": "model_based_calculation",
+            "calculation_settings": {
+                "method_parameters": {"updating": "immediate", "contribution_parameterization": "simplex"}
+            },
+        }
+
+        with (
+            patch("src.core.calculation.SCENARIO_REGISTRY") as mock_registry,
+            patch.object(calc, "start_differential_evolution") as mock_start,
+        ):
+            mock_scenario = mock_registry.get.return_value.return_value
+            mock_scenario.get_bounds.return_value = [(0.0, 1.0)]
+            mock_scenario.get_optimization_method.return_value = "differential_evolution"
+            mock_scenario.get_result_strategy_type.return_value = "model_based_calculation"
+            mock_scenario.get_constraints.return_value = []
+
+            calc.run_calculation_scenario(params)
+
+        kwargs = mock_start.call_args.kwargs
+        assert "contribution_parameterization" not in kwargs
+        assert kwargs["updating"] == "deferred"
+        assert kwargs["constraints"] == []
+
 
 class TestCalculationsDifferentialEvolution:
     """Tests for start_differential_evolution method."""
@@ -199,6 +228,56 @@ class TestCalculationsHandleNewBestResult:
         calc.handle_new_best_result(result)
 
 
+class TestCalculationsProgressPolling:
+    """Tests for draining optimizer progress on the GUI thread."""
+
+    def test_poll_delivers_latest_best_once(self, mock_signals):
+        """poll_progress should hand only the newest best result to the strategy."""
+        calc = Calculations(mock_signals)
+        calc.result_strategy = MagicMock()
+
+        calc.progress.offer({"best_mse": 0.5, "params": [1.0]})
+        calc.progress.offer({"best_mse": 0.1, "params": [2.0]})
+        calc.poll_progress()
+        calc.poll_progress()
+
+        calc.result_strategy.handle.assert_called_once_with({"best_mse": 0.1, "params": [2.0]})
+
+    def test_calculation_finished_drains_pending_result(self, mock_signals):
+        """_calculation_finished should deliver a result published after the last poll."""
+        calc = Calculations(mock_signals)
+        strategy = MagicMock()
+        calc.result_strategy = strategy
+        calc.progress_timer.start()
+        calc.progress.offer({"best_mse": 0.1, "params": [2.0]})
+
+        with patch.object(calc, "handle_request_cycle"):
+            calc._calculation_finished(Exception("stopped"))
+
+        strategy.handle.assert_called_once()
+        assert not calc.progress_timer.isActive()
+
+    def test_poll_plots_history_only_when_changed(self, mock_signals):
+        """poll_progress should request one MSE plot per change of the histories."""
+        calc = Calculations(mock_signals)
+
+        with patch.object(calc, "handle_request_cycle") as mock_request:
+            calc.poll_progress()
+            mock_request.assert_not_called()
+
+            calc.mse_history.append((datetime(2024, 1, 1, 12), 0.5))
+            calc.population_history.append((datetime(2024, 1, 1, 12), 0.5, 0.9))
+            calc.poll_progress()
+            calc.poll_progress()
+
+        mock_request.assert_called_once_with(
+            "main_window",
+            OperationType.PLOT_MSE_LINE,
+            mse_data=calc.mse_history,
+            population_data=calc.population_history,
+        )
+
+
 class TestCalculationsCalculationFinished:
     """Tests for _calculation_finished method."""
 
@@ -218,6 +297,20 @@ class TestCalculationsCalculationFinished:
         assert calc.calculation_active is False
         assert calc.result_strategy is None
 
+    def test_calculation_finished_maps_solution(self, mock_signals):
+        """_calculation_finished should report the solution mapped by the running scenario."""
+        calc = Calculations(mock_signals)
+        calc.scenario = MagicMock()
+        calc.scenario.map_solution.return_value = [1.0, 0.5]
+        result = OptimizeResult(x=[1.0, 2.0], fun=0.01)
+
+        with patch("src.core.calculation.console") as mock_console, patch.object(calc, "handle_request_cycle"):
+            calc._calculation_finished(result)
+
+        assert calc.scenario is None
+        assert result.x == [1.0, 0.5]
+        assert "[1.0, 0.5]" in mock_console.log.call_args[0][0]
+
     def test_calculation_finished_exception(self, mock_signals):
         """_calculation_finished should handle exceptions."""
         calc = Calculations(mock_signals)
@@ -218,3 +218,106 @@ class TestCalculationsDataProcessRequest:
 
         response = mock_signals.response_signal.emit.call_args[0][0]
         assert response["data"] == {}
+
+
+class TestCalculationsDataBatchRequests:
+    """Tests for GET_VALUES / SET_VALUES batch operations."""
+
+    @pytest.fixture
+    def calc_data(self, mock_signals):
+        """Create CalculationsData instance."""
+        return CalculationsData(signals=mock_signals)
+
+    def test_set_values_single_notification(self, calc_data, mock_signals):
+        """Should apply all values and notify listeners once."""
+        received = []
+        calc_data.dataChanged.connect(received.append)
+        calc_data.process_request(
+            {
+                "operation": OperationType.SET_VALUES,
+                "actor": "test",
+                "request_id": "r",
+                "paths": [["file", "reaction_0", "coeffs", "h"], ["file", "reaction_0", "coeffs", "z"]],
+                "values": [1.0, 450.0],
+            }
+        )
+
+        assert mock_signals.response_signal.emit.call_args[0][0]["data"] is True
+        assert calc_data.get_value(["file", "reaction_0", "coeffs"]) == {"h": 1.0, "z": 450.0}
+        assert len(received) == 1
+        assert len(received[0]["dirty_paths"]) == 2
+
+    def test_set_values_length_mismatch(self, calc_data, mock_signals):
+        """Should reject batches where paths and values differ in length."""
+        calc_data.process_request(
+            {
+                "operation": OperationType.SET_VALUES,
+                "actor": "test",
+                "request_id": "r",
+                "paths": [["file", "h"]],
+                "values": [],
+            }
+        )
+
+        assert mock_signals.response_signal.emit.call_args[0][0]["data"] is False
+        assert calc_data.exists(["file"]) is False
+
+    def test_get_values(self, calc_data, mock_signals):
+        """Should return values in request order with {} for missing paths."""
+        calc_data.set_value(["file", "h"], 1.0)
+        calc_data.process_request(
+            {
+                "operation": OperationType.GET_VALUES,
+                "actor": "test",
+                "request_id": "r",
+                "paths": [["file", "h"], ["file", "missing"]],
+            }
+        )
+
+        assert mock_signals.response_signal.emit.call_args[0][0]["data"] == [1.0, {}]
+
+
+class TestCalculationsDataChangeNotifications:
+    """Tests for snapshots and dataChanged notifications."""
+
+    @pytest.fixture
+    def calc_data(self, mock_signals):
+        """Create CalculationsData instance with one reaction."""
+        cd = CalculationsData(signals=mock_signals)
+        cd.set_value(["file", "reaction_0", "coeffs", "h"], 1.0)
+        return cd
+
+    def test_full_data_does_not_leak_inner_state(self, calc_data, mock_signals):
+        """GET_FULL_DATA result should be safe to mutate."""
+        calc_data.process_request({"operation": OperationType.GET_FULL_DATA, "actor": "test", "request_id": "r"})
+        data = mock_signals.response_signal.emit.call_args[0][0]["data"]
+        data["file"]["reaction_0"]["coeffs"]["h"] = 5.0
+
+        assert calc_data.get_value(["file", "reaction_0", "coeffs", "h"]) == 1.0
+
+    def test_set_value_request_emits_dirty_paths(self, calc_data):
+        """Should emit dataChanged with the version and changed paths once per request."""
+        received = []
+        calc_data.dataChanged.connect(received.append)
+        calc_data.process_request(
+            {
+                "operation": OperationType.SET_VALUE,
+                "actor": "test",
+                "request_id": "r",
+                "path_keys": ["file", "reaction_0", "coeffs", "h"],
+                "value": 2.0,
+            }
+        )
+
+        assert len(received) == 1
+        assert ("file", "reaction_0", "coeffs", "h") in received[0]["dirty_paths"]
+        assert received[0]["version"] == calc_data.snapshot().version
+
+    def test_get_snapshot_request(self, calc_data, mock_signals):
+        """GET_SNAPSHOT should return an immutable snapshot of the store."""
+        calc_data.process_request({"operation": OperationType.GET_SNAPSHOT, "actor": "test", "request_id": "r"})
+        snapshot = mock_signals.response_signal.emit.call_args[0][0]["data"]
+
+        assert snapshot.get(["file", "reaction_0", "coeffs", "h"]) == 1.0
+        with pytest.raises(TypeError):
+            snapshot.leaves[("file",)] = {}
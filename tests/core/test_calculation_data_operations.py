@@ -16,7 +16,6 @@ class TestCalculationsDataOperationsInit:
         ops = CalculationsDataOperations(mock_signals)
 
         assert ops.actor_name == "calculations_data_operations"
-        assert ops.last_plot_time == 0
         assert ops.calculations_in_progress is False
         assert ops.reaction_variables == {}
         assert ops.reaction_chosen_functions == {}
@@ -79,14 +78,14 @@ class TestProtectedPlotUpdateCurves:
 
             mock_highlight.assert_not_called()
 
-    def test_throttle_plot_updates(self, mock_signals):
-        """Should throttle rapid plot updates."""
+    def test_rapid_updates_not_dropped(self, mock_signals):
+        """Should replot on every update so the final state is always drawn."""
         ops = CalculationsDataOperations(mock_signals)
-        ops.last_plot_time = 100  # Far in the past
 
         with patch.object(ops, "highlight_reaction") as mock_highlight:
-            ops._protected_plot_update_curves(["file"], {})
-            mock_highlight.assert_called_once()
+            for _ in range(3):
+                ops._protected_plot_update_curves(["file"], {})
+            assert mock_highlight.call_count == 3
 
 
 class TestUpdateValue:
@@ -218,7 +217,7 @@ class TestUpdateReactionsParams:
         ops = CalculationsDataOperations(mock_signals)
         ops.reaction_variables = {"reaction_1": {"h", "z", "w"}}
 
-        with patch.object(ops, "update_value") as mock_update:
+        with patch.object(ops, "handle_request_cycle", return_value=True) as mock_request:
             ops.update_reactions_params(
                 ["file"],
                 {
@@ -226,5 +225,11 @@ class TestUpdateReactionsParams:
                     "reactions_params": [1.0, 450.0, 30.0],
                 },
             )
-            # update_value should be called for each coefficient
-            assert mock_update.called
+
+        # All coefficients and bounds are applied in a single batched request
+        mock_request.assert_called_once()
+        args, kwargs = mock_request.call_args
+        assert args == ("calculations_data", OperationType.SET_VALUES)
+        assert len(kwargs["paths"]) == 9
+        assert kwargs["paths"][0] == ["file", "reaction_1", "lower_bound_coeffs", "h"]
+        assert kwargs["values"][:3] == [1.0, 1.0, 1.0]
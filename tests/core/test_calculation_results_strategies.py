@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.core.app_settings import OperationType
 from src.core.calculation_results_strategies import (
     BestResultStrategy,
     DeconvolutionStrategy,
@@ -279,3 +280,32 @@ class TestModelBasedCalculationStrategy:
             strategy.handle(result)
 
         assert mock_calc.best_mse == 0.05
+
+    def test_best_values_sent_in_one_request(self):
+        """handle should send best values of all reactions in a single request."""
+        mock_calc = MagicMock()
+        mock_calc.calc_params = {
+            "reaction_scheme": {
+                "reactions": [
+                    {"from": "A", "to": "B", "allowed_models": ["F1"]},
+                    {"from": "B", "to": "C", "allowed_models": ["F1", "R2", "A2"]},
+                ]
+            }
+        }
+        mock_calc.best_mse = float("inf")
+        mock_calc.mse_history = []
+        strategy = ModelBasedCalculationStrategy(mock_calc)
+
+        with patch("src.core.calculation_results_strategies.console"):
+            strategy.handle({"mse": 0.05, "params": [10.0, 12.0, 100.0, 120.0, 0, 1.6, 0.4, 0.6]})
+
+        best_values_calls = [
+            call
+            for call in mock_calc.handle_request_cycle.call_args_list
+            if call.args[1] == OperationType.UPDATE_MODEL_BASED_BEST_VALUES
+        ]
+        assert len(best_values_calls) == 1
+        best_values = best_values_calls[0].kwargs["best_values"]
+        assert [entry["Ea"] for entry in best_values] == [100.0, 120.0]
+        assert best_values[1]["contribution"] == 0.6
+        assert [entry["model"] for entry in best_values] == ["F1", "A2"]
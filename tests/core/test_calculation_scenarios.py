@@ -1,10 +1,12 @@
 """Tests for calculation_scenarios module — optimization scenarios."""
 
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.optimize import OptimizeResult
 
 from src.core.calculation_scenarios import (
     SCENARIO_REGISTRY,
@@ -14,8 +16,13 @@ from src.core.calculation_scenarios import (
     constraint_fun,
     extract_chains,
     get_core_params_format_info,
+    integrate_ode_for_beta,
     make_de_callback,
+    simulate_model_mass,
 )
+from src.core.compiled_scheme import CompiledScheme
+from src.core.optimization_progress import BestResultSlot
+from src.core.series_data import ExperimentalSeries
 
 
 class TestBaseCalculationScenario:
@@ -123,6 +130,30 @@ class TestDeconvolutionScenario:
 
         assert callable(target_func)
 
+    def test_target_function_publishes_best_result(self, mock_signals):
+        """Target function should publish improvements to the progress slot with a params copy."""
+        mock_calcs = MagicMock()
+        mock_calcs.calculation_active = True
+        mock_calcs.progress = BestResultSlot()
+
+        temperature = np.linspace(300, 600, 100)
+        intensity = np.exp(-((temperature - 450) ** 2) / (2 * 30**2))
+        params = {
+            "reaction_variables": {"r1": [0.8, 450, 30]},
+            "reaction_combinations": [["gauss"]],
+            "experimental_data": pd.DataFrame({"temperature": temperature, "intensity": intensity}),
+        }
+        target_func = DeconvolutionScenario(params, mock_calcs).get_target_function()
+
+        params_array = np.array([1.0, 450.0, 30.0])
+        mse = target_func(params_array)
+        params_array[0] = -1.0
+        target_func(np.array([5.0, 300.0, 10.0]))
+
+        result = mock_calcs.progress.take()
+        assert result["best_mse"] == mse
+        np.testing.assert_array_equal(result["params"], [1.0, 450.0, 30.0])
+
 
 class TestModelBasedScenario:
     """Tests for ModelBasedScenario."""
@@ -190,6 +221,18 @@ class TestModelBasedScenario:
         with pytest.raises(ValueError, match="No 'reactions'"):
             scenario.get_bounds()
 
+    def test_get_target_function_uses_experimental_arrays(self, mock_signals, model_based_params):
+        """get_target_function should take betas and mass views from experimental_arrays."""
+        mock_calcs = MagicMock()
+        arrays = ExperimentalSeries.from_dataframe(model_based_params.pop("experimental_data"))
+        scenario = ModelBasedScenario({**model_based_params, "experimental_arrays": arrays}, mock_calcs)
+
+        target = scenario.get_target_function()
+
+        assert target.betas == [5.0]
+        assert np.shares_memory(target.all_exp_masses[0], arrays.masses)
+        np.testing.assert_allclose(target.exp_temperature, arrays.temperature + 273.15)
+
     def test_get_constraints(self, mock_signals, model_based_params):
         """get_constraints should return NonlinearConstraint list."""
         mock_calcs = MagicMock()
@@ -217,6 +260,53 @@ class TestModelBasedScenario:
 
         assert len(constraints) == 1
 
+    def test_simplex_mode_drops_constraints(self, mock_signals, model_based_params):
+        """Simplex contribution mode should run unconstrained and feed normalized contributions."""
+        mock_calcs = MagicMock()
+        mock_calcs.stop_event.is_set.return_value = False
+        model_based_params["calculation_settings"]["method_parameters"] = {"contribution_parameterization": "simplex"}
+        scenario = ModelBasedScenario(model_based_params, mock_calcs)
+
+        assert scenario.get_constraints() == []
+
+        target = scenario.get_target_function()
+        target(np.array([8.0, 120.0, 0.0, 0.3]))
+        assert list(target.best_params)[3] == pytest.approx(1.0)
+
+    def test_simplex_mode_falls_back_for_shared_chains(self, mock_signals):
+        """Simplex mode should keep the constraint when chains share reactions."""
+        params = {
+            "reaction_scheme": {
+                "components": [{"id": "A"}, {"id": "B"}, {"id": "C"}, {"id": "D"}],
+                "reactions": [
+                    {"from": "A", "to": "B", "allowed_models": ["F2"]},
+                    {"from": "B", "to": "C", "allowed_models": ["F2"]},
+                    {"from": "B", "to": "D", "allowed_models": ["F2"]},
+                ],
+            },
+            "calculation_settings": {"method_parameters": {"contribution_parameterization": "simplex"}},
+            "experimental_arrays": MagicMock(),
+        }
+        with patch("src.core.calculation_scenarios.logger") as mock_logger:
+            scenario = ModelBasedScenario(params, MagicMock())
+            constraints = scenario.get_constraints()
+            scenario.get_target_function()
+
+        assert scenario.simplex_contributions is False
+        assert len(constraints) == 1
+        mock_logger.warning.assert_called_once()
+
+    def test_map_solution_normalizes_simplex_contributions(self, mock_signals, model_based_params):
+        """map_solution should report contributions in their normalized form only in simplex mode."""
+        x = np.array([8.0, 120.0, 0.0, 0.3])
+        assert ModelBasedScenario(model_based_params, MagicMock()).map_solution(x) is x
+
+        model_based_params["calculation_settings"]["method_parameters"] = {"contribution_parameterization": "simplex"}
+        mapped = ModelBasedScenario(model_based_params, MagicMock()).map_solution(x)
+
+        np.testing.assert_allclose(mapped, [8.0, 120.0, 0.0, 1.0])
+        assert x[3] == 0.3
+
 
 class TestExtractChains:
     """Tests for extract_chains function."""
@@ -291,6 +381,41 @@ class TestConstraintFun:
         assert result[0] != pytest.approx(0.0)
 
 
+class TestSimulateModelMass:
+    """Tests for simulate_model_mass single-rate integration."""
+
+    @staticmethod
+    def _args():
+        temperature = np.linspace(400.0, 800.0, 60)
+        exp_mass = np.linspace(1.0, 0.4, 60)
+        scheme = CompiledScheme.from_scheme(
+            {
+                "components": [{"id": "A"}, {"id": "B"}],
+                "reactions": [{"from": "A", "to": "B", "allowed_models": ["F2"]}],
+            }
+        )
+        params = np.array([8.0, 120.0, 0.0, 1.0])
+        return 10.0, np.array([1.0]), params, scheme, temperature, exp_mass, 8.314
+
+    def test_matches_objective_term(self):
+        """Should return the curve whose MSE equals integrate_ode_for_beta's result."""
+        args = self._args()
+        model_mass, mse = simulate_model_mass(*args)
+
+        exp_mass = args[5]
+        assert model_mass.shape == exp_mass.shape
+        assert mse == pytest.approx(np.mean((model_mass - exp_mass) ** 2))
+        assert mse == pytest.approx(integrate_ode_for_beta(*args))
+
+    def test_stop_event_interrupts_integration(self):
+        """Should raise InterruptedError when stop_event is already set."""
+        stop_event = threading.Event()
+        stop_event.set()
+
+        with pytest.raises(InterruptedError):
+            simulate_model_mass(*self._args(), stop_event=stop_event)
+
+
 class TestMakeDeCallback:
     """Tests for make_de_callback function."""
 
@@ -305,10 +430,26 @@ class TestMakeDeCallback:
         target_obj.best_params = [1.0, 2.0]
 
         callback = make_de_callback(target_obj, mock_calcs)
-        result = callback([1.0, 2.0], 0.5)
+        result = callback(OptimizeResult(x=np.array([1.0, 2.0]), population_energies=np.array([0.5, 0.1])))
 
         assert result is False
 
+    def test_callback_records_population_statistics(self, mock_signals):
+        """Callback should record finite generation best and mean energies."""
+        mock_calcs = MagicMock()
+        mock_calcs.stop_event.is_set.return_value = False
+
+        target_obj = MagicMock()
+        target_obj.best_mse.value = 0.01
+        target_obj.best_params = [1.0, 2.0]
+
+        callback = make_de_callback(target_obj, mock_calcs)
+        callback(OptimizeResult(x=np.array([1.0, 2.0]), population_energies=np.array([0.5, 0.1, np.inf])))
+
+        ((_, best, mean),), _ = mock_calcs.population_history.append.call_args
+        assert best == pytest.approx(0.1)
+        assert mean == pytest.approx(0.3)
+
     def test_callback_returns_true_when_stopped(self, mock_signals):
         """Callback should return True when stop_event is set."""
         mock_calcs = MagicMock()
@@ -320,7 +461,7 @@ class TestMakeDeCallback:
         target_obj.best_params = [1.0, 2.0]
 
         callback = make_de_callback(target_obj, mock_calcs)
-        result = callback([1.0, 2.0], 0.5)
+        result = callback(OptimizeResult(x=np.array([1.0, 2.0]), population_energies=np.array([0.5, 0.1])))
 
         assert result is True
 
@@ -0,0 +1,93 @@
+"""Tests for compiled_scheme module - array form of model-based reaction schemes."""
+
+import numpy as np
+import pytest
+
+from src.core.app_settings import NUC_MODELS_TABLE
+from src.core.compiled_scheme import MODEL_CODES, UNKNOWN_MODEL_CODE, CompiledScheme
+
+
+@pytest.fixture
+def branched_scheme():
+    """A -> B -> C with a parallel A -> C branch."""
+    return {
+        "components": [{"id": "A"}, {"id": "B"}, {"id": "C"}],
+        "reactions": [
+            {"from": "A", "to": "B", "allowed_models": ["F2", "A2"]},
+            {"from": "B", "to": "C", "allowed_models": ["R3"]},
+            {"from": "A", "to": "C", "allowed_models": ["D1", "unknown"]},
+        ],
+    }
+
+
+def reference_rhs(T, y, beta, params, scheme, R):
+    """Per-reaction loop over the scheme dict, the layout the compiled form replaces."""
+    species = [c["id"] for c in scheme["components"]]
+    reactions = scheme["reactions"]
+    num_species, num_reactions = len(species), len(reactions)
+    dydt = np.zeros_like(y)
+    for i, reaction in enumerate(reactions):
+        src, tgt = species.index(reaction["from"]), species.index(reaction["to"])
+        allowed = reaction["allowed_models"]
+        model = NUC_MODELS_TABLE.get(allowed[int(np.clip(round(params[2 * num_reactions + i]), 0, len(allowed) - 1))])
+        f_e = model["differential_form"](y[src]) if model else y[src]
+        rate = 10 ** params[i] * np.exp(-params[num_reactions + i] * 1000 / (R * T)) / beta * f_e
+        dydt[src] -= rate
+        dydt[tgt] += rate
+        dydt[num_species + i] = rate
+    return dydt
+
+
+class TestCompiledScheme:
+    """Tests for CompiledScheme.from_scheme and its array operations."""
+
+    def test_incidence_and_chains(self, branched_scheme):
+        """Should build the stoichiometry matrix and one membership row per chain."""
+        compiled = CompiledScheme.from_scheme(branched_scheme)
+
+        np.testing.assert_array_equal(compiled.stoichiometry, [[-1, 0, -1], [1, -1, 0], [0, 1, 1]])
+        assert sorted(compiled.chains) == [(0, 1), (2,)]
+        residuals = compiled.chain_residuals(np.array([0.3, 0.7, 1.0]))
+        np.testing.assert_allclose(residuals, [0.0, 0.0], atol=1e-12)
+
+    def test_model_codes_round_into_allowed_list(self, branched_scheme):
+        """Should round and clip model indices per reaction and keep unknown names coded."""
+        compiled = CompiledScheme.from_scheme(branched_scheme)
+
+        codes = compiled.model_codes(np.array([0.6, 5.0, 1.2]))
+        assert codes.tolist() == [MODEL_CODES["A2"], MODEL_CODES["R3"], UNKNOWN_MODEL_CODE]
+
+    def test_rate_function_matches_reference(self, branched_scheme):
+        """Should reproduce the per-reaction rate equations."""
+        compiled = CompiledScheme.from_scheme(branched_scheme)
+        params = np.array([8.0, 9.0, 7.5, 110.0, 120.0, 100.0, 1.0, 0.0, 1.0, 0.5, 0.5, 0.5])
+        y = np.array([0.6, 0.3, 0.1, 0.2, 0.1, 0.2])
+
+        rhs = compiled.rate_function(params, 10.0, 8.314)
+        np.testing.assert_allclose(rhs(600.0, y), reference_rhs(600.0, y, 10.0, params, branched_scheme, 8.314))
+
+    def test_simplex_contributions_sum_to_one_per_chain(self, branched_scheme):
+        """Should normalize weights within each chain and split all-zero chains evenly."""
+        compiled = CompiledScheme.from_scheme(branched_scheme)
+        assert compiled.chains_partition_reactions
+
+        contributions = compiled.simplex_contributions(np.array([0.2, 0.6, 0.0]))
+
+        np.testing.assert_allclose(contributions, [0.25, 0.75, 1.0])
+        np.testing.assert_allclose(compiled.chain_residuals(contributions), 0.0, atol=1e-12)
+
+    def test_shared_reactions_do_not_partition(self):
+        """Should report chains that share a reaction as not independently normalizable."""
+        compiled = CompiledScheme.from_scheme(
+            {
+                "components": [{"id": "A"}, {"id": "B"}, {"id": "C"}, {"id": "D"}],
+                "reactions": [{"from": "A", "to": "B"}, {"from": "B", "to": "C"}, {"from": "B", "to": "D"}],
+            }
+        )
+
+        assert not compiled.chains_partition_reactions
+
+    def test_unknown_species_rejected(self):
+        """Should raise ValueError when a reaction refers to a missing component."""
+        with pytest.raises(ValueError):
+            CompiledScheme.from_scheme({"components": [{"id": "A"}], "reactions": [{"from": "A", "to": "B"}]})
@@ -2,17 +2,31 @@
 
 import os
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.core.app_settings import OperationType
-from src.core.file_data import FileData
+from src.core.app_settings import FileStreamingConfig, OperationType
+from src.core.file_cache import FileCache
+from src.core.file_data import (
+    FileData,
+    RowBuffer,
+    block_average,
+    block_minmax,
+    detect_decimal,
+    detect_delimiter,
+    detect_encoding,
+    parse_buffer,
+)
+from src.core.file_transformations import TransformationRecipe, TransformationStep
 
 
 @pytest.fixture
-def file_data(mock_signals):
-    """Create FileData instance with mocked signals."""
-    return FileData(mock_signals)
+def file_data(mock_signals, tmp_path):
+    """Create FileData instance with mocked signals and an isolated file cache."""
+    instance = FileData(mock_signals)
+    instance.file_cache = FileCache(str(tmp_path / "cache"))
+    return instance
 
 
 class TestFileDataInit:
@@ -236,3 +250,296 @@ class TestProcessRequest:
 
         assert params["actor"] == "file_data"
         assert params["target"] == "test_actor"
+
+
+class TestBufferParsing:
+    """Tests for single-read buffer detection and fast-engine parsing."""
+
+    def test_detect_encoding_utf8(self):
+        """Should detect UTF-8 without running chardet, even with a truncated multibyte tail."""
+        sample = "temperature,масса\n".encode("utf-8")
+        assert detect_encoding(sample) == "utf-8"
+        assert detect_encoding(sample[:-2]) == "utf-8"
+
+    def test_detect_encoding_non_utf8(self):
+        """Should fall back to chardet for non-UTF-8 content."""
+        sample = ("температура;масса\n" * 50).encode("cp1251")
+        assert detect_encoding(sample) != "utf-8"
+
+    def test_detect_decimal_ignores_delimiter(self):
+        """Should not confuse the column delimiter with the decimal separator."""
+        assert detect_decimal(b"1.5,2.5,3.5\n4.5,5.5,6.5\n", ",") == "."
+        assert detect_decimal(b"1,5;2,5;3,5\n4,5;5,5;6,5\n", ";") == ","
+
+    def test_detect_delimiter(self):
+        """Should sniff semicolon-separated data."""
+        assert detect_delimiter("a;b;c\n1;2;3\n4;5;6\n") == ";"
+
+    def test_parse_buffer_skips_bad_lines(self):
+        """Should skip malformed rows with the fast engine."""
+        df = parse_buffer(b"a,b\n1,2\n3,4,5\n6,7\n", sep=",", header=0)
+        assert df["a"].tolist() == [1, 6]
+
+    def test_parse_buffer_python_fallback(self):
+        """Should fall back to the python engine for regex separators."""
+        df = parse_buffer(b"a  b\n1 2\n3   4\n", engines=("c",), sep=r"\s+|;", header=0)
+        assert df["b"].tolist() == [2, 4]
+
+    def test_load_decimal_comma_file(self, file_data, tmp_path):
+        """Should load semicolon-delimited file with decimal commas."""
+        path = tmp_path / "comma.csv"
+        path.write_bytes("temperature;rate_3\n30,5;99,1\n31,5;98,7\n".encode("cp1251"))
+        file_data.load_file((str(path), ";", 0, None))
+
+        assert file_data.data["temperature"].tolist() == [30.5, 31.5]
+        assert file_data.data["rate_3"].dtype == float
+
+
+class TestFileCache:
+    """Tests for the memory-mapped binary file cache."""
+
+    def test_store_and_load_roundtrip(self, tmp_path):
+        """Should restore the same table from a memory-mapped entry."""
+        source = tmp_path / "data.csv"
+        source.write_text("temperature,rate_3\n1.0,2.0\n3.0,4.0\n")
+        df = pd.DataFrame({"temperature": [1.0, 3.0], "rate_3": [2, 4]})
+        cache = FileCache(str(tmp_path / "cache"))
+
+        assert cache.store(str(source), {"delimiter": ","}, df)
+        restored = cache.load(str(source), {"delimiter": ","})
+
+        pd.testing.assert_frame_equal(restored, df)
+
+    def test_invalidated_by_options_and_file_change(self, tmp_path):
+        """Should miss when parse options or the source file change."""
+        source = tmp_path / "data.csv"
+        source.write_text("a\n1\n")
+        cache = FileCache(str(tmp_path / "cache"))
+        cache.store(str(source), {"skip_rows": 0}, pd.DataFrame({"a": [1.0]}))
+
+        assert cache.load(str(source), {"skip_rows": 1}) is None
+        source.write_text("a\n1\n2\n")
+        assert cache.load(str(source), {"skip_rows": 0}) is None
+
+    def test_non_numeric_not_cached(self, tmp_path):
+        """Should skip tables with non-numeric columns."""
+        source = tmp_path / "data.csv"
+        source.write_text("a\nx\n")
+        cache = FileCache(str(tmp_path / "cache"))
+
+        assert not cache.store(str(source), {}, pd.DataFrame({"a": ["x"]}))
+        assert cache.load(str(source), {}) is None
+
+    def test_prune_removes_least_recently_used(self, tmp_path):
+        """Should delete the entries used longest ago once the cache exceeds max_bytes."""
+        cache = FileCache(str(tmp_path / "cache"), max_bytes=10**9)
+        df = pd.DataFrame({"a": np.arange(1000, dtype=float)})
+        sources = []
+        for i in range(3):
+            source = tmp_path / f"data_{i}.csv"
+            source.write_text(f"a\n{i}\n")
+            cache.store(str(source), {}, df)
+            sources.append(str(source))
+        entry_bytes = sum(f.stat().st_size for f in (tmp_path / "cache").iterdir()) // 3
+        for age, source in zip((300, 200, 100), sources):
+            for path in cache._entry_paths(cache.cache_key(source, {})):
+                os.utime(path, (os.path.getmtime(path) - age,) * 2)
+        assert cache.load(sources[0], {}) is not None  # a hit marks the oldest entry as recently used
+
+        cache.max_bytes = 2 * entry_bytes
+        assert cache.prune() == 1
+
+        assert cache.load(sources[0], {}) is not None
+        assert cache.load(sources[1], {}) is None
+        assert cache.load(sources[2], {}) is not None
+
+    def test_store_keeps_cache_within_limit(self, tmp_path):
+        """Writing an entry should evict older ones but never the entry just written."""
+        cache = FileCache(str(tmp_path / "cache"), max_bytes=1)
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+        first.write_text("a\n1\n")
+        second.write_text("a\n2\n")
+
+        cache.store(str(first), {}, df)
+        cache.store(str(second), {}, df)
+
+        assert cache.load(str(first), {}) is None
+        assert cache.load(str(second), {}) is not None
+
+    def test_default_directory_is_isolated(self, tmp_path):
+        """Tests should never write into the user's home cache."""
+        assert FileCache().cache_dir == str(tmp_path / "file_cache")
+
+    def test_reload_uses_cache(self, mock_signals, file_data, sample_csv_path, mocker):
+        """Should skip text parsing when the file is loaded again in a new session."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+
+        second = FileData(mock_signals)
+        second.file_cache = file_data.file_cache
+        parse = mocker.patch("src.core.file_data.parse_buffer")
+        second.load_file((str(sample_csv_path), ",", 0, None))
+
+        parse.assert_not_called()
+        pd.testing.assert_frame_equal(second.data, file_data.data)
+
+
+class TestCopyOnWriteVersions:
+    """Tests for copy-on-write sharing between original data and working versions."""
+
+    def test_load_shares_buffers(self, file_data, sample_csv_path):
+        """Should not duplicate column buffers on load."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+
+        original = file_data.original_data[file_basename]
+        working = file_data.dataframe_copies[file_basename]
+
+        assert original is file_data.data
+        assert np.shares_memory(original["temperature"].to_numpy(), working["temperature"].to_numpy())
+
+    def test_modify_replaces_only_changed_columns(self, file_data, sample_csv_path):
+        """Should allocate new buffers only for transformed columns and keep the original intact."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+        original_rate = file_data.original_data[file_basename]["rate_3"].copy()
+
+        file_data.modify_data(lambda series: series * 2, {"file_name": file_basename})
+
+        original = file_data.original_data[file_basename]
+        working = file_data.dataframe_copies[file_basename]
+        assert np.shares_memory(original["temperature"].to_numpy(), working["temperature"].to_numpy())
+        assert not np.shares_memory(original["rate_3"].to_numpy(), working["rate_3"].to_numpy())
+        pd.testing.assert_series_equal(original["rate_3"], original_rate)
+        pd.testing.assert_series_equal(working["rate_3"], original_rate * 2)
+
+    def test_failed_modify_keeps_previous_version(self, file_data, sample_csv_path):
+        """Should leave the working version untouched when the transformation fails."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+        before = file_data.dataframe_copies[file_basename]
+
+        def failing(series):
+            raise ValueError("boom")
+
+        file_data.modify_data(failing, {"file_name": file_basename})
+
+        assert file_data.dataframe_copies[file_basename] is before
+
+
+class TestLazyTransformations:
+    """Tests for recipe-based lazy transformations with per-recipe caching."""
+
+    def test_modify_evaluates_once(self, file_data, sample_csv_path, mocker):
+        """Should evaluate the recipe when the step is added and serve later reads from the cache."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+        apply = mocker.spy(TransformationRecipe, "apply")
+
+        assert file_data.modify_data(TransformationStep("to_a_t"), {"file_name": file_basename})
+        apply.assert_called_once()
+
+        _ = file_data.dataframe_copies[file_basename]
+        apply.assert_called_once()
+
+    def test_failing_step_reported_and_not_recorded(self, file_data, sample_csv_path):
+        """Should return False for a failing step and keep neither the step nor its history entry."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+        params = {"file_name": file_basename, "operation": OperationType.TO_A_T}
+
+        def failing(series):
+            raise ValueError("boom")
+
+        assert not file_data.modify_data(failing, params)
+        assert file_basename not in file_data.recipes
+        assert not file_data.operations_history.get(file_basename)
+
+    def test_switching_views_hits_cache(self, file_data, sample_csv_path):
+        """Should return the cached α(t) view after reset and re-transformation."""
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        file_basename = os.path.basename(sample_csv_path)
+
+        file_data.modify_data(TransformationStep("to_a_t"), {"file_name": file_basename})
+        alpha_view = file_data.dataframe_copies[file_basename]
+        file_data.reset_dataframe_copy(file_basename)
+        file_data.modify_data(TransformationStep("to_a_t"), {"file_name": file_basename})
+
+        assert file_data.dataframe_copies[file_basename] is alpha_view
+
+
+class TestStreamingLoad:
+    """Tests for chunked loading of large files with block averaging and min/max previews."""
+
+    @pytest.fixture
+    def long_log(self, tmp_path):
+        """High-frequency log with 1000 rows."""
+        path = tmp_path / "long_log.csv"
+        temperature = np.arange(1000, dtype=float)
+        pd.DataFrame({"temperature": temperature, "mass": 100 - temperature / 100}).to_csv(path, index=False)
+        return path
+
+    def test_block_average(self):
+        """Should average consecutive row blocks and a trailing partial block."""
+        values = np.arange(14, dtype=float).reshape(7, 2)
+        np.testing.assert_allclose(block_average(values, 3), [[2.0, 3.0], [8.0, 9.0], [12.0, 13.0]])
+
+    def test_block_minmax_keeps_extreme_rows(self):
+        """Should keep the rows holding each column's extremes per block, in order, so narrow peaks survive."""
+        values = np.column_stack([np.arange(8, dtype=float), [0.0, 0.0, 5.0, 0.0, 0.0, 0.0, -1.0, 0.0]])
+
+        np.testing.assert_array_equal(block_minmax(values, 4), values[[0, 2, 3, 4, 6, 7]])
+        np.testing.assert_array_equal(block_minmax(values[:6], 4), values[[0, 2, 3, 4, 5]])
+
+    def test_row_buffer_grows(self):
+        """Should keep appended rows across capacity growth."""
+        buffer = RowBuffer(2, capacity=2)
+        for start in range(0, 10, 3):
+            buffer.append(np.arange(start * 2, start * 2 + 6, dtype=float).reshape(3, 2))
+
+        np.testing.assert_array_equal(buffer.view(), np.arange(24, dtype=float).reshape(12, 2))
+
+    def test_streaming_decimates_and_emits_progress(self, file_data, long_log, mocker):
+        """Should average the analysis data and emit min/max previews while loading."""
+        mocker.patch(
+            "src.core.file_data.FILE_STREAMING_CONFIG",
+            FileStreamingConfig(threshold_bytes=0, chunk_rows=128, max_rows=100),
+        )
+        partials = []
+        file_data.data_chunk_loaded_signal.connect(lambda frame: partials.append(frame.copy()))
+
+        file_data.load_file((str(long_log), ",", 0, None))
+
+        assert len(partials) == 8
+        assert len(partials[0]) < len(partials[-1])
+        assert partials[-1]["temperature"].iloc[0] == 0.0
+        assert 90 <= len(file_data.data) <= 100
+        factor = round(1000 / len(file_data.data))
+        np.testing.assert_allclose(file_data.data["temperature"].iloc[0], (factor - 1) / 2)
+        np.testing.assert_allclose(np.diff(file_data.data["temperature"].iloc[:-1]), factor)
+
+    def test_streamed_noisy_dtg_matches_full_resolution(self, file_data, tmp_path, mocker):
+        """DTG of a streamed noisy log should follow the DTG of the full-resolution curve."""
+        mocker.patch(
+            "src.core.file_data.FILE_STREAMING_CONFIG",
+            FileStreamingConfig(threshold_bytes=0, chunk_rows=3000, max_rows=200),
+        )
+        temperature = np.linspace(300.0, 800.0, 20_000)
+        mass = 100 - 50 / (1 + np.exp(-(temperature - 550) / 20))
+        noise = np.random.default_rng(0).normal(0.0, 0.05, temperature.size)
+        path = tmp_path / "noisy_tga.csv"
+        pd.DataFrame({"temperature": temperature, "mass": mass + noise}).to_csv(path, index=False)
+
+        file_data.load_file((str(path), ",", 0, None))
+
+        streamed = file_data.data
+        dtg = -np.gradient(streamed["mass"], streamed["temperature"])
+        reference = np.interp(streamed["temperature"], temperature, -np.gradient(mass, temperature))
+        assert len(streamed) < temperature.size // 50
+        np.testing.assert_allclose(dtg, reference, atol=0.02)
+
+    def test_small_files_not_streamed(self, file_data, sample_csv_path, mocker):
+        """Should use the regular loader below the size threshold."""
+        stream = mocker.patch.object(file_data, "load_stream")
+        file_data.load_file((str(sample_csv_path), ",", 0, None))
+        stream.assert_not_called()
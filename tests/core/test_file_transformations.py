@@ -0,0 +1,103 @@
+"""Tests for file_transformations module - lazy fused preprocessing recipes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.file_operations import ActiveFileOperations
+from src.core.file_transformations import TransformationRecipe, TransformationStep
+
+
+@pytest.fixture
+def mass_df():
+    """Two mass-loss columns on a shared temperature axis."""
+    temperature = np.linspace(300.0, 800.0, 51)
+    return pd.DataFrame(
+        {
+            "temperature": temperature,
+            "rate_3": np.linspace(100.0, 60.0, 51) ** 1.1,
+            "rate_5": np.linspace(99.0, 55.0, 51),
+        }
+    )
+
+
+class TestKernels:
+    """Vectorized kernels must match the per-Series reference functions."""
+
+    def test_to_a_t_matches_series_function(self, mass_df, mock_signals):
+        """Should reproduce ActiveFileOperations.to_a_t_function."""
+        reference = ActiveFileOperations(mock_signals).to_a_t_function(mass_df["rate_3"])
+        result = TransformationStep("to_a_t")(mass_df["rate_3"])
+        np.testing.assert_allclose(result, reference)
+
+    def test_to_a_t_equal_masses(self):
+        """Should return zeros when initial and final masses are equal."""
+        result = TransformationStep("to_a_t")(pd.Series([5.0, 4.0, 5.0]))
+        assert (result == 0).all()
+
+    def test_dtg_matches_diff(self, mass_df):
+        """Should reproduce Series.diff including the leading NaN."""
+        result = TransformationStep("dtg")(mass_df["rate_5"])
+        pd.testing.assert_series_equal(result, mass_df["rate_5"].diff())
+
+    def test_smooth_preserves_constant(self):
+        """Should leave a constant signal unchanged, including the edges."""
+        result = TransformationStep("smooth", (5,))(pd.Series(np.full(20, 3.0)))
+        np.testing.assert_allclose(result, 3.0)
+
+    def test_baseline_removes_linear_trend(self, mass_df):
+        """Should turn a straight line into zeros."""
+        recipe = TransformationRecipe([TransformationStep("baseline")])
+        result = recipe.apply(mass_df)
+        np.testing.assert_allclose(result["rate_5"], 0.0, atol=1e-9)
+
+
+class TestRecipe:
+    """Tests for recipe hashing and fused evaluation."""
+
+    def test_fused_pass_matches_sequential(self, mass_df, mock_signals):
+        """Should equal applying α(t) then DTG column by column."""
+        operations = ActiveFileOperations(mock_signals)
+        recipe = TransformationRecipe().append(TransformationStep("to_a_t")).append(TransformationStep("dtg"))
+
+        result = recipe.apply(mass_df)
+
+        for column in ("rate_3", "rate_5"):
+            expected = operations.diff_function(operations.to_a_t_function(mass_df[column]))
+            np.testing.assert_allclose(result[column], expected)
+
+    def test_temperature_shared(self, mass_df):
+        """Should not copy the temperature column."""
+        result = TransformationRecipe([TransformationStep("to_a_t")]).apply(mass_df)
+        assert np.shares_memory(result["temperature"].to_numpy(), mass_df["temperature"].to_numpy())
+
+    def test_hash_depends_on_steps_and_params(self):
+        """Should give equal hashes for equal recipes and different for different ones."""
+        a = TransformationRecipe([TransformationStep("smooth", (5,))])
+        b = TransformationRecipe([TransformationStep("smooth", (5,))])
+        c = TransformationRecipe([TransformationStep("smooth", (7,))])
+        assert a.hash == b.hash
+        assert a.hash != c.hash
+
+    def test_resample_changes_grid(self, mass_df):
+        """Should interpolate all columns onto a uniform grid of requested size."""
+        result = TransformationRecipe([TransformationStep("resample", (11,))]).apply(mass_df)
+        assert len(result) == 11
+        np.testing.assert_allclose(result["temperature"], np.linspace(300.0, 800.0, 11))
+        np.testing.assert_allclose(result["rate_5"], np.linspace(99.0, 55.0, 11))
+
+    def test_custom_function_step(self, mass_df):
+        """Should apply an arbitrary per-Series function."""
+        recipe = TransformationRecipe([TransformationStep("custom", function=lambda series: series * 2)])
+        result = recipe.apply(mass_df)
+        np.testing.assert_allclose(result["rate_5"], mass_df["rate_5"] * 2)
+
+    def test_custom_steps_never_share_hash(self):
+        """Should key custom steps by the step, not by the id of a possibly collected function."""
+        first = TransformationRecipe([TransformationStep("custom", function=lambda series: series * 2)])
+        first_hash = first.hash
+        del first
+        second = TransformationRecipe([TransformationStep("custom", function=lambda series: series * 3)])
+
+        assert second.hash != first_hash
+        assert second.hash == TransformationRecipe(second).hash
@@ -1,16 +1,21 @@
 """Tests for model_free_calculation module - isoconversional kinetic methods."""
 
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from src.core.app_settings import OperationType
 from src.core.model_free_calculation import (
     Friedman,
+    IsoconversionalBootstrap,
     Kissinger,
     LinearApproximation,
     MasterPlots,
     ModelFreeCalculation,
     Vyazovkin,
+    _bootstrap_replicate,
 )
 
 
@@ -153,6 +158,64 @@ class TestKissinger:
         assert "title" in plot_kwargs
         assert "Kissinger" in plot_kwargs["title"]
 
+    def test_peak_refined_between_samples(self, strategy):
+        """Peak temperatures should be located between raw samples."""
+        temperature = np.linspace(400, 600, 100)
+        reaction_df = pd.DataFrame(
+            {
+                "temperature": temperature,
+                "5": np.exp(-((temperature - 480.3) ** 2) / (2 * 30**2)),
+                "10": np.exp(-((temperature - 500.7) ** 2) / (2 * 35**2)),
+            }
+        )
+        peaks = strategy.fetch_kissinger_peaks(reaction_df)
+
+        np.testing.assert_allclose(peaks["T_peak"], [480.3, 500.7], atol=0.05)
+
+    def test_regression_statistics(self, strategy, sample_reaction_df):
+        """Regression statistics should be attached to the result."""
+        result = strategy.calculate(sample_reaction_df)
+        regression = result.attrs["regression"]
+
+        assert list(regression["peak"]) == [0]
+        assert regression["n_points"].iloc[0] == 3
+        assert 0.9 < regression["r2"].iloc[0] <= 1.0
+        assert regression["Ea"].iloc[0] == pytest.approx(result["Kissinger_Ea"].iloc[0])
+
+    def test_multiple_peaks(self):
+        """Each peak group should get its own Ea."""
+        strategy = Kissinger(alpha_min=0.1, alpha_max=0.9, max_peaks=2)
+        temperature = np.linspace(400, 650, 200)
+        reaction_df = pd.DataFrame({"temperature": temperature})
+        for beta, shift in [("5", 0), ("10", 20), ("20", 40)]:
+            reaction_df[beta] = np.exp(-((temperature - 480 - shift) ** 2) / (2 * 20**2)) + 0.6 * np.exp(
+                -((temperature - 560 - shift / 2) ** 2) / (2 * 8**2)
+            )
+
+        result = strategy.calculate(reaction_df)
+        regression = result.attrs["regression"]
+
+        assert len(result) == 6
+        assert list(regression["peak"]) == [0, 1]
+        assert result["Kissinger_Ea"].nunique() == 2
+
+    def test_missing_peak_does_not_shift_groups(self):
+        """A curve without the low-temperature peak should match its remaining peak by temperature."""
+        strategy = Kissinger(alpha_min=0.1, alpha_max=0.9, max_peaks=2)
+        temperature = np.linspace(400, 650, 200)
+        reaction_df = pd.DataFrame({"temperature": temperature})
+        for beta, shift in [("5", 0), ("10", 20), ("20", 40)]:
+            first_height = 0.0 if beta == "10" else 1.0
+            reaction_df[beta] = first_height * np.exp(-((temperature - 480 - shift) ** 2) / (2 * 20**2)) + 0.6 * np.exp(
+                -((temperature - 560 - shift / 2) ** 2) / (2 * 8**2)
+            )
+
+        peaks = strategy.fetch_kissinger_peaks(reaction_df)
+
+        assert peaks.groupby("peak").size().to_dict() == {0: 2, 1: 3}
+        assert peaks.loc[peaks["peak"] == 1, "T_peak"].between(555, 585).all()
+        assert peaks.loc[peaks["beta"] == 10, "peak"].tolist() == [1]
+
 
 class TestVyazovkin:
     """Tests for Vyazovkin nonlinear isoconversional method."""
@@ -198,6 +261,88 @@ class TestVyazovkin:
         assert "title" in plot_kwargs
         assert "Vyazovkin" in plot_kwargs["title"]
 
+    def test_default_ea_bounds(self):
+        """Omitted Ea bounds should fall back to configured defaults."""
+        strategy = Vyazovkin(alpha_min=0.2, alpha_max=0.8)
+
+        assert strategy.ea_min is not None
+        assert strategy.ea_max is not None
+
+    def test_temperature_integrals_shape(self):
+        """temperature_integrals should evaluate all Ea, α and β at once."""
+        candidate_Ea = np.array([50000.0, 100000.0, 150000.0])
+        T_matrix = np.array([[500.0, 510.0], [520.0, 530.0]])
+        result = Vyazovkin.temperature_integrals(candidate_Ea, T_matrix, 2.0)
+
+        assert result.shape == (3, 2, 2)
+        assert np.all(np.isfinite(result))
+        # Integral grows with temperature for fixed Ea
+        assert np.all(result[:, :, 1] > result[:, :, 0])
+
+
+class TestIsoconversionalBootstrap:
+    """Tests for bootstrap confidence bands around isoconversional Ea."""
+
+    @pytest.fixture
+    def sample_reaction_df(self):
+        """Create noisy sample reaction DataFrame with three heating rates."""
+        rng = np.random.default_rng(0)
+        temperature = np.linspace(400, 600, 100)
+        return pd.DataFrame(
+            {
+                "temperature": temperature,
+                "5": np.exp(-((temperature - 480) ** 2) / (2 * 35**2)) + rng.normal(0, 0.005, 100),
+                "10": np.exp(-((temperature - 500) ** 2) / (2 * 40**2)) + rng.normal(0, 0.005, 100),
+                "20": np.exp(-((temperature - 520) ** 2) / (2 * 45**2)) + rng.normal(0, 0.005, 100),
+            }
+        )
+
+    def test_adds_band_columns(self, sample_reaction_df):
+        """Bootstrap should add lower/upper columns for every method column."""
+        bootstrap = IsoconversionalBootstrap(LinearApproximation(0.1, 0.9), n_resamples=10, workers=1, seed=0)
+        result = bootstrap.calculate(sample_reaction_df)
+
+        for method in ["OFW", "KAS", "Starink"]:
+            assert f"{method}_lower" in result.columns
+            assert f"{method}_upper" in result.columns
+            assert np.all(result[f"{method}_lower"] <= result[f"{method}_upper"])
+
+    def test_point_estimate_unchanged(self, sample_reaction_df):
+        """Point estimate should match the wrapped strategy."""
+        strategy = Friedman(0.1, 0.9)
+        bootstrap = IsoconversionalBootstrap(strategy, n_resamples=5, workers=1, seed=0)
+        result = bootstrap.calculate(sample_reaction_df)
+
+        expected = strategy.calculate(sample_reaction_df)
+        np.testing.assert_allclose(result["Friedman"], expected["Friedman"])
+
+    def test_reproducible_with_seed(self, sample_reaction_df):
+        """Same seed should give identical confidence bands."""
+        strategy = Friedman(0.1, 0.9)
+        first = IsoconversionalBootstrap(strategy, n_resamples=5, workers=1, seed=42).calculate(sample_reaction_df)
+        second = IsoconversionalBootstrap(strategy, n_resamples=5, workers=1, seed=42).calculate(sample_reaction_df)
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_replicate_keeps_repeated_rates(self):
+        """Rates drawn more than once should stay in the replicate as separate columns with the same β."""
+        temperature = np.linspace(400, 600, 50)
+        rate_cols = ["3", "5", "10", "20"]
+        smoothed = np.column_stack([np.exp(-((temperature - 450 - 10 * i) ** 2) / 800) for i in range(4)])
+        seen = []
+
+        class Recorder:
+            def calculate(self, df):
+                seen.append([col for col in df.columns if col != "temperature"])
+                return df
+
+        for seed in range(20):
+            _bootstrap_replicate(Recorder(), temperature, smoothed, np.zeros_like(smoothed), rate_cols, 1.0, seed)
+
+        assert all(len(columns) == 4 and len(set(columns)) == 4 for columns in seen)
+        assert any(len({float(col) for col in columns}) < 4 for columns in seen)
+        assert all({float(col) for col in columns} <= {3.0, 5.0, 10.0, 20.0} for columns in seen)
+
 
 class TestMasterPlots:
     """Tests for Master Plots method."""
@@ -395,6 +540,43 @@ class TestModelFreeCalculation:
         assert response["data"] is not None
         assert isinstance(response["data"], list)
 
+    def test_handle_model_free_calculation_bootstrap(self, calculation_handler):
+        """Bootstrap parameters should add confidence band columns to results."""
+        from src.core.app_settings import OperationType
+
+        temperature = np.linspace(400, 600, 50)
+        reaction_data = {
+            "reaction_1": pd.DataFrame(
+                {
+                    "temperature": temperature,
+                    "5": np.exp(-((temperature - 480) ** 2) / (2 * 35**2)),
+                    "10": np.exp(-((temperature - 500) ** 2) / (2 * 40**2)),
+                }
+            )
+        }
+
+        response = {
+            "actor": "model_free_calculation",
+            "target": "test",
+            "request_id": "test-5",
+            "data": None,
+            "operation": OperationType.MODEL_FREE_CALCULATION,
+        }
+
+        calculation_params = {
+            "fit_method": "Friedman",
+            "reaction_data": reaction_data,
+            "alpha_min": 0.1,
+            "alpha_max": 0.9,
+            "bootstrap": {"n_resamples": 5, "workers": 1, "seed": 0},
+        }
+
+        calculation_handler._handle_model_free_calculation(calculation_params, response)
+
+        result = response["data"]["reaction_1"]
+        assert "Friedman_lower" in result.columns
+        assert "Friedman_upper" in result.columns
+
     def test_handle_insufficient_beta_columns(self, calculation_handler, mock_signals):
         """Should return False when insufficient beta columns."""
         from src.core.app_settings import OperationType
@@ -461,3 +643,50 @@ class TestModelFreeCalculation:
 
         # Should return early without setting data
         assert response["data"] is None
+
+
+class TestModelFreeDeferredRequest:
+    """Tests for asynchronous model-free calculation requests."""
+
+    def test_deferred_request_runs_on_worker(self, mock_signals):
+        """deferred_response requests should be handed to respond_later instead of answering inline."""
+        calculation = ModelFreeCalculation(signals=mock_signals)
+        params = {
+            "actor": "main_window",
+            "request_id": "r",
+            "operation": OperationType.MODEL_FREE_CALCULATION,
+            "deferred_response": True,
+            "calculation_params": {"fit_method": "Friedman", "reaction_data": {}},
+        }
+
+        with patch.object(calculation, "respond_later") as respond_later:
+            calculation.process_request(params)
+
+        respond_later.assert_called_once()
+        mock_signals.response_signal.emit.assert_not_called()
+
+    def test_progress_and_cancellation(self, mock_signals):
+        """Handler should report progress per reaction and stop once cancelled."""
+        calculation = ModelFreeCalculation(signals=mock_signals)
+        temperature = np.linspace(400, 600, 50)
+        reaction_df = pd.DataFrame(
+            {
+                "temperature": temperature,
+                "5": np.exp(-((temperature - 480) ** 2) / 2000),
+                "10": np.exp(-((temperature - 500) ** 2) / 2000),
+            }
+        )
+        request = {"actor": "main_window", "request_id": "r", "operation": OperationType.MODEL_FREE_CALCULATION}
+        response = {}
+        mock_signals.is_cancelled.side_effect = [False, True]
+
+        calculation._handle_model_free_calculation(
+            {"fit_method": "Friedman", "reaction_data": {"reaction_0": reaction_df, "reaction_1": reaction_df.copy()}},
+            response,
+            request,
+        )
+
+        progress = [call.args[0] for call in mock_signals.response_signal.emit.call_args_list]
+        assert progress[0]["partial"] is True
+        assert progress[0]["progress"]["reaction"] == "reaction_0"
+        assert "data" not in response
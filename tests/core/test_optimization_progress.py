@@ -0,0 +1,107 @@
+"""Tests for optimization_progress module - best-result slot and bounded MSE history."""
+
+import threading
+from datetime import datetime, timedelta
+
+from src.core.optimization_progress import BestResultSlot, MseHistory
+
+
+class TestBestResultSlot:
+    """Tests for BestResultSlot offer/take."""
+
+    def test_keeps_only_latest_improvement(self):
+        """Should replace the pending result with newer improvements and reject worse ones."""
+        slot = BestResultSlot()
+
+        assert slot.offer({"best_mse": 0.5}) is True
+        assert slot.offer({"best_mse": 0.2}) is True
+        assert slot.offer({"best_mse": 0.3}) is False
+
+        assert slot.take() == {"best_mse": 0.2}
+        assert slot.take() is None
+
+    def test_worse_than_consumed_result_rejected(self):
+        """Should compare against the best ever offered, not only the pending one."""
+        slot = BestResultSlot()
+        slot.offer({"best_mse": 0.1})
+        slot.take()
+
+        assert slot.offer({"best_mse": 0.2}) is False
+        assert slot.take() is None
+
+    def test_reset(self):
+        """Should forget pending result and best score."""
+        slot = BestResultSlot()
+        slot.offer({"best_mse": 0.1})
+        slot.reset()
+
+        assert slot.take() is None
+        assert slot.best == float("inf")
+        assert slot.offer({"best_mse": 0.2}) is True
+
+    def test_improvements_recorded_in_history(self):
+        """Should record every stored improvement, including ones replaced before a take."""
+        history = MseHistory()
+        slot = BestResultSlot(history=history)
+
+        slot.offer({"best_mse": 0.5})
+        slot.offer({"best_mse": 0.7})
+        slot.offer({"best_mse": 0.2})
+
+        assert [best for _, best in history] == [0.5, 0.2]
+        assert slot.take() == {"best_mse": 0.2}
+
+    def test_concurrent_offers_keep_global_best(self):
+        """Should end with the lowest score offered from several threads."""
+        slot = BestResultSlot()
+
+        def publish(offset):
+            for i in range(500):
+                slot.offer({"best_mse": 1.0 / (i + 1) + offset})
+
+        threads = [threading.Thread(target=publish, args=(k * 1e-4,)) for k in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert slot.take()["best_mse"] == 1.0 / 500
+
+
+class TestMseHistory:
+    """Tests for the bounded MSE history buffer."""
+
+    def test_iterates_as_time_value_pairs(self):
+        """Should yield (datetime, best) pairs in insertion order."""
+        start = datetime(2024, 1, 1, 12)
+        history = MseHistory(capacity=8)
+        history.append((start, 0.5))
+        history.append((start + timedelta(seconds=1), 0.2, 0.4))
+
+        assert list(history) == [(start, 0.5), (start + timedelta(seconds=1), 0.2)]
+        assert len(history) == 2
+
+    def test_full_buffer_is_decimated(self):
+        """Should stay within capacity while keeping the first and newest points."""
+        start = datetime(2024, 1, 1, 12)
+        history = MseHistory(capacity=4)
+        for i in range(7):
+            history.append((start + timedelta(seconds=i), float(i)))
+
+        times, best, _ = history.arrays()
+        assert len(history) <= 4
+        assert best[0] == 0.0
+        assert best[-1] == 6.0
+        assert (times[1:] > times[:-1]).all()
+
+    def test_version_tracks_changes(self):
+        """Should change version on append and clear."""
+        history = MseHistory(capacity=4)
+        version = history.version
+        history.append((datetime(2024, 1, 1), 0.1))
+        assert history.version != version
+
+        version = history.version
+        history.clear()
+        assert history.version != version
+        assert len(history) == 0
@@ -0,0 +1,111 @@
+"""Tests for parameter_store module - flat path-indexed reaction parameter storage."""
+
+import numpy as np
+import pytest
+
+from src.core.parameter_store import COEFFICIENT_GROUPS, COEFFICIENT_NAMES, ParameterStore
+
+
+@pytest.fixture
+def reaction():
+    """Reaction entry in the layout produced by generate_default_function_data."""
+    return {
+        "function": "gauss",
+        "x": np.linspace(300.0, 600.0, 31),
+        "coeffs": {"h": 1.0, "z": 450.0, "w": 30.0},
+        "upper_bound_coeffs": {"h": 2.0, "z": 500.0, "w": 60.0},
+        "lower_bound_coeffs": {"h": 0.5, "z": 400.0, "w": 10.0},
+    }
+
+
+@pytest.fixture
+def store(reaction):
+    """Store with one file holding one reaction."""
+    store = ParameterStore()
+    store.set(["file", "reaction_0"], reaction)
+    store.take_dirty()
+    return store
+
+
+class TestParameterStore:
+    """Tests for ParameterStore reads and writes."""
+
+    def test_get_rebuilds_nested_copy(self, store, reaction):
+        """Should return a fresh nested dict that does not alias the store."""
+        result = store.get(["file", "reaction_0"])
+        assert result["coeffs"] == reaction["coeffs"]
+
+        result["coeffs"]["h"] = -1.0
+        assert store.get(["file", "reaction_0", "coeffs", "h"]) == 1.0
+
+    def test_overwrite_keeps_key_order(self, store):
+        """Should keep sibling order when an existing leaf is overwritten."""
+        store.set(["file", "reaction_0", "coeffs", "h"], 3.0)
+        assert list(store.get(["file", "reaction_0", "coeffs"])) == ["h", "z", "w"]
+
+    def test_leaf_replaced_by_subtree(self, store):
+        """Should turn a leaf into an internal node when a deeper path is set."""
+        store.set(["file", "reaction_0", "function"], "ads")
+        store.set(["file", "reaction_0", "function", "name"], "ads")
+        assert store.get(["file", "reaction_0", "function"]) == {"name": "ads"}
+
+    def test_remove_subtree(self, store):
+        """Should remove a subtree and report missing paths."""
+        assert store.remove(["file", "reaction_0"]) is True
+        assert store.exists(["file", "reaction_0"]) is False
+        assert store.exists(["file"]) is True
+        assert store.remove(["file", "reaction_0"]) is False
+
+    def test_stored_arrays_are_read_only(self, store, reaction):
+        """Should keep the caller's array writable while exposing a read-only view."""
+        stored = store.get(["file", "reaction_0", "x"])
+        assert not stored.flags.writeable
+        assert reaction["x"].flags.writeable
+
+    def test_dirty_paths(self, store):
+        """Should collect changed paths until drained."""
+        store.set(["file", "reaction_0", "coeffs", "h"], 2.0)
+        store.remove(["file", "reaction_0", "upper_bound_coeffs"])
+
+        assert store.take_dirty() == {
+            ("file", "reaction_0", "coeffs", "h"),
+            ("file", "reaction_0", "upper_bound_coeffs"),
+        }
+        assert store.take_dirty() == frozenset()
+
+
+class TestParameterSnapshot:
+    """Tests for immutable snapshots and typed coefficient columns."""
+
+    def test_snapshot_isolated_from_later_writes(self, store):
+        """Should keep the values seen at snapshot time."""
+        snapshot = store.snapshot()
+        store.set(["file", "reaction_0", "coeffs", "h"], 9.0)
+
+        assert snapshot.get(["file", "reaction_0", "coeffs", "h"]) == 1.0
+        assert store.snapshot().get(["file", "reaction_0", "coeffs", "h"]) == 9.0
+        assert store.snapshot().version > snapshot.version
+
+    def test_snapshot_reused_until_change(self, store):
+        """Should return the same snapshot object while nothing changes."""
+        assert store.snapshot() is store.snapshot()
+
+    def test_reaction_columns(self, store):
+        """Should expose coefficients as a read-only float matrix with NaN for missing names."""
+        columns = store.snapshot().reaction_columns("file", "reaction_0")
+
+        assert columns.shape == (len(COEFFICIENT_GROUPS), len(COEFFICIENT_NAMES))
+        assert not columns.flags.writeable
+        np.testing.assert_array_equal(columns[COEFFICIENT_GROUPS.index("coeffs"), :3], [1.0, 450.0, 30.0])
+        assert np.isnan(columns[:, COEFFICIENT_NAMES.index("fr")]).all()
+
+    def test_coefficient_vector_follows_updates(self, store, reaction):
+        """Should stack one group across reactions and reflect removals."""
+        store.set(["file", "reaction_1"], reaction)
+        store.set(["file", "reaction_1", "coeffs", "h"], 4.0)
+        store.remove(["file", "reaction_0", "coeffs", "z"])
+
+        matrix = store.snapshot().coefficient_vector("file")
+        assert matrix.shape == (2, len(COEFFICIENT_NAMES))
+        assert matrix[1, 0] == 4.0
+        assert np.isnan(matrix[0, 1])
@@ -0,0 +1,128 @@
+"""Tests for project_file module - single-file session save/restore."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.app_settings import OperationType
+from src.core.file_transformations import TransformationRecipe, TransformationStep
+from src.core.project_file import is_memory_mapped, load_into_memory, load_project, save_project
+from src.core.series_data import ExperimentalSeries, SeriesData
+
+
+@pytest.fixture
+def experimental_df():
+    """Two heating rates on a shared temperature axis."""
+    temperature = np.linspace(400.0, 600.0, 40)
+    return pd.DataFrame(
+        {
+            "temperature": temperature,
+            "3": np.exp(-((temperature - 500) ** 2) / 800),
+            "5": np.exp(-((temperature - 520) ** 2) / 800),
+        }
+    )
+
+
+class TestProjectRoundTrip:
+    """Tests for save_project / load_project."""
+
+    def test_nested_state_round_trip(self, tmp_path, experimental_df):
+        """Should restore arrays, frames, enums, datetimes, tuples and int keys."""
+        path = str(tmp_path / "session.otk")
+        state = {
+            "values": np.arange(6, dtype=float).reshape(2, 3),
+            "frame": experimental_df,
+            "operation": OperationType.TO_DTG,
+            "stamp": datetime(2024, 5, 1, 12, 30),
+            "bounds": (0.0, 1.0),
+            "history": {1: ["a", np.float64(2.5)]},
+            "steps": [TransformationStep("smooth", (5,)), TransformationStep("dtg")],
+        }
+
+        save_project(path, state)
+        restored = load_project(path)
+
+        np.testing.assert_array_equal(restored["values"], state["values"])
+        pd.testing.assert_frame_equal(restored["frame"], experimental_df)
+        assert restored["operation"] is OperationType.TO_DTG
+        assert restored["stamp"] == state["stamp"]
+        assert restored["bounds"] == (0.0, 1.0)
+        assert restored["history"] == {1: ["a", 2.5]}
+        assert TransformationRecipe(restored["steps"]).hash == TransformationRecipe(state["steps"]).hash
+
+    def test_lazy_load_memory_maps_arrays(self, tmp_path):
+        """Should return copy-on-write memory maps that leave the file untouched."""
+        path = str(tmp_path / "session.otk")
+        save_project(path, {"values": np.arange(1000, dtype=float)})
+
+        values = load_project(path, lazy=True)["values"]
+        assert isinstance(values, np.memmap)
+        values[0] = -1.0
+
+        assert load_project(path, lazy=False)["values"][0] == 0.0
+
+    def test_load_into_memory_releases_project_file(self, tmp_path, experimental_df):
+        """Should replace every mapped array so the state can be saved over its own project file."""
+        path = str(tmp_path / "session.otk")
+        save_project(path, {"frame": experimental_df, "series": ExperimentalSeries.from_dataframe(experimental_df)})
+        mapped = load_project(path, lazy=True)
+
+        state = load_into_memory(mapped)
+
+        arrays = [state["frame"][column].to_numpy() for column in state["frame"]]
+        arrays += [state["frame"].index.to_numpy(), state["series"].masses, state["series"].temperature]
+        assert not any(is_memory_mapped(array) for array in arrays)
+        assert not state["series"].masses.flags.writeable
+        del mapped
+        save_project(path, state)
+        pd.testing.assert_frame_equal(load_project(path, lazy=False)["frame"], experimental_df)
+
+    def test_experimental_series_round_trip(self, tmp_path, experimental_df):
+        """Should rebuild read-only ExperimentalSeries arrays."""
+        path = str(tmp_path / "session.otk")
+        series = ExperimentalSeries.from_dataframe(experimental_df)
+
+        save_project(path, {"series": series})
+        restored = load_project(path)["series"]
+
+        assert restored.rate_columns == series.rate_columns
+        np.testing.assert_array_equal(restored.masses, series.masses)
+        assert not restored.masses.flags.writeable
+
+    def test_custom_step_not_serializable(self, tmp_path):
+        """Should refuse steps wrapping arbitrary callables and keep no partial file."""
+        path = tmp_path / "session.otk"
+        with pytest.raises(TypeError):
+            save_project(str(path), {"steps": [TransformationStep("custom", function=np.abs)]})
+        assert not path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_newer_version_rejected(self, tmp_path, monkeypatch):
+        """Should refuse project files written by a newer format version."""
+        path = str(tmp_path / "session.otk")
+        monkeypatch.setattr("src.core.project_file.PROJECT_FORMAT_VERSION", 99)
+        save_project(path, {})
+        monkeypatch.setattr("src.core.project_file.PROJECT_FORMAT_VERSION", 1)
+        with pytest.raises(ValueError):
+            load_project(path)
+
+
+class TestActorState:
+    """Tests for exporting and importing actor state through a project file."""
+
+    def test_series_data_round_trip(self, tmp_path, mock_signals, experimental_df):
+        """Should restore series and rebuild experimental_data from stored arrays."""
+        path = str(tmp_path / "session.otk")
+        source = SeriesData(signals=mock_signals)
+        source.add_series(experimental_df, [3.0, 5.0], name="Series A")
+
+        save_project(path, {"series_data": source.export_state()})
+        target = SeriesData(signals=mock_signals)
+        target.import_state(load_project(path)["series_data"])
+
+        entry = target.series["Series A"]
+        pd.testing.assert_frame_equal(entry["experimental_data"], source.series["Series A"]["experimental_data"])
+        assert entry["experimental_masses"] == [3.0, 5.0]
+        assert target.default_name_counter == source.default_name_counter
@@ -0,0 +1,98 @@
+"""Tests for reaction_file module - packed reaction parameter import/export."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.reaction_file import (
+    REACTIONS_FORMAT,
+    decode_array,
+    encode_array,
+    pack_reactions,
+    read_reactions_file,
+    write_reactions_file,
+)
+
+RESOURCES_DIR = Path(__file__).resolve().parents[2] / "resources"
+
+
+@pytest.fixture
+def reactions():
+    """Two reactions sharing one temperature axis."""
+    x = np.round(np.linspace(32.18783, 499.1, 489) + 1e-6 * np.sin(np.arange(489)), 5)
+    return {
+        "reaction_0": {"function": "gauss", "x": x, "coeffs": {"h": 0.1, "z": 300.0, "w": 20.0}},
+        "reaction_1": {"function": "ads", "x": x.copy(), "coeffs": {"h": np.float64(0.2), "z": 350.0, "w": 25.0}},
+    }
+
+
+class TestArrayEncoding:
+    """Tests for encode_array / decode_array."""
+
+    def test_uniform_grid_stored_as_range(self):
+        """Should store exact linspace grids as start/stop/num."""
+        x = np.linspace(300.0, 800.0, 501)
+        encoded = encode_array(x)
+
+        assert "range" in encoded
+        np.testing.assert_array_equal(decode_array(encoded), x)
+
+    def test_irregular_array_round_trip(self):
+        """Should reproduce arbitrary arrays bit for bit."""
+        x = np.array([1.0, 2.5, 2.75, 10.0])
+        encoded = encode_array(x)
+
+        assert "data" in encoded
+        np.testing.assert_array_equal(decode_array(encoded), x)
+
+
+class TestReactionsFile:
+    """Tests for packed reactions file read/write."""
+
+    def test_shared_arrays_written_once(self, reactions):
+        """Should deduplicate identical x arrays across reactions."""
+        packed = pack_reactions(reactions)
+
+        assert packed["format"] == REACTIONS_FORMAT
+        assert len(packed["arrays"]) == 1
+        assert packed["reactions"]["reaction_0"]["x"] == packed["reactions"]["reaction_1"]["x"]
+
+    def test_round_trip(self, tmp_path, reactions):
+        """Should restore coefficients and arrays from a packed file."""
+        path = tmp_path / "reactions.json"
+        write_reactions_file(str(path), reactions)
+        restored = read_reactions_file(str(path))
+
+        np.testing.assert_array_equal(restored["reaction_1"]["x"], reactions["reaction_1"]["x"])
+        assert restored["reaction_1"]["coeffs"] == {"h": 0.2, "z": 350.0, "w": 25.0}
+        assert restored["reaction_0"]["x"] is restored["reaction_1"]["x"]
+
+    def test_packed_file_is_smaller_than_legacy(self, tmp_path):
+        """Should shrink a bundled legacy export and keep its values."""
+        legacy_path = RESOURCES_DIR / "NH4_rate_3_4_rcts_gs_fr_ads_ads.json"
+        data = read_reactions_file(str(legacy_path))
+        packed_path = tmp_path / "packed.json"
+        write_reactions_file(str(packed_path), data, indent=4)
+
+        assert packed_path.stat().st_size < legacy_path.stat().st_size / 3
+        with open(legacy_path, encoding="utf-8") as f:
+            legacy = json.load(f)
+        restored = read_reactions_file(str(packed_path))
+        assert restored["reaction_2"]["x"].tolist() == legacy["reaction_2"]["x"]
+        assert restored["reaction_2"]["coeffs"] == legacy["reaction_2"]["coeffs"]
+
+    def test_legacy_file_shares_equal_arrays(self):
+        """Should convert legacy x lists to numpy and reuse equal arrays."""
+        data = read_reactions_file(str(RESOURCES_DIR / "NH4_rate_3_4_rcts_gs_fr_ads_ads.json"))
+
+        assert isinstance(data["reaction_1"]["x"], np.ndarray)
+        assert data["reaction_1"]["x"] is data["reaction_4"]["x"]
+
+    def test_newer_version_rejected(self, tmp_path):
+        """Should refuse files written by a newer format version."""
+        path = tmp_path / "reactions.json"
+        path.write_text(json.dumps({"format": REACTIONS_FORMAT, "version": 99, "arrays": [], "reactions": {}}))
+        with pytest.raises(ValueError):
+            read_reactions_file(str(path))
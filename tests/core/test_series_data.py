@@ -5,7 +5,13 @@ import pandas as pd
 import pytest
 
 from src.core.app_settings import OperationType
-from src.core.series_data import SeriesData
+from src.core.series_data import (
+    ExperimentalSeries,
+    SeriesData,
+    build_reaction_dataframe,
+    build_series_dataframe,
+    deconvolution_reactions,
+)
 
 
 class TestSeriesDataAddSeries:
@@ -432,3 +438,107 @@ class TestSeriesDataProcessRequest:
         """Should return all data for unknown info_type."""
         result = series_data.get_series("Test", info_type="unknown_type")
         assert "experimental_data" in result  # Returns all by default
+
+
+class TestBuildSeriesDataframe:
+    """Tests for resampling heating-rate curves onto a common temperature grid."""
+
+    def test_auto_grid_uses_overlap(self):
+        """Should build an evenly spaced grid over the shared temperature range."""
+        curves = {
+            "3": pd.DataFrame({"temperature": np.linspace(300, 700, 401), "mass": np.linspace(0, 1, 401)}),
+            "5": pd.DataFrame({"temperature": np.linspace(310, 720, 201), "mass": np.linspace(0, 1, 201)}),
+        }
+
+        result = build_series_dataframe(curves)
+
+        assert list(result.columns) == ["temperature", "3", "5"]
+        assert len(result) == 401
+        assert result["temperature"].iloc[0] == 310 and result["temperature"].iloc[-1] == 700
+        np.testing.assert_allclose(np.diff(result["temperature"]), np.diff(result["temperature"])[0])
+        assert not result.isna().any().any()
+
+    def test_interpolates_unsorted_input(self):
+        """Should sort each curve and interpolate linearly onto the given grid."""
+        curves = {"10": pd.DataFrame({"temperature": [400.0, 300.0, 500.0], "alpha": [0.5, 0.0, 1.0]})}
+
+        result = build_series_dataframe(curves, temperature_grid=np.array([350.0, 450.0]))
+
+        np.testing.assert_allclose(result["10"], [0.25, 0.75])
+
+    def test_empty_curve_names_heating_rate(self):
+        """Should reject a curve without finite rows with a ValueError naming its heating rate."""
+        curves = {
+            "3": pd.DataFrame({"temperature": [300.0, 400.0], "mass": [1.0, 0.5]}),
+            "5": pd.DataFrame({"temperature": [300.0, 400.0], "mass": ["n/a", "n/a"]}),
+        }
+
+        with pytest.raises(ValueError, match="Heating rate '5'"):
+            build_series_dataframe(curves)
+
+
+class TestDeconvolutionReactions:
+    """Tests for collecting deconvolved reactions of a series."""
+
+    @pytest.fixture
+    def experimental_df(self):
+        temperature = np.linspace(300, 600, 20)
+        return pd.DataFrame({"temperature": temperature, "3": np.linspace(1, 0, 20), "5": np.linspace(1, 0, 20)})
+
+    @staticmethod
+    def gauss_reaction(z):
+        return {"function": "gauss", "coeffs": {"h": 1.0, "z": z, "w": 20.0}}
+
+    def test_common_and_missing_reactions(self, experimental_df):
+        """Should sort common reactions numerically and report the ones missing for some rates."""
+        results = {
+            "3": {f"reaction_{i}": self.gauss_reaction(400) for i in (0, 2, 10)},
+            "5.0": {f"reaction_{i}": self.gauss_reaction(400) for i in (0, 10)},
+            "7": {"reaction_0": self.gauss_reaction(400)},
+        }
+
+        common, missing = deconvolution_reactions(experimental_df, results)
+
+        assert common == ["reaction_0", "reaction_10"]
+        assert missing == {"reaction_2"}
+
+    def test_build_reaction_dataframe(self, experimental_df):
+        """Should evaluate the reaction of every rate on a grid spanning the series temperatures."""
+        results = {"3": {"reaction_0": self.gauss_reaction(400)}, "5": {"reaction_0": self.gauss_reaction(450)}}
+
+        df = build_reaction_dataframe(experimental_df, results)
+
+        assert set(df.columns) == {"temperature", "3", "5"}
+        assert df["temperature"].iloc[0] == 300 and df["temperature"].iloc[-1] == 600
+        assert df["temperature"].iloc[df["3"].idxmax()] == pytest.approx(400, abs=2)
+        assert df["temperature"].iloc[df["5"].idxmax()] == pytest.approx(450, abs=2)
+
+
+class TestExperimentalSeries:
+    """Tests for the array-backed experimental data of a series."""
+
+    @pytest.fixture
+    def multi_rate_df(self):
+        temperature = np.linspace(300, 600, 20)
+        return pd.DataFrame({"temperature": temperature, "3": np.linspace(1, 0, 20), "10.0": np.linspace(1, 0.1, 20)})
+
+    def test_from_dataframe(self, multi_rate_df):
+        """Should extract temperature, betas and a row-per-rate contiguous mass matrix."""
+        arrays = ExperimentalSeries.from_dataframe(multi_rate_df)
+
+        np.testing.assert_allclose(arrays.betas, [3.0, 10.0])
+        assert arrays.masses.shape == (2, 20)
+        assert arrays.masses.flags.c_contiguous
+        assert not arrays.masses.flags.writeable
+        np.testing.assert_allclose(arrays.temperature_kelvin, multi_rate_df["temperature"] + 273.15)
+
+    def test_add_series_stores_zero_copy_views(self, mock_signals, multi_rate_df):
+        """Should store arrays once and expose the DataFrame as a view of them."""
+        series_data = SeriesData(signals=mock_signals)
+        series_data.add_series(data=multi_rate_df, experimental_masses=[1, 1], name="s")
+
+        arrays = series_data.get_series("s", info_type="arrays")
+        frame = series_data.get_series("s", info_type="experimental")
+
+        assert np.shares_memory(frame["10.0"].to_numpy(), arrays.masses)
+        assert all(np.shares_memory(row, arrays.masses) for row in arrays.mass_rows())
@@ -0,0 +1,88 @@
+"""Tests for simulation_cache module - LRU cache of model-based simulation results."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.series_data import ExperimentalSeries
+from src.core.simulation_cache import SimulationCache, simulation_key
+
+
+@pytest.fixture
+def series():
+    """Two heating rates on a shared temperature grid."""
+    temperature = np.linspace(150.0, 500.0, 40)
+    return ExperimentalSeries.from_dataframe(
+        pd.DataFrame({"temperature": temperature, "5": np.linspace(1.0, 0.3, 40), "10": np.linspace(1.0, 0.2, 40)})
+    )
+
+
+@pytest.fixture
+def scheme():
+    """Single-step A -> B scheme with optimizer ranges."""
+    return {
+        "components": [{"id": "A"}, {"id": "B"}],
+        "reactions": [
+            {"from": "A", "to": "B", "allowed_models": ["F1"], "Ea": 120, "log_A": 8, "contribution": 1, "Ea_min": 1}
+        ],
+    }
+
+
+def frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"temperature": np.arange(rows, dtype=float), "5.0": np.zeros(rows)})
+
+
+class TestSimulationKey:
+    """Tests for simulation_key."""
+
+    def test_key_follows_kinetic_parameters(self, series, scheme):
+        """Should change with Ea and ignore optimizer ranges."""
+        key = simulation_key(scheme, series)
+
+        scheme["reactions"][0]["Ea_min"] = 50
+        assert simulation_key(scheme, series) == key
+
+        scheme["reactions"][0]["Ea"] = 121
+        assert simulation_key(scheme, series) != key
+
+    def test_key_follows_experimental_data(self, series, scheme):
+        """Should change when the experimental masses differ."""
+        other = ExperimentalSeries(series.temperature, series.betas, series.masses * 0.5, series.rate_columns)
+
+        assert simulation_key(scheme, series) != simulation_key(scheme, other)
+
+
+class TestSimulationCache:
+    """Tests for SimulationCache lookups and eviction."""
+
+    def test_round_trip_returns_copy(self):
+        """Should return stored values without aliasing the cached frame."""
+        cache = SimulationCache()
+        cache.put("a", frame(10), 0.5)
+
+        simulation_df, total_mse = cache.get("a")
+        simulation_df["5.0"] = 1.0
+
+        assert total_mse == 0.5
+        assert (cache.get("a")[0]["5.0"] == 0.0).all()
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used_beyond_budget(self):
+        """Should drop the least recently used entry once the byte budget is exceeded."""
+        entry_size = int(frame(100).memory_usage(index=True).sum())
+        cache = SimulationCache(max_bytes=2 * entry_size)
+        cache.put("a", frame(100), 0.1)
+        cache.put("b", frame(100), 0.2)
+        cache.get("a")
+        cache.put("c", frame(100), 0.3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_oversized_result_not_cached(self):
+        """Should skip results larger than the whole budget."""
+        cache = SimulationCache(max_bytes=100)
+        cache.put("a", frame(1000), 0.1)
+
+        assert len(cache) == 0
@@ -0,0 +1,85 @@
+"""Tests for ModelBasedTab background and cached simulation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.series_data import ExperimentalSeries
+from src.gui.main_tab.sub_sidebar.model_based import ModelBasedTab
+
+
+@pytest.fixture
+def experimental_data():
+    """Two heating rates on a shared temperature grid."""
+    temperature = np.linspace(150.0, 500.0, 80)
+    mass = np.linspace(1.0, 0.3, 80)
+    return pd.DataFrame({"temperature": temperature, "5": mass, "10": mass})
+
+
+@pytest.fixture
+def reaction_scheme():
+    """Single-step A -> B scheme."""
+    return {
+        "components": [{"id": "A"}, {"id": "B"}],
+        "reactions": [{"from": "A", "to": "B", "allowed_models": ["F1"], "Ea": 120, "log_A": 8, "contribution": 1}],
+    }
+
+
+class TestModelBasedSimulation:
+    """Tests for synchronous and background model simulation."""
+
+    def test_simulate_returns_curve_per_rate(self, qtbot, experimental_data, reaction_scheme):
+        """_simulate_reaction_model should return temperature and one column per heating rate."""
+        tab = ModelBasedTab()
+        qtbot.addWidget(tab)
+
+        simulation_df = tab._simulate_reaction_model(experimental_data, reaction_scheme)
+
+        assert list(simulation_df.columns) == ["temperature", "5.0", "10.0"]
+        assert len(simulation_df) == len(experimental_data)
+
+    def test_request_emits_latest_result_only(self, qtbot, experimental_data, reaction_scheme):
+        """request_simulation should deliver only the result of the newest request."""
+        tab = ModelBasedTab()
+        qtbot.addWidget(tab)
+        series = ExperimentalSeries.from_dataframe(experimental_data)
+        stale_scheme = {**reaction_scheme, "reactions": [{**reaction_scheme["reactions"][0], "Ea": 60}]}
+        expected = tab._simulate_reaction_model(series, reaction_scheme)
+        tab.simulation_cache.clear()
+        results = []
+        tab.simulation_ready.connect(results.append)
+
+        tab.request_simulation(series, stale_scheme)
+        tab.request_simulation(series, reaction_scheme)
+        qtbot.waitUntil(lambda: not tab.simulation_preview.is_busy(), timeout=10000)
+
+        assert len(results) == 1
+        pd.testing.assert_frame_equal(results[0], expected)
+
+    def test_request_does_not_alias_scheme(self, qtbot, experimental_data, reaction_scheme):
+        """Editing the scheme after a request should not change the running simulation."""
+        tab = ModelBasedTab()
+        qtbot.addWidget(tab)
+        expected = tab._simulate_reaction_model(experimental_data, reaction_scheme)
+        tab.simulation_cache.clear()
+        results = []
+        tab.simulation_ready.connect(results.append)
+
+        tab.request_simulation(experimental_data, reaction_scheme)
+        reaction_scheme["reactions"][0]["Ea"] = 10
+        qtbot.waitUntil(lambda: not tab.simulation_preview.is_busy(), timeout=10000)
+
+        pd.testing.assert_frame_equal(results[0], expected)
+
+    def test_cached_request_emits_immediately(self, qtbot, experimental_data, reaction_scheme):
+        """A revisited parameter set should be emitted from the cache without a worker thread."""
+        tab = ModelBasedTab()
+        qtbot.addWidget(tab)
+        expected = tab._simulate_reaction_model(experimental_data, reaction_scheme)
+        results = []
+        tab.simulation_ready.connect(results.append)
+
+        tab.request_simulation(experimental_data, reaction_scheme)
+
+        assert not tab.simulation_preview.is_busy()
+        pd.testing.assert_frame_equal(results[0], expected)
@@ -166,6 +166,34 @@ class TestModelFreeSubBarCalculate:
         assert blocker.args[0]["alpha_min"] == 0.1
         assert blocker.args[0]["alpha_max"] == 0.9
 
+    def test_calculate_with_bootstrap_checked(self, qtbot):
+        """Checked bootstrap box should request confidence bands."""
+        bar = ModelFreeSubBar()
+        qtbot.add_widget(bar)
+
+        bar.method_combobox.setCurrentText("Friedman")
+        bar.bootstrap_checkbox.setChecked(True)
+
+        with qtbot.wait_signal(bar.model_free_calculation_signal) as blocker:
+            bar.calculate_button.click()
+
+        assert blocker.args[0]["bootstrap"] == {}
+
+    def test_calculate_kissinger_includes_max_peaks(self, qtbot):
+        """Kissinger should show the max peaks input and pass its value."""
+        bar = ModelFreeSubBar()
+        qtbot.add_widget(bar)
+        bar.show()
+
+        bar.method_combobox.setCurrentText("Kissinger")
+        bar.max_peaks_input.setValue(2)
+
+        with qtbot.wait_signal(bar.model_free_calculation_signal) as blocker:
+            bar.calculate_button.click()
+
+        assert bar.max_peaks_input.isVisible()
+        assert blocker.args[0]["max_peaks"] == 2
+
     def test_calculate_invalid_alpha_shows_warning(self, qtbot):
         """Invalid alpha values should show warning."""
         bar = ModelFreeSubBar()
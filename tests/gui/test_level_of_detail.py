@@ -0,0 +1,52 @@
+"""Tests for level_of_detail module - per-pixel min/max curve reduction."""
+
+import numpy as np
+
+from src.gui.main_tab.plot_canvas.level_of_detail import is_decimatable, minmax_decimate
+
+
+class TestMinMaxDecimate:
+    """Tests for minmax_decimate."""
+
+    def test_keeps_extremes_of_every_column(self):
+        """Should keep at most two samples per column and preserve the global envelope."""
+        x = np.linspace(0.0, 1.0, 100_000)
+        y = np.sin(40 * x) + np.random.default_rng(0).normal(0, 0.1, x.size)
+
+        x_lod, y_lod = minmax_decimate(x, y, 0.0, 1.0, 500)
+
+        assert x_lod.size <= 2 * 500 + 2
+        assert y_lod.max() == y.max()
+        assert y_lod.min() == y.min()
+        assert np.all(np.diff(x_lod) > 0)
+
+    def test_zoomed_view_keeps_neighbours(self):
+        """Should restrict to the view plus one sample on each side."""
+        x = np.arange(10_000, dtype=float)
+        y = np.cos(x)
+
+        x_lod, _ = minmax_decimate(x, y, 100.0, 200.0, 1000)
+
+        np.testing.assert_array_equal(x_lod, x[99:202])
+
+    def test_nan_columns_dropped(self):
+        """Should skip columns containing only NaN values."""
+        x = np.arange(4000, dtype=float)
+        y = np.ones_like(x)
+        y[1000:2000] = np.nan
+
+        x_lod, y_lod = minmax_decimate(x, y, 0.0, 3999.0, 100)
+
+        assert not np.isnan(y_lod[1:-1]).any()
+        assert not ((x_lod > 1010) & (x_lod < 1990)).any()
+
+
+class TestIsDecimatable:
+    """Tests for is_decimatable."""
+
+    def test_requires_sorted_numeric_x(self):
+        """Should reject unsorted or non-numeric x values."""
+        y = np.zeros(3)
+        assert is_decimatable(np.array([1.0, 2.0, 2.0]), y)
+        assert not is_decimatable(np.array([1.0, 3.0, 2.0]), y)
+        assert not is_decimatable(np.array(["a", "b", "c"]), y)
@@ -5,6 +5,8 @@ Tests main window creation, tab management, and signal routing.
 
 from PyQt6.QtWidgets import QTabWidget
 
+from src.core.app_settings import OperationType
+from src.core.base_signals import RequestFuture
 from src.gui.main_window import MainWindow
 
 
@@ -90,3 +92,53 @@ class TestMainWindowOperationHandlers:
 
         result = window._handle_plot_df({})
         assert result is False
+
+    def test_model_free_error_is_shown(self, gui_signals, qtbot, mocker):
+        """A failed model-free calculation should log its error instead of the beta columns hint."""
+        window = MainWindow(gui_signals)
+        qtbot.addWidget(window)
+        log = mocker.patch("src.gui.main_window.console.log")
+        update = mocker.patch.object(window, "handle_request_cycle")
+        future = RequestFuture("request", "model_free_calculation", "MODEL_FREE_CALCULATION", gui_signals)
+        future.set_result({"error": "matrix is singular"})
+
+        window._on_model_free_calculation_done(future, "series", "Friedman")
+
+        log.assert_called_once()
+        assert "matrix is singular" in log.call_args[0][0]
+        update.assert_not_called()
+
+    def test_open_project_replaces_sidebar_entries(self, gui_signals, qtbot, mocker):
+        """Opening a project should drop files and series of the previous session from the sidebar."""
+        window = MainWindow(gui_signals)
+        qtbot.addWidget(window)
+        sidebar = window.main_tab.sidebar
+        sidebar.add_experiment_file(("old.csv",))
+        sidebar.add_series("Old series")
+        state = {"file_data": {"original_data": {"new.csv": None}}, "series_data": {"series": {"New series": None}}}
+        mocker.patch("src.gui.main_window.load_project", return_value=state)
+        mocker.patch.object(window, "handle_request_cycle")
+
+        assert window.open_project("session.otk")
+
+        assert "old.csv" not in sidebar.get_experiment_files_names()
+        assert "new.csv" in sidebar.get_experiment_files_names()
+        assert sidebar.get_series_names() == ["New series"]
+        assert window.mapped_project_path == "session.otk"
+
+    def test_save_over_opened_project_loads_arrays_into_memory(self, gui_signals, qtbot, mocker, tmp_path):
+        """Saving over the project the session was opened from should first re-import in-memory state."""
+        window = MainWindow(gui_signals)
+        qtbot.addWidget(window)
+        path = tmp_path / "session.otk"
+        path.write_bytes(b"")
+        window.mapped_project_path = str(path)
+        request = mocker.patch.object(window, "handle_request_cycle", return_value={})
+        save = mocker.patch("src.gui.main_window.save_project")
+
+        assert window.save_project(str(path))
+
+        imports = [call for call in request.call_args_list if call.args[1] == OperationType.IMPORT_STATE]
+        assert len(imports) == len(window.PROJECT_ACTORS)
+        save.assert_called_once()
+        assert window.mapped_project_path is None
@@ -3,14 +3,23 @@
 Tests matplotlib canvas, line management, and data plotting.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from io import StringIO
 
 import numpy as np
 import pandas as pd
 
+from src.core.optimization_progress import MseHistory
 from src.gui.main_tab.plot_canvas.plot_canvas import PlotCanvas
 
 
+def saved_svg(canvas: PlotCanvas) -> str:
+    """Save the figure as the toolbar does and return the SVG markup."""
+    buffer = StringIO()
+    canvas.figure.savefig(buffer, format="svg")
+    return buffer.getvalue()
+
+
 class TestPlotCanvasCreation:
     """Tests for PlotCanvas initialization."""
 
@@ -172,6 +181,74 @@ class TestPlotCanvasMSEHistory:
 
         assert canvas.is_mse_mode() is False
 
+    def test_new_points_inside_view_are_blitted(self, qtbot):
+        """plot_mse_history should keep the axes and only blit points that fit the view."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        start = datetime(2024, 1, 1, 12)
+        history = MseHistory(capacity=16)
+        for i in range(3):
+            history.append((start + timedelta(seconds=10 * i), 1.0 / (i + 1)))
+        canvas.plot_mse_history(history)
+        canvas.render_frame()
+        line = canvas.lines["mse_line"]
+
+        history.append((start + timedelta(seconds=15), 0.4))
+        canvas.plot_mse_history(history)
+
+        assert canvas.lines["mse_line"] is line
+        assert len(line.get_xdata()) == 4
+        assert canvas._full_draw_pending is False
+
+    def test_points_outside_view_rescale(self, qtbot):
+        """plot_mse_history should request a full redraw when data leaves the view."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        start = datetime(2024, 1, 1, 12)
+        history = MseHistory(capacity=16)
+        history.append((start, 1.0))
+        history.append((start + timedelta(seconds=10), 0.5))
+        canvas.plot_mse_history(history)
+        canvas.render_frame()
+
+        history.append((start + timedelta(hours=1), 0.1))
+        canvas.plot_mse_history(history)
+
+        assert canvas._full_draw_pending is True
+
+    def test_population_lines_plotted(self, qtbot):
+        """plot_mse_history should draw generation best and mean lines from population data."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        start = datetime(2024, 1, 1, 12)
+        population = MseHistory(capacity=16)
+        population.append((start, 0.8, 1.5))
+        population.append((start + timedelta(seconds=5), 0.6, 1.0))
+
+        canvas.plot_mse_history([(start, 0.8), (start + timedelta(seconds=5), 0.6)], population)
+
+        assert {"mse_line", "generation_best", "generation_mean"} <= set(canvas.lines)
+        np.testing.assert_allclose(canvas.lines["generation_mean"].get_ydata(), [1.5, 1.0])
+
+    def test_saved_figure_includes_convergence_lines(self, qtbot):
+        """Exporting the convergence plot should contain the animated MSE and population lines."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        start = datetime(2024, 1, 1, 12)
+        population = MseHistory(capacity=16)
+        population.append((start, 0.8, 1.5))
+        population.append((start + timedelta(seconds=5), 0.6, 1.0))
+        canvas.plot_mse_history([(start, 0.8), (start + timedelta(seconds=5), 0.6)], population)
+        canvas.render_frame()
+        for key, line in canvas.lines.items():
+            line.set_gid(key)
+
+        svg = saved_svg(canvas)
+
+        for key in ("mse_line", "generation_best", "generation_mean"):
+            assert f'id="{key}"' in svg
+            assert canvas.lines[key].get_animated()
+
 
 class TestPlotCanvasEventConnections:
     """Tests for event connection management."""
@@ -214,6 +291,7 @@ class TestPlotCanvasReaction:
         values = (np.array([100, 200, 300]), np.array([0.1, 0.5, 0.3]))
 
         canvas.plot_reaction(keys, values)
+        canvas.render_frame()
 
         assert "reaction_1" in canvas.lines
 
@@ -231,6 +309,7 @@ class TestPlotCanvasReaction:
         # Second call with different data
         values2 = (np.array([100, 200, 300]), np.array([0.2, 0.6, 0.4]))
         canvas.plot_reaction(keys, values2)
+        canvas.render_frame()
 
         line = canvas.lines["reaction_1"]
         assert np.array_equal(line.get_ydata(), np.array([0.2, 0.6, 0.4]))
@@ -254,3 +333,158 @@ class TestPlotCanvasAnchors:
 
         assert canvas.position_anchor_group is not None
         assert canvas.height_anchor_group is not None
+
+
+class TestPlotCanvasRendering:
+    """Tests for frame-batched rendering and blitting."""
+
+    def test_line_updates_coalesced_into_one_draw(self, qtbot, monkeypatch):
+        """Several line updates in one frame should cause a single full draw and no layout."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        canvas.render_frame()
+
+        draws, layouts = [], []
+        monkeypatch.setattr(canvas.canvas, "draw", lambda: draws.append(1))
+        monkeypatch.setattr(canvas.figure, "tight_layout", lambda: layouts.append(1))
+
+        x = np.array([1.0, 2.0, 3.0])
+        for i in range(5):
+            canvas.add_or_update_line(f"line{i}", x, x * i)
+        qtbot.waitUntil(lambda: len(draws) == 1)
+
+        assert layouts == []
+
+    def test_clear_axes_schedules_layout(self, qtbot, monkeypatch):
+        """Replotting a dataframe should recompute the layout once."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        canvas.render_frame()
+
+        layouts = []
+        monkeypatch.setattr(canvas.figure, "tight_layout", lambda: layouts.append(1))
+
+        canvas.plot_data_from_dataframe(pd.DataFrame({"temperature": [100, 200], "a": [0.1, 0.2], "b": [0.3, 0.4]}))
+        canvas.render_frame()
+
+        assert layouts == [1]
+
+    def test_reaction_update_is_blitted(self, qtbot, monkeypatch):
+        """Updating a reaction curve inside the view should blit instead of redrawing."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        keys = ("test_file.csv", "reaction_1")
+        canvas.plot_reaction(keys, (np.array([100, 200, 300]), np.array([0.1, 0.5, 0.3])))
+        canvas.render_frame()
+
+        assert canvas.lines["reaction_1"].get_animated()
+        assert canvas.background is not None
+
+        draws, blits = [], []
+        monkeypatch.setattr(canvas.canvas, "draw", lambda: draws.append(1))
+        monkeypatch.setattr(canvas.canvas, "blit", lambda bbox=None: blits.append(bbox))
+
+        canvas.plot_reaction(keys, (np.array([100, 200, 300]), np.array([0.2, 0.4, 0.3])))
+        canvas.render_frame()
+
+        assert draws == []
+        assert len(blits) == 1
+
+    def test_saved_figure_includes_reaction_curves(self, qtbot):
+        """Saving should draw animated reaction curves without recapturing the on-screen background."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        canvas.plot_reaction(("test_file.csv", "reaction_1"), (np.array([100, 200, 300]), np.array([0.1, 0.5, 0.3])))
+        canvas.render_frame()
+        line = canvas.lines["reaction_1"]
+        line.set_gid("reaction_1")
+        background = canvas.background
+
+        assert 'id="reaction_1"' in saved_svg(canvas)
+        assert canvas.background is background
+        assert line.get_animated()
+        assert not canvas.canvas.printing
+
+    def test_bound_fill_replaced_not_accumulated(self, qtbot):
+        """Replotting bounds should keep a single animated fill."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        x = np.array([100, 200, 300])
+
+        for scale in (1.0, 0.8):
+            canvas.plot_reaction(("f", "upper_bound_coeffs"), (x, scale * np.array([0.2, 0.6, 0.4])))
+            canvas.plot_reaction(("f", "lower_bound_coeffs"), (x, scale * np.array([0.1, 0.4, 0.2])))
+            canvas.render_frame()
+
+        fills = [artist for artist in canvas.axes.collections if artist.get_animated()]
+        assert fills == [canvas.fills["direct"]]
+
+
+class TestPlotCanvasLevelOfDetail:
+    """Tests for view-dependent reduction of large curves."""
+
+    def test_large_dataframe_curves_reduced(self, qtbot):
+        """Large columns should be drawn reduced while full data stays available."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        temperature = np.linspace(300.0, 900.0, 200_000)
+        canvas.plot_data_from_dataframe(pd.DataFrame({"temperature": temperature, "dtg": np.sin(temperature)}))
+
+        assert len(canvas.lines["dtg"].get_xdata()) < 5000
+        x, y = canvas.line_data("dtg")
+        assert len(x) == 200_000
+
+    def test_zoom_restores_detail(self, qtbot):
+        """Zooming into a narrow range should show every sample in the view."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        temperature = np.linspace(300.0, 900.0, 200_000)
+        canvas.plot_data_from_dataframe(pd.DataFrame({"temperature": temperature, "dtg": np.sin(temperature)}))
+
+        canvas.axes.set_xlim(500.0, 500.3)
+
+        visible = (temperature >= 500.0) & (temperature <= 500.3)
+        assert len(canvas.lines["dtg"].get_xdata()) == visible.sum() + 2
+
+
+class TestPlotCanvasFrameScheduling:
+    """Tests for coalescing plot_reaction emissions into frames."""
+
+    def test_latest_reaction_data_wins(self, qtbot):
+        """Several emissions for one curve within a frame should plot only the last data."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        x = np.array([100, 200, 300])
+
+        for scale in (1.0, 2.0, 3.0):
+            canvas.plot_reaction(("f", "reaction_0_coeffs"), (x, scale * np.array([0.1, 0.5, 0.3])))
+        assert "reaction_0_coeffs" not in canvas.lines
+
+        qtbot.waitUntil(lambda: "reaction_0_coeffs" in canvas.lines)
+        np.testing.assert_allclose(canvas.lines["reaction_0_coeffs"].get_ydata(), [0.3, 1.5, 0.9])
+
+    def test_fill_recomputed_once_per_frame(self, qtbot, monkeypatch):
+        """Bound fills should be rebuilt once after all curves of the frame were applied."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+        calls = []
+        monkeypatch.setattr(canvas, "_replace_fill", lambda *args: calls.append(args[0]))
+        x = np.array([100, 200, 300])
+
+        canvas.plot_reaction(("f", "upper_bound_coeffs"), (x, np.array([0.2, 0.6, 0.4])))
+        canvas.plot_reaction(("f", "lower_bound_coeffs"), (x, np.array([0.1, 0.4, 0.2])))
+        canvas.plot_reaction(("f", "upper_bound_coeffs"), (x, np.array([0.3, 0.7, 0.5])))
+        canvas.render_frame()
+
+        assert calls == ["direct"]
+
+    def test_clear_drops_pending_curves(self, qtbot):
+        """Curves queued before the axes are cleared should not be plotted afterwards."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+
+        canvas.plot_reaction(("f", "reaction_0_coeffs"), (np.array([1, 2]), np.array([0.1, 0.2])))
+        canvas.plot_data_from_dataframe(pd.DataFrame({"temperature": [100, 200], "signal": [0.3, 0.4]}))
+        canvas.render_frame()
+
+        assert "reaction_0_coeffs" not in canvas.lines
@@ -5,7 +5,9 @@ Tests line property determination, fill between, and annotation functionality.
 
 import numpy as np
 import pandas as pd
+import pytest
 
+from src.gui.main_tab.plot_canvas.config import PLOT_CANVAS_CONFIG
 from src.gui.main_tab.plot_canvas.plot_canvas import PlotCanvas
 
 
@@ -201,6 +203,27 @@ class TestModelFreeAnnotation:
         assert "logA" in canvas.lines
         assert "conversion" not in canvas.lines  # x-axis, not plotted
 
+    def test_plot_model_free_result_bootstrap_band(self, qtbot):
+        """Bootstrap percentile columns should be shaded as a band, not drawn as lines."""
+        canvas = PlotCanvas()
+        qtbot.addWidget(canvas)
+
+        plot_df = pd.DataFrame(
+            {
+                "conversion": [0.1, 0.2, 0.3],
+                "Friedman": [150, 155, 160],
+                "Friedman_lower": [140, 146, 150],
+                "Friedman_upper": [160, 164, 170],
+            }
+        )
+
+        canvas.plot_model_free_result([{"plot_df": plot_df, "plot_kwargs": {}}])
+
+        assert list(canvas.lines) == ["Friedman"]
+        band = canvas.fills["Friedman"]
+        assert band in canvas.axes.collections
+        assert band.get_alpha() == pytest.approx(PLOT_CANVAS_CONFIG.FILL_ALPHA)
+
 
 class TestNormalizeData:
     """Tests for data normalization."""